@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Asset Bundler for the Generated Pages
+Concatenates and minifies the stylesheets and scripts used by the page
+template of convert_markdown.py into one CSS and one JS bundle with
+content-hashed file names, and records them in an asset manifest. Bundles
+whose sources did not change are reused; the hashed files can be served with
+far-future cache headers.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import convert_markdown
+from convert_markdown import ASSET_MANIFEST, CSS_BUNDLE, DOC_CONTENT_CSS, JS_BUNDLE
+
+# Bump whenever minification changes, so existing bundles are rebuilt
+ASSET_BUNDLER_VERSION = 1
+
+# Bundle sources in page order, relative to the root directory. Bundles live
+# next to their sources so relative url() references keep working.
+BUNDLE_SOURCES = {
+    CSS_BUNDLE: [
+        'css/animate.css',
+        'css/icomoon.css',
+        'css/themify-icons.css',
+        'css/bootstrap.css',
+        'css/magnific-popup.css',
+        'css/owl.carousel.min.css',
+        'css/owl.theme.default.min.css',
+        'css/style.css',
+        'css/dynamic-sidebar.css',
+    ],
+    JS_BUNDLE: [
+        'js/jquery.min.js',
+        'js/jquery.easing.1.3.js',
+        'js/bootstrap.min.js',
+        'js/jquery.waypoints.min.js',
+        'js/owl.carousel.min.js',
+        'js/jquery.magnific-popup.min.js',
+        'js/magnific-popup-options.js',
+        'js/main.js',
+        'js/dynamic-sidebar.js',
+        'js/paginated-tables.js',
+    ],
+}
+
+# Strings and url() values are copied unchanged, comments are dropped
+CSS_TOKEN_PATTERN = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|url\([^)'"]*\))|/\*.*?\*/''', re.S)
+CSS_CHARSET_PATTERN = re.compile(r'@charset\s+"[^"]*";\s*')
+CSS_PUNCTUATION_PATTERN = re.compile(r'\s*([{};,>])\s*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# A '/' after one of these starts a regular expression literal rather than a division
+JS_REGEX_PREFIXES = set('(,=:[!&|?{};+-*%<>~^')
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'new', 'delete', 'void', 'throw'}
+
+
+def minify_css(source):
+    """
+    Minify a stylesheet.
+
+    Comments and @charset rules are removed, whitespace is collapsed and
+    dropped around punctuation; strings and url() values are left untouched.
+
+    Args:
+        source: CSS source as string
+
+    Returns:
+        Minified CSS as string
+    """
+    def compact(text):
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        text = CSS_PUNCTUATION_PATTERN.sub(r'\1', text)
+        return text.replace(': ', ':').replace(';}', '}')
+
+    source = CSS_CHARSET_PATTERN.sub('', source)
+    parts = []
+    position = 0
+    for match in CSS_TOKEN_PATTERN.finditer(source):
+        parts.append(compact(source[position:match.start()]))
+        parts.append(match.group(1) or '')
+        position = match.end()
+    parts.append(compact(source[position:]))
+    return ''.join(parts).strip()
+
+
+def minify_js(source):
+    """
+    Minify a script by removing comments and redundant whitespace.
+
+    Tokens are never joined: each run of whitespace becomes a single space,
+    or a newline if it contained one, so automatic semicolon insertion is
+    not affected. Strings, template literals and regular expression literals
+    are copied unchanged.
+
+    Args:
+        source: JavaScript source as string
+
+    Returns:
+        Minified JavaScript as string
+    """
+    out = []
+    length = len(source)
+    i = 0
+    previous = ''       # Last token emitted, decides between regex literal and division
+    pending = ''        # Whitespace to emit before the next token
+    templates = []      # Brace depth of every open ${...} template expression
+    depth = 0
+
+    def scan_template(start):
+        """Return the end of a template literal part starting at start, and whether it ends at '${'."""
+        k = start
+        while k < length:
+            char = source[k]
+            if char == '\\':
+                k += 2
+            elif char == '`':
+                return k + 1, False
+            elif char == '$' and source.startswith('${', k):
+                return k + 2, True
+            else:
+                k += 1
+        return length, False
+
+    while i < length:
+        char = source[i]
+
+        # Whitespace
+        if char in ' \t\r\n\f\v':
+            j = i
+            while j < length and source[j] in ' \t\r\n\f\v':
+                j += 1
+            if '\n' in source[i:j] or pending == '\n':
+                pending = '\n'
+            else:
+                pending = pending or ' '
+            i = j
+            continue
+
+        # Comments
+        if char == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            i = length if end == -1 else end
+            continue
+        if char == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            pending = '\n' if '\n' in source[i:end] or pending == '\n' else (pending or ' ')
+            i = end
+            continue
+
+        if pending and out:
+            out.append(pending)
+        pending = ''
+
+        if char in '"\'':
+            j = i + 1
+            while j < length and source[j] != char:
+                j += 2 if source[j] == '\\' else 1
+            out.append(source[i:j + 1])
+            previous = ')'
+            i = j + 1
+        elif char == '`' or (char == '}' and templates and depth == templates[-1]):
+            if char == '}':
+                templates.pop()
+            end, expression = scan_template(i + 1)
+            if expression:
+                templates.append(depth)
+            out.append(source[i:end])
+            previous = '(' if expression else ')'
+            i = end
+        elif char == '/' and (not previous or previous in JS_REGEX_PREFIXES or previous in JS_REGEX_KEYWORDS):
+            j = i + 1
+            in_class = False
+            while j < length and (in_class or source[j] != '/') and source[j] != '\n':
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                j += 1
+            j += 1
+            while j < length and (source[j].isalnum() or source[j] in '_$'):
+                j += 1
+            out.append(source[i:j])
+            previous = ')'
+            i = j
+        elif char.isalnum() or char in '_$' or ord(char) > 127:
+            j = i + 1
+            while j < length and (source[j].isalnum() or source[j] in '_$' or ord(source[j]) > 127):
+                j += 1
+            previous = source[i:j]
+            out.append(previous)
+            i = j
+        else:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            out.append(char)
+            previous = char
+            i += 1
+
+    return ''.join(out)
+
+
+def build_bundle(name, base_path):
+    """
+    Concatenate and minify the sources of a bundle.
+
+    Args:
+        name: Logical bundle name, e.g. 'css/site.css'
+        base_path: Path of the root directory
+
+    Returns:
+        Bundle content as string
+    """
+    parts = []
+    for source in BUNDLE_SOURCES[name]:
+        with open(base_path / source, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if name == CSS_BUNDLE:
+            parts.append(minify_css(content))
+        else:
+            # Already minified libraries are only concatenated
+            parts.append(content.strip() if source.endswith('.min.js') else minify_js(content))
+
+    if name == CSS_BUNDLE:
+        parts.append(minify_css(DOC_CONTENT_CSS))
+        return '@charset "UTF-8";\n' + '\n'.join(parts) + '\n'
+    # Separate scripts so a file without a trailing semicolon cannot merge with the next
+    return '\n;\n'.join(parts) + '\n'
+
+
+def get_sources_digest(name, base_path):
+    """Hash everything that goes into a bundle: the bundler version and the source files."""
+    digest = hashlib.sha256(f'{ASSET_BUNDLER_VERSION}\n'.encode('utf-8'))
+    for source in BUNDLE_SOURCES[name]:
+        digest.update(source.encode('utf-8') + b'\0')
+        digest.update((base_path / source).read_bytes())
+    if name == CSS_BUNDLE:
+        digest.update(DOC_CONTENT_CSS.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_asset_bundles(base_dir="."):
+    """
+    Write the content-hashed CSS and JS bundles and the asset manifest.
+
+    A bundle is only rebuilt when one of its sources changed; bundles that
+    are no longer referenced are removed.
+
+    Args:
+        base_dir: The root directory of the website
+
+    Returns:
+        Asset manifest dictionary
+    """
+    base_path = Path(base_dir)
+    manifest_path = base_path / ASSET_MANIFEST
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('bundles', {})
+    except (OSError, ValueError):
+        previous = {}
+
+    bundles = {}
+    for name in BUNDLE_SOURCES:
+        sources_digest = get_sources_digest(name, base_path)
+        entry = previous.get(name)
+        if entry and entry.get('sources_digest') == sources_digest and (base_path / entry['path']).exists():
+            bundles[name] = entry
+            continue
+
+        content = build_bundle(name, base_path).encode('utf-8')
+        stem, suffix = os.path.splitext(name)
+        bundle_path = f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{suffix}"
+        temp_path = base_path / (bundle_path + '.tmp')
+        temp_path.write_bytes(content)
+        os.replace(temp_path, base_path / bundle_path)
+
+        source_bytes = sum((base_path / source).stat().st_size for source in BUNDLE_SOURCES[name])
+        bundles[name] = {
+            'path': bundle_path,
+            'sources': BUNDLE_SOURCES[name],
+            'sources_digest': sources_digest,
+            'source_bytes': source_bytes,
+            'bytes': len(content)
+        }
+        print(f"Bundled {len(BUNDLE_SOURCES[name])} file(s) into: {bundle_path} "
+              f"({source_bytes / 1024:.1f} KB -> {len(content) / 1024:.1f} KB)")
+
+    # Remove outdated bundles
+    for name, entry in bundles.items():
+        stem, suffix = os.path.splitext(name)
+        for stale_path in base_path.glob(f'{stem}.*{suffix}'):
+            if stale_path.relative_to(base_path).as_posix() != entry['path']:
+                stale_path.unlink()
+
+    manifest = {
+        'assets': {name: entry['path'] for name, entry in bundles.items()},
+        'bundles': bundles
+    }
+    if bundles != previous:
+        temp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, manifest_path)
+
+    # Templates built before this point may reference outdated bundles
+    convert_markdown.get_asset_paths.cache_clear()
+    convert_markdown.get_template_segments.cache_clear()
+    return manifest
+
+
+def main():
+    """Build the asset bundles."""
+    manifest = build_asset_bundles()
+    for name, path in manifest['assets'].items():
+        print(f"{name} -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
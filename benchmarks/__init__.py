@@ -0,0 +1,7 @@
+"""
+Converter Benchmarks
+Synthetic markdown corpora and a stage-by-stage benchmark runner for
+convert_markdown.py. Run from the repository root with:
+
+    python3 -m benchmarks.run_benchmarks
+"""
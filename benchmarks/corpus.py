@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Synthetic Markdown Corpus Generator
+Generates markdown documents that each stress one part of
+MarkdownToHTMLConverter: deep nested lists, wide and long tables, inline-code
+heavy paragraphs, duplicate headings, many images and huge fenced blocks.
+Output is deterministic for a given size and seed.
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+WORDS = [
+    'cube', 'member', 'hierarchy', 'mapping', 'variable', 'domain', 'datapoint',
+    'template', 'report', 'transformation', 'dataset', 'regulatory', 'framework',
+    'output', 'input', 'layer', 'join', 'filter', 'link', 'structure', 'value'
+]
+
+IDENTIFIERS = [
+    'get_cube_links', 'CUBE_STRUCTURE_ITEM', 'member_id', 'DPM_TABLE', 'run_tests',
+    'VARIABLE_SET', 'combination_id', 'output_layer', 'ReportTemplate', 'is_active'
+]
+
+
+def random_sentence(rng, word_count=12):
+    """Return a plain sentence of random domain words."""
+    words = [rng.choice(WORDS) for _ in range(word_count)]
+    return ' '.join(words).capitalize() + '.'
+
+
+def generate_nested_lists(lines, rng):
+    """Deeply nested ordered and unordered lists with inline formatting."""
+    output = ['# Nested Lists', '']
+    while len(output) < lines:
+        for depth in range(rng.randint(3, 8)):
+            marker = '-' if depth % 2 == 0 else '1.'
+            output.append(f"{'  ' * depth}{marker} **{rng.choice(WORDS)}** {random_sentence(rng, 6)}")
+        for depth in range(rng.randint(0, 4), -1, -1):
+            output.append(f"{'  ' * depth}* *{rng.choice(WORDS)}* item")
+        output.append('')
+    return '\n'.join(output[:lines])
+
+
+def generate_wide_tables(lines, rng, columns=40):
+    """Tables with many columns of short, mostly plain cells."""
+    output = ['# Wide Tables', '']
+    while len(output) < lines:
+        output.append('| ' + ' | '.join(f'Column {c}' for c in range(columns)) + ' |')
+        output.append('|' + '---|' * columns)
+        for _ in range(rng.randint(20, 60)):
+            output.append('| ' + ' | '.join(rng.choice(WORDS) for _ in range(columns)) + ' |')
+        output.append('')
+    return '\n'.join(output[:lines])
+
+
+def generate_long_tables(lines, rng):
+    """Few-column mapping tables with thousands of rows."""
+    output = ['# Long Tables', '', '| Source | Target | Rule |', '|--------|--------|------|']
+    while len(output) < lines:
+        output.append(f'| {rng.choice(IDENTIFIERS)}_{rng.randint(0, 9999)} '
+                      f'| {rng.choice(IDENTIFIERS)} | {random_sentence(rng, 5)} |')
+    return '\n'.join(output[:lines])
+
+
+def generate_inline_code(lines, rng):
+    """Paragraphs and API-reference style tables dense with inline code and emphasis."""
+    output = ['# API Reference', '', '| Function | Arguments | Returns |', '|---|---|---|']
+    while len(output) < lines:
+        if rng.random() < 0.5:
+            output.append(f'| `{rng.choice(IDENTIFIERS)}()` | `{rng.choice(IDENTIFIERS)}`, '
+                          f'`{rng.choice(IDENTIFIERS)}=None` | **`{rng.choice(IDENTIFIERS)}`** |')
+        else:
+            parts = []
+            for _ in range(rng.randint(4, 10)):
+                parts.append(f'`{rng.choice(IDENTIFIERS)}` {rng.choice(WORDS)} *{rng.choice(WORDS)}*')
+            output.append('')
+            output.append(' and '.join(parts) + ', see [docs](api.html).')
+            output.append('')
+            output.append('| Function | Arguments | Returns |')
+            output.append('|---|---|---|')
+    return '\n'.join(output[:lines])
+
+
+def generate_duplicate_headings(lines, rng):
+    """Thousands of headings that share a handful of titles."""
+    output = []
+    titles = ['Overview', 'Configuration', 'Step 1', 'Examples', 'Notes']
+    while len(output) < lines:
+        output.append(f"{'#' * rng.randint(1, 3)} {rng.choice(titles)}")
+        output.append('')
+        output.append(random_sentence(rng))
+        output.append('')
+    return '\n'.join(output[:lines])
+
+
+def generate_images(lines, rng):
+    """Paragraphs and list items with many screenshots."""
+    output = ['# Screenshots', '']
+    while len(output) < lines:
+        name = f'{rng.choice(WORDS)}_{rng.randint(0, 999)}'
+        output.append(f'![{rng.choice(WORDS)} screen](images/screenshots/{name}.png)')
+        output.append('')
+        output.append(f'- Step with ![icon](images/{name}_icon.png) and **{rng.choice(WORDS)}**')
+        output.append('')
+    return '\n'.join(output[:lines])
+
+
+def generate_fenced_blocks(lines, rng):
+    """Huge fenced code blocks full of characters that need escaping."""
+    output = ['# Code Samples', '']
+    while len(output) < lines:
+        output.append(f"```{rng.choice(['bash', 'python', 'json', 'sql', 'xml'])}")
+        for _ in range(rng.randint(200, 2000)):
+            output.append(f'<{rng.choice(WORDS)} id="{rng.randint(0, 99)}"> & {rng.choice(IDENTIFIERS)}(\'x\')')
+        output.append('```')
+        output.append('')
+    return '\n'.join(output[:lines])
+
+
+CORPUS_GENERATORS = {
+    'nested_lists': generate_nested_lists,
+    'wide_tables': generate_wide_tables,
+    'long_tables': generate_long_tables,
+    'inline_code': generate_inline_code,
+    'duplicate_headings': generate_duplicate_headings,
+    'images': generate_images,
+    'fenced_blocks': generate_fenced_blocks,
+}
+
+
+def generate_corpus(lines=5000, seed=0):
+    """
+    Generate one synthetic document per corpus kind.
+
+    Args:
+        lines: Number of lines per document
+        seed: Random seed, the same seed always yields the same corpus
+
+    Returns:
+        Dictionary mapping corpus name to markdown text
+    """
+    corpus = {}
+    for name, generator in CORPUS_GENERATORS.items():
+        corpus[name] = generator(lines, random.Random(f'{seed}-{name}'))
+    return corpus
+
+
+def write_corpus(output_dir, lines=5000, seed=0):
+    """
+    Write the synthetic corpus as .md files, e.g. to build it with convert_markdown.py.
+
+    Args:
+        output_dir: Directory the markdown files are written to
+        lines: Number of lines per document
+        seed: Random seed
+
+    Returns:
+        List of written file paths
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for name, text in generate_corpus(lines, seed).items():
+        file_path = output_path / f"{name.replace('_', '-')}.md"
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        written.append(file_path)
+    return written
+
+
+def main():
+    """Write a synthetic corpus to disk."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic markdown corpus.")
+    parser.add_argument('output_dir', help="directory the markdown files are written to")
+    parser.add_argument('--lines', type=int, default=5000, help="lines per document (default: 5000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args()
+
+    for file_path in write_corpus(args.output_dir, args.lines, args.seed):
+        print(f"Wrote: {file_path}")
+
+
+if __name__ == "__main__":
+    main()
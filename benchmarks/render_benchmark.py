@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Render Daemon Benchmark
+Starts render_daemon.py and drives it with concurrent clients POSTing
+generated markdown snippets over kept-alive connections. The snippets are
+sent twice: the cold pass renders every one of them, the warm pass is
+answered from the daemon's cache. Reports throughput and latency percentiles
+of both passes, and the render latency and hit rate the daemon recorded.
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from benchmarks.search_benchmark import percentile
+from benchmarks.server_benchmark import get_free_port, read_response, wait_for_port
+from benchmarks.snippet_benchmark import generate_snippets
+
+
+async def run_client(port, requests, latencies, totals):
+    """POST the requests in turn over one connection, reconnecting whenever the server closes it."""
+    reader = writer = None
+    for target, body in requests:
+        if writer is None:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        head = (f'POST {target} HTTP/1.1\r\nHost: localhost\r\nContent-Type: text/markdown; charset=utf-8\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n')
+        started = time.perf_counter()
+        writer.write(head.encode('latin-1') + body)
+        status, _, keep_alive = await read_response(reader)
+        latencies.append(time.perf_counter() - started)
+        totals['requests'] += 1
+        if status != 200:
+            totals['errors'] += 1
+        if not keep_alive:
+            writer.close()
+            writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def generate_load(port, requests, concurrency):
+    """
+    Send every request once, spread over concurrent clients.
+
+    Args:
+        port: Port of the daemon on the loopback interface
+        requests: List of (request target, markdown bytes) tuples
+        concurrency: Number of concurrent clients
+
+    Returns:
+        Dictionary with request counts, throughput and latency percentiles
+    """
+    latencies = []
+    totals = {'requests': 0, 'errors': 0}
+    started = time.perf_counter()
+    await asyncio.gather(*(run_client(port, requests[k::concurrency], latencies, totals)
+                           for k in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        'requests': totals['requests'],
+        'errors': totals['errors'],
+        'requests_per_s': totals['requests'] / elapsed,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000
+    }
+
+
+def main():
+    """Benchmark cold and cached renders of the render daemon."""
+    parser = argparse.ArgumentParser(description="Benchmark the render daemon under concurrent load.")
+    parser.add_argument('--count', type=int, default=2000, help="distinct snippets (default: 2000)")
+    parser.add_argument('--concurrency', type=int, default=16, help="concurrent clients (default: 16)")
+    parser.add_argument('--mode', choices=['fragment', 'page'], default='fragment',
+                        help="render HTML fragments or full pages (default: fragment)")
+    parser.add_argument('--seed', type=int, default=0, help="snippet random seed (default: 0)")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    target = f'/render?mode={args.mode}'
+    requests = [(target, text.encode('utf-8')) for text in generate_snippets(args.count, args.seed)]
+
+    print("Render Daemon Benchmark")
+    print("=" * 50)
+    print(f"{args.count} {args.mode} snippets, {args.concurrency} clients")
+
+    port = get_free_port()
+    command = [sys.executable, str(Path(__file__).parent.parent / 'render_daemon.py'),
+               '--port', str(port), '--no-images']
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port, timeout=60)
+        results = {}
+        for name in ('cold', 'warm'):
+            result = asyncio.run(generate_load(port, requests, args.concurrency))
+            results[name] = result
+            print(f"{name:6s} {result['requests_per_s']:9.0f} req/s   "
+                  f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms  ({result['errors']} errors)")
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/__stats') as response:
+            results['daemon'] = json.load(response)
+    finally:
+        process.terminate()
+        process.wait()
+
+    render_latency = results['daemon']['render_latency_ms']
+    print("-" * 50)
+    print(f"Render latency p50 {render_latency['p50']:.2f} ms, p99 {render_latency['p99']:.2f} ms; "
+          f"cache hit rate {results['daemon']['cache']['hit_rate']:.1%}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Converter Benchmark Runner
+Times each stage of the markdown build (convert, description extraction,
+templating and file write) on the synthetic corpus, writes the results as
+JSON and fails when throughput drops below the stored baseline.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+from convert_markdown import (CONVERTER_VERSION, MarkdownToHTMLConverter, create_html_template,
+                              extract_description_from_markdown, get_asset_paths, get_template_segments,
+                              write_html_file)
+from syntax_highlight import HIGHLIGHT_CACHE
+
+BASELINE_FILE = Path(__file__).parent / 'baseline.json'
+
+STAGES = ['convert', 'extract_description', 'create_html_template', 'write']
+
+
+def clear_caches():
+    """Clear the in-process memo caches, so repeated rounds on the same input measure cold work."""
+    HIGHLIGHT_CACHE.clear()
+    get_asset_paths.cache_clear()
+    get_template_segments.cache_clear()
+
+
+def time_stage(func, repeat=3):
+    """
+    Time a stage, best of several rounds.
+
+    Each round calls the function often enough to run for at least 0.2 s,
+    so very fast stages are still measured reliably. The memo caches are
+    cleared before every call, like a fresh build process would find them;
+    clearing them is cheap next to any stage.
+
+    Args:
+        func: Callable running the stage once
+        repeat: Number of rounds
+
+    Returns:
+        Best time of a single call in seconds
+    """
+    def run_cold():
+        clear_caches()
+        func()
+
+    timer = timeit.Timer(run_cold)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def benchmark_document(name, markdown_text, output_dir, repeat=3):
+    """
+    Benchmark every build stage on one document.
+
+    Args:
+        name: Corpus name, used for the title and output file name
+        markdown_text: The markdown content as string
+        output_dir: Directory for the written HTML file
+        repeat: Number of timing rounds per stage
+
+    Returns:
+        Dictionary mapping stage name to seconds, bytes processed and MB/s
+    """
+    html_content = MarkdownToHTMLConverter().convert(markdown_text)
+    full_html = create_html_template(html_content, name, 'user-guide/page.html')
+    output_path = Path(output_dir) / f'{name}.html'
+
+    markdown_bytes = len(markdown_text.encode('utf-8'))
+    html_bytes = len(full_html.encode('utf-8'))
+
+    stages = {
+        'convert': (lambda: MarkdownToHTMLConverter().convert(markdown_text), markdown_bytes),
+        'extract_description': (lambda: extract_description_from_markdown(markdown_text), markdown_bytes),
+        'create_html_template': (lambda: create_html_template(html_content, name, 'user-guide/page.html'),
+                                 html_bytes),
+        'write': (lambda: write_html_file(output_path, [full_html]), html_bytes),
+    }
+
+    results = {}
+    for stage in STAGES:
+        func, size = stages[stage]
+        seconds = time_stage(func, repeat)
+        results[stage] = {
+            'seconds': seconds,
+            'bytes': size,
+            'mb_per_s': size / seconds / 1e6
+        }
+    return results
+
+
+def run_benchmarks(lines=5000, seed=0, repeat=3):
+    """
+    Benchmark every stage on every synthetic corpus document.
+
+    Args:
+        lines: Number of lines per synthetic document
+        seed: Corpus random seed
+        repeat: Number of timing rounds per stage
+
+    Returns:
+        Results dictionary, ready to be written as JSON
+    """
+    corpus = generate_corpus(lines, seed)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, markdown_text in corpus.items():
+            print(f"Benchmarking: {name}")
+            results[name] = benchmark_document(name, markdown_text, output_dir, repeat)
+            for stage in STAGES:
+                print(f"        {stage:<22} {results[name][stage]['mb_per_s']:10.2f} MB/s")
+
+    return {
+        'converter_version': CONVERTER_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'lines': lines,
+        'seed': seed,
+        'results': results
+    }
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compare throughput against a baseline.
+
+    Args:
+        results: Results dictionary from run_benchmarks
+        baseline: Baseline results dictionary in the same format
+        tolerance: Fraction of the baseline throughput that must be reached
+
+    Returns:
+        List of human readable regression descriptions
+    """
+    regressions = []
+    for name, stages in baseline.get('results', {}).items():
+        for stage, expected in stages.items():
+            measured = results['results'].get(name, {}).get(stage)
+            if measured is None:
+                continue
+            minimum = expected['mb_per_s'] * tolerance
+            if measured['mb_per_s'] < minimum:
+                regressions.append(f"{name}/{stage}: {measured['mb_per_s']:.2f} MB/s "
+                                   f"(baseline {expected['mb_per_s']:.2f} MB/s, minimum {minimum:.2f} MB/s)")
+    return regressions
+
+
+def main():
+    """Run the benchmarks and check them against the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the markdown converter.")
+    parser.add_argument('--lines', type=int, default=5000, help="lines per synthetic document (default: 5000)")
+    parser.add_argument('--seed', type=int, default=0, help="corpus random seed (default: 0)")
+    parser.add_argument('--repeat', type=int, default=3, help="timing rounds per stage (default: 3)")
+    parser.add_argument('--output', default='bench_output.json', help="results file (default: bench_output.json)")
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), help="baseline results file")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="fail below this fraction of the baseline throughput (default: 0.5)")
+    parser.add_argument('--update-baseline', action='store_true', help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    print("Markdown Converter Benchmarks")
+    print("=" * 50)
+    results = run_benchmarks(args.lines, args.seed, args.repeat)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print("-" * 50)
+    print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print(f"No baseline found at {baseline_path}, skipping regression check")
+        return 0
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"✗ {len(regressions)} throughput regression(s):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("✓ No throughput regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
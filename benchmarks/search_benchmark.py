@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Search Index Benchmark
+Builds the sharded search index from synthetic corpora of growing size and
+reports build time, index size and query latency (cold, with shard loading,
+and warm, with all needed shards cached).
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import write_corpus
+from search_index import SearchIndex, build_search_index
+
+QUERIES = ['cube', 'member hierarchy', 'mapping template', 'get_cube_links', 'regulatory report output',
+           'da', 'variable set', 'nothing matches this']
+
+
+def percentile(values, fraction):
+    """Return the value below which the given fraction of the sorted values falls."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def benchmark_size(lines, copies, seed=0, rounds=20):
+    """
+    Benchmark the search index for one corpus size.
+
+    Args:
+        lines: Lines per synthetic document
+        copies: Number of copies of the synthetic corpus, each with its own seed
+        seed: First corpus random seed
+        rounds: Number of warm query rounds
+
+    Returns:
+        Dictionary with index statistics and query latencies in milliseconds
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        guides = []
+        for copy in range(copies):
+            source_dir = Path(work_dir) / 'markdown' / str(copy)
+            for file_path in write_corpus(source_dir, lines, seed + copy):
+                slug = f'{file_path.stem}-{copy}'
+                guides.append((file_path, {'slug': slug, 'title': slug, 'path': f'user-guide/{slug}.html'}))
+
+        output_dir = Path(work_dir) / 'user-guide'
+        started = time.perf_counter()
+        stats = build_search_index(guides, output_dir)
+        stats['build_ms'] = (time.perf_counter() - started) * 1000
+
+        cold = []
+        for query in QUERIES:
+            started = time.perf_counter()
+            SearchIndex(output_dir).search(query)
+            cold.append((time.perf_counter() - started) * 1000)
+
+        index = SearchIndex(output_dir)
+        warm = []
+        for _ in range(rounds):
+            for query in QUERIES:
+                started = time.perf_counter()
+                index.search(query)
+                warm.append((time.perf_counter() - started) * 1000)
+
+    stats.update({
+        'lines': lines * len(guides),
+        'cold_p50_ms': percentile(cold, 0.5),
+        'cold_p99_ms': percentile(cold, 0.99),
+        'warm_p50_ms': percentile(warm, 0.5),
+        'warm_p99_ms': percentile(warm, 0.99)
+    })
+    return stats
+
+
+def main():
+    """Run the search benchmark for growing corpus sizes."""
+    parser = argparse.ArgumentParser(description="Benchmark the search index.")
+    parser.add_argument('--lines', type=int, default=1000, help="lines per synthetic document (default: 1000)")
+    parser.add_argument('--copies', type=int, nargs='+', default=[1, 4, 16],
+                        help="corpus sizes as numbers of corpus copies (default: 1 4 16)")
+    parser.add_argument('--seed', type=int, default=0, help="corpus random seed (default: 0)")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    print("Search Index Benchmark")
+    print("=" * 50)
+    results = []
+    for copies in args.copies:
+        stats = benchmark_size(args.lines, copies, args.seed)
+        results.append(stats)
+        print(f"{stats['guides']:5d} guides {stats['lines']:8d} lines: {stats['sections']:6d} sections, "
+              f"{stats['shards']:4d} shards, {stats['bytes'] / 1024:9.1f} KB, built in {stats['build_ms']:8.1f} ms")
+        print(f"        cold p50 {stats['cold_p50_ms']:7.2f} ms  p99 {stats['cold_p99_ms']:7.2f} ms   "
+              f"warm p50 {stats['warm_p50_ms']:7.2f} ms  p99 {stats['warm_p99_ms']:7.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
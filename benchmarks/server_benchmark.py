@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Static Server Benchmark
+Serves the site with `python3 -m http.server` and with static_server.py and
+drives both with the same local load generator: a number of concurrent
+clients, each reusing its connection when the server allows it, requesting a
+mix of generated pages, bundles and JSON. Reports throughput, transferred
+bytes and latency percentiles.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.search_benchmark import percentile
+
+# Requested when present, in addition to the guide pages and asset bundles
+CANDIDATE_PATHS = ['index.html', 'documentation.html', 'user-guide/index.json', 'css/style.css',
+                   'js/jquery.min.js', 'js/main.js']
+
+
+def find_request_paths(root, guide_pages=3):
+    """
+    Choose the request mix from the files present in a site.
+
+    Args:
+        root: Path of the served site
+        guide_pages: Number of generated guide pages to include
+
+    Returns:
+        List of URL paths
+    """
+    root = Path(root)
+    paths = [path for path in CANDIDATE_PATHS if (root / path).is_file()]
+    paths += sorted(path.relative_to(root).as_posix() for path in (root / 'user-guide').glob('*.html'))[:guide_pages]
+    try:
+        with open(root / 'asset-manifest.json', 'r', encoding='utf-8') as f:
+            paths += sorted(json.load(f)['assets'].values())
+    except (OSError, ValueError, KeyError):
+        pass
+    return ['/' + path for path in paths]
+
+
+def get_free_port():
+    """Return a port that is currently free on the loopback interface."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, timeout=10):
+    """Wait until a server accepts connections on a loopback port."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def read_response(reader):
+    """
+    Read one response.
+
+    Returns:
+        Tuple of (status code, body size, whether the server keeps the connection open)
+    """
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    version, status = lines[0].split(' ')[:2]
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = await reader.read()
+    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+    return int(status), len(body), keep_alive
+
+
+async def run_client(port, paths, deadline, accept_encoding, latencies, totals, offset):
+    """Request the paths in turn until the deadline, reconnecting whenever the server closes the connection."""
+    reader = writer = None
+    k = offset
+    while time.perf_counter() < deadline:
+        path = paths[k % len(paths)]
+        k += 1
+        if writer is None:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+        request = f'GET {path} HTTP/1.1\r\nHost: localhost\r\nAccept-Encoding: {accept_encoding}\r\n\r\n'
+        started = time.perf_counter()
+        writer.write(request.encode('latin-1'))
+        status, size, keep_alive = await read_response(reader)
+        latencies.append(time.perf_counter() - started)
+        totals['requests'] += 1
+        totals['bytes'] += size
+        if status != 200:
+            totals['errors'] += 1
+        if not keep_alive:
+            writer.close()
+            writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def generate_load(port, paths, concurrency, duration, accept_encoding):
+    """
+    Run the load generator against one server.
+
+    Args:
+        port: Port of the server on the loopback interface
+        paths: URL paths requested in turn
+        concurrency: Number of concurrent clients
+        duration: Seconds to run
+        accept_encoding: Accept-Encoding header sent with every request
+
+    Returns:
+        Dictionary with request counts, throughput and latency percentiles
+    """
+    latencies = []
+    totals = {'requests': 0, 'bytes': 0, 'errors': 0}
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(run_client(port, paths, deadline, accept_encoding, latencies, totals, k)
+                           for k in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        'requests': totals['requests'],
+        'errors': totals['errors'],
+        'requests_per_s': totals['requests'] / elapsed,
+        'mb_per_s': totals['bytes'] / elapsed / 1e6,
+        'bytes_per_request': totals['bytes'] / max(1, totals['requests']),
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000
+    }
+
+
+def benchmark_server(name, command, port, paths, args):
+    """Start a server, run the load generator against it and stop it again."""
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        # Warm up caches before measuring
+        asyncio.run(generate_load(port, paths, 1, 0.5, args.accept_encoding))
+        result = asyncio.run(generate_load(port, paths, args.concurrency, args.duration, args.accept_encoding))
+    finally:
+        process.terminate()
+        process.wait()
+    result['server'] = name
+    return result
+
+
+def main():
+    """Benchmark http.server against static_server.py."""
+    parser = argparse.ArgumentParser(description="Benchmark the static server against http.server.")
+    parser.add_argument('--root', default='.', help="site to serve (default: .)")
+    parser.add_argument('--concurrency', type=int, default=16, help="concurrent clients (default: 16)")
+    parser.add_argument('--duration', type=float, default=5, help="seconds per server (default: 5)")
+    parser.add_argument('--accept-encoding', default='gzip, br',
+                        help="Accept-Encoding sent by the clients (default: 'gzip, br')")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    paths = find_request_paths(args.root)
+    if not paths:
+        print(f"No files to request under {args.root}, build the site first")
+        return 1
+
+    print("Static Server Benchmark")
+    print("=" * 50)
+    print(f"{len(paths)} paths, {args.concurrency} clients, {args.duration:g} s per server")
+
+    http_server_port = get_free_port()
+    static_server_port = get_free_port()
+    servers = [
+        ('http.server', [sys.executable, '-m', 'http.server', str(http_server_port),
+                         '--bind', '127.0.0.1', '--directory', args.root], http_server_port),
+        ('static_server', [sys.executable, str(Path(__file__).parent.parent / 'static_server.py'),
+                           '--site', f'{args.root}:{static_server_port}', '--host', '127.0.0.1'], static_server_port),
+    ]
+
+    results = []
+    for name, command, port in servers:
+        result = benchmark_server(name, command, port, paths, args)
+        results.append(result)
+        print(f"{name:14s} {result['requests_per_s']:9.0f} req/s {result['mb_per_s']:8.1f} MB/s "
+              f"{result['bytes_per_request'] / 1024:7.1f} KB/req   "
+              f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms  ({result['errors']} errors)")
+
+    speedup = results[1]['requests_per_s'] / results[0]['requests_per_s'] if results[0]['requests_per_s'] else 0
+    print("-" * 50)
+    print(f"static_server handles {speedup:.1f}x the requests of http.server")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
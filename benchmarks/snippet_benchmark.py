@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Snippet Conversion Benchmark
+Measures how many short markdown snippets per second the converter renders
+in-process: with a fresh converter per snippet, with convert_many() on one
+converter, and with a thread pool whose threads share a single converter.
+The threaded results are compared with the sequential ones, so the run also
+checks that sharing a converter between threads is safe.
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.corpus import IDENTIFIERS, random_sentence
+from convert_markdown import MarkdownToHTMLConverter
+
+
+def generate_snippets(count, seed=0):
+    """
+    Generate short markdown snippets mixing the common block and inline elements.
+
+    Args:
+        count: Number of snippets
+        seed: Random seed
+
+    Returns:
+        List of markdown texts
+    """
+    rng = random.Random(seed)
+    snippets = []
+    for _ in range(count):
+        lines = [f'## {random_sentence(rng, 3)}', '', random_sentence(rng)]
+        kind = rng.randrange(4)
+        if kind == 0:
+            lines += [f'- **{rng.choice(IDENTIFIERS)}**: {random_sentence(rng, 6)}' for _ in range(3)]
+        elif kind == 1:
+            lines += ['| Name | Value |', '|---|---|']
+            lines += [f'| `{rng.choice(IDENTIFIERS)}` | {random_sentence(rng, 4)} |' for _ in range(3)]
+        elif kind == 2:
+            lines += ['```python', f'{rng.choice(IDENTIFIERS)} = run(42)  # {random_sentence(rng, 3)}', '```']
+        else:
+            lines += [f'See [{random_sentence(rng, 2)}](guide.html#{rng.choice(IDENTIFIERS)}) and _notes_.']
+        lines += ['', f'## {random_sentence(rng, 3)}']
+        snippets.append('\n'.join(lines))
+    return snippets
+
+
+def measure(name, func, count):
+    """Run a conversion strategy once and print its throughput."""
+    started = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - started
+    print(f"{name:28s} {count / elapsed:10.0f} snippets/s")
+    return results
+
+
+def main():
+    """Benchmark snippet conversion and check thread safety."""
+    parser = argparse.ArgumentParser(description="Benchmark in-process conversion of many small snippets.")
+    parser.add_argument('--count', type=int, default=20000, help="number of snippets (default: 20000)")
+    parser.add_argument('--threads', type=int, default=8, help="threads sharing one converter (default: 8)")
+    parser.add_argument('--seed', type=int, default=0, help="snippet random seed (default: 0)")
+    args = parser.parse_args()
+
+    snippets = generate_snippets(args.count, args.seed)
+    print("Snippet Conversion Benchmark")
+    print("=" * 50)
+
+    expected = measure('fresh converter per snippet',
+                       lambda: [MarkdownToHTMLConverter().convert(text) for text in snippets], args.count)
+
+    converter = MarkdownToHTMLConverter()
+    batched = measure('convert_many', lambda: converter.convert_many(snippets), args.count)
+
+    chunk_size = max(1, len(snippets) // (args.threads * 8))
+    chunks = [snippets[k:k + chunk_size] for k in range(0, len(snippets), chunk_size)]
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        threaded = measure(f'{args.threads} threads, one converter',
+                           lambda: [html for chunk in executor.map(converter.convert_many, chunks) for html in chunk],
+                           args.count)
+
+    print("-" * 50)
+    if batched != expected or threaded != expected:
+        print("✗ Output differs from converting each snippet with a fresh converter")
+        return 1
+    print("✓ All strategies produce identical output")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Build Profiler for the Markdown Converter
+Records wall and CPU time per build stage (read, block parsing, inline
+rendering, block rendering, templating, write) for every converted file,
+counts lines, blocks and regex calls per document, and writes a JSON report
+plus a summary of the slowest files. Enabled with `convert_markdown.py --profile`.
+"""
+
+import cProfile
+import json
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import convert_markdown
+from convert_markdown import (DISABLED_GUIDES, MarkdownToHTMLConverter, convert_markdown_to_html,
+                              create_guide_metadata, create_html_template, create_toc,
+                              extract_description_from_markdown, remove_stale_table_data, write_heading_index,
+                              write_html_file)
+
+STAGES = ['read', 'parse', 'inline', 'render', 'template', 'write']
+
+
+class CountingPattern:
+    """Compiled regex stand-in that counts every call made through it."""
+
+    def __init__(self, pattern, profiler):
+        self.pattern = pattern
+        self.profiler = profiler
+
+    def match(self, *args, **kwargs):
+        self.profiler.regex_calls += 1
+        return self.pattern.match(*args, **kwargs)
+
+    def search(self, *args, **kwargs):
+        self.profiler.regex_calls += 1
+        return self.pattern.search(*args, **kwargs)
+
+    def sub(self, *args, **kwargs):
+        self.profiler.regex_calls += 1
+        return self.pattern.sub(*args, **kwargs)
+
+
+class ProfilingConverter(MarkdownToHTMLConverter):
+    """Converter that measures the time spent in top-level inline rendering calls."""
+
+    def __init__(self, image_catalog=None, table_data_name=None, table_data_dir='.'):
+        super().__init__(image_catalog, table_data_name, table_data_dir=table_data_dir)
+        self.inline_wall = 0.0
+        self.inline_cpu = 0.0
+        self.inline_calls = 0
+        self.inline_depth = 0
+
+    def convert_inline(self, text):
+        """Convert inline markdown, timing only the outermost call of nested link labels."""
+        if self.inline_depth:
+            return super().convert_inline(text)
+
+        self.inline_calls += 1
+        self.inline_depth += 1
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            return super().convert_inline(text)
+        finally:
+            self.inline_wall += time.perf_counter() - wall
+            self.inline_cpu += time.process_time() - cpu
+            self.inline_depth -= 1
+
+
+class BuildProfiler:
+    """Collects per-file stage timings and counters during a build."""
+
+    def __init__(self, top=10, cprofile_path=None):
+        self.top = top
+        self.cprofile_path = cprofile_path
+        self.cprofile = cProfile.Profile() if cprofile_path else None
+        self.files = []
+        self.regex_calls = 0
+
+    @contextmanager
+    def instrument(self):
+        """Count calls to the converter's precompiled patterns while active."""
+        originals = {name: value for name, value in vars(convert_markdown).items()
+                     if name.endswith('_PATTERN') and isinstance(value, re.Pattern)}
+        for name, pattern in originals.items():
+            setattr(convert_markdown, name, CountingPattern(pattern, self))
+        try:
+            yield self
+        finally:
+            for name, pattern in originals.items():
+                setattr(convert_markdown, name, pattern)
+
+    @contextmanager
+    def stage(self, timings, name):
+        """Add the wall and CPU time of the enclosed block to the named stage."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            timings[name]['wall'] += time.perf_counter() - wall
+            timings[name]['cpu'] += time.process_time() - cpu
+
+    def convert_markdown_to_html(self, markdown_file_path, output_file_path, image_catalog=None):
+        """
+        Convert a single markdown file to HTML, recording timings and counters.
+
+        Produces the same output and metadata as convert_markdown.convert_markdown_to_html,
+        but runs each stage on its own so it can be timed separately.
+
+        Args:
+            markdown_file_path: Path to the input markdown file
+            output_file_path: Path where the HTML file should be saved
+            image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+
+        Returns:
+            Dictionary with guide metadata if successful, None otherwise
+        """
+        timings = {stage: {'wall': 0.0, 'cpu': 0.0} for stage in STAGES}
+        record = {'path': str(markdown_file_path), 'stages': timings,
+                  'lines': 0, 'blocks': 0, 'inline_calls': 0, 'regex_calls': 0}
+        self.regex_calls = 0
+        started = time.perf_counter()
+
+        slug = Path(markdown_file_path).stem
+        if slug in DISABLED_GUIDES:
+            # Coming soon pages are pure templating
+            with self.stage(timings, 'template'):
+                guide_metadata = convert_markdown_to_html(markdown_file_path, output_file_path)
+        else:
+            guide_metadata = self.profile_conversion(markdown_file_path, output_file_path, slug, timings, record,
+                                                     image_catalog)
+
+        record['regex_calls'] = self.regex_calls
+        record['total_wall'] = time.perf_counter() - started
+        record['status'] = 'success' if guide_metadata else 'failed'
+        self.files.append(record)
+        return guide_metadata
+
+    def profile_conversion(self, markdown_file_path, output_file_path, slug, timings, record, image_catalog=None):
+        """Run the stages of an enabled guide's conversion one after another."""
+        try:
+            title = slug.replace('_', ' ').replace('-', ' ').title()
+            relative_path = str(Path(output_file_path).relative_to(Path('.')))
+
+            with self.stage(timings, 'read'):
+                with open(markdown_file_path, 'r', encoding='utf-8') as f:
+                    markdown_content = f.read()
+
+            converter = ProfilingConverter(image_catalog, Path(output_file_path).stem,
+                                           table_data_dir=Path(output_file_path).parent)
+            if self.cprofile:
+                self.cprofile.enable()
+            try:
+                with self.stage(timings, 'parse'):
+                    blocks = converter.parse(markdown_content)
+                with self.stage(timings, 'render'):
+                    html_content = converter.render(blocks)
+            finally:
+                if self.cprofile:
+                    self.cprofile.disable()
+
+            # Block rendering time excludes the inline rendering it triggered
+            timings['inline']['wall'] = converter.inline_wall
+            timings['inline']['cpu'] = converter.inline_cpu
+            timings['render']['wall'] -= converter.inline_wall
+            timings['render']['cpu'] -= converter.inline_cpu
+
+            with self.stage(timings, 'template'):
+                description = extract_description_from_markdown(markdown_content)
+                full_html = create_html_template(html_content, title, relative_path, create_toc(converter.headings))
+
+            with self.stage(timings, 'write'):
+                write_html_file(output_file_path, [full_html])
+                write_heading_index(output_file_path, title, slug, converter.headings, converter.links,
+                                    converter.images)
+                remove_stale_table_data(output_file_path, len(converter.tables))
+
+            record['lines'] = markdown_content.count('\n') + 1
+            record['blocks'] = len(blocks)
+            record['inline_calls'] = converter.inline_calls
+            return create_guide_metadata(title, description, output_file_path, slug)
+
+        except Exception as e:
+            print(f"Error converting {markdown_file_path}: {str(e)}")
+            return None
+
+    def get_totals(self):
+        """Sum the stage timings and counters over all profiled files."""
+        totals = {stage: {'wall': 0.0, 'cpu': 0.0} for stage in STAGES}
+        for record in self.files:
+            for stage in STAGES:
+                totals[stage]['wall'] += record['stages'][stage]['wall']
+                totals[stage]['cpu'] += record['stages'][stage]['cpu']
+        return {
+            'files': len(self.files),
+            'wall': sum(record['total_wall'] for record in self.files),
+            'lines': sum(record['lines'] for record in self.files),
+            'blocks': sum(record['blocks'] for record in self.files),
+            'regex_calls': sum(record['regex_calls'] for record in self.files),
+            'stages': totals
+        }
+
+    def get_slowest_files(self):
+        """Return the profiled files sorted by total wall time, slowest first."""
+        return sorted(self.files, key=lambda record: record['total_wall'], reverse=True)[:self.top]
+
+    def write_report(self, report_path):
+        """
+        Write the JSON report and the optional cProfile dump.
+
+        Args:
+            report_path: Path of the JSON report
+        """
+        report = {
+            'totals': self.get_totals(),
+            'slowest': [record['path'] for record in self.get_slowest_files()],
+            'files': self.files
+        }
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Profile report written to: {report_path}")
+
+        if self.cprofile:
+            self.cprofile.dump_stats(self.cprofile_path)
+            print(f"cProfile stats written to: {self.cprofile_path}")
+
+    def print_summary(self):
+        """Print the per-stage totals and the slowest files."""
+        totals = self.get_totals()
+        print("Build profile:")
+        for stage in STAGES:
+            timing = totals['stages'][stage]
+            print(f"  {stage:<9} wall {timing['wall'] * 1000:10.1f} ms   cpu {timing['cpu'] * 1000:10.1f} ms")
+        print(f"  {totals['files']} file(s), {totals['lines']} lines, {totals['blocks']} blocks, "
+              f"{totals['regex_calls']} regex calls")
+
+        if self.files:
+            print(f"Slowest {min(self.top, len(self.files))} file(s):")
+            for record in self.get_slowest_files():
+                print(f"  {record['total_wall'] * 1000:10.1f} ms  {record['path']} "
+                      f"({record['lines']} lines, {record['blocks']} blocks)")
@@ -9,8 +9,19 @@ Uses the website's styling with navbar and footer includes.
 import os
 import re
 import json
+import hashlib
+import functools
+import argparse
+import copy
+import shutil
+import subprocess
+from html import unescape
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from render_cache import RENDER_CACHE_DIR, RENDER_CACHE_MAX_BYTES, DiskRenderCache, print_cache_report
+from syntax_highlight import get_language, highlight_chunk
 
 # Configuration for disabled guides (coming soon pages)
 DISABLED_GUIDES = [
@@ -19,74 +30,432 @@ DISABLED_GUIDES = [
 ]
 
 
+# Bump whenever a change to the converter alters the generated HTML
+CONVERTER_VERSION = '2.6'
+
+# Build manifest used to skip unchanged files, relative to the output directory
+BUILD_MANIFEST = '.build-manifest.json'
+
+
+# Deepest heading level listed in the sidebar table of contents
+TOC_MAX_LEVEL = 2
+
+# Suffix of the per-guide heading index written next to each HTML page
+HEADING_INDEX_SUFFIX = '.headings.json'
+
+# Images at the top of a page load eagerly, all later ones lazily
+EAGER_IMAGE_COUNT = 1
+
+# Rendered width of guide images, matching the .content-wrapper width
+IMAGE_SIZES = '(max-width: 900px) 100vw, 820px'
+
+# Maximum number of lines grouped into a single table or code block
+BLOCK_CHUNK_LINES = 512
+
+# Tables with more rows than this are paginated: the page holds the first
+# TABLE_PAGE_ROWS rows, all rows are in a JSON file loaded when paging
+TABLE_PAGINATION_ROWS = 200
+TABLE_PAGE_ROWS = 50
+
+# Suffix of the row data of a paginated table, written next to the HTML page
+TABLE_DATA_SUFFIX = '.table-{}.json'
+
+TABLE_OPEN_TAG = '<table class="table table-bordered">'
+
+# Bytes read at a time when comparing a rewritten file with the previous one
+COMPARE_CHUNK_SIZE = 1024 * 1024
+
+
+# Precompiled block-level patterns, used to classify each line exactly once
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)')
+HR_PATTERN = re.compile(r'^[\-\*_]{3,}$')
+UL_ITEM_PATTERN = re.compile(r'^(\s*)[\*\-\+]\s+(.+)')
+OL_ITEM_PATTERN = re.compile(r'^(\s*)\d+\.\s+(.+)')
+LIST_MARKER_PATTERN = re.compile(r'^\s*(?:[\*\-\+]|\d+\.)\s+')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^[\-:]+$')
+
+# Precompiled inline patterns, matched only at the position the scanner reached
+INLINE_SPECIAL_PATTERN = re.compile(r'[`!\[<*_\n]')
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+RAW_IMAGE_PATTERN = re.compile(r'<img[^>]*>')
+RAW_IMAGE_SRC_PATTERN = re.compile(r'\ssrc=["\']([^"\']*)["\']')
+LINK_TARGET_PATTERN = re.compile(r'\(([^\)]+)\)')
+
+# Precompiled patterns for heading ID generation
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+ID_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s-]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HYPHENS_PATTERN = re.compile(r'-+')
+LETTER_START_PATTERN = re.compile(r'^[a-z]')
+
+
+def iter_source_lines(lines):
+    """
+    Yield markdown lines without line terminators, the way str.split('\\n') splits text.
+
+    Args:
+        lines: Iterable of lines, with or without a trailing newline each
+
+    Yields:
+        Lines without their trailing newline, plus a final empty line when the
+        input ends with a newline or is empty
+    """
+    ends_with_newline = True
+    for line in lines:
+        ends_with_newline = line.endswith('\n')
+        yield line[:-1] if ends_with_newline else line
+    if ends_with_newline:
+        yield ''
+
+
 class MarkdownToHTMLConverter:
-    """Simple markdown to HTML converter without external dependencies."""
+    """
+    Simple markdown to HTML converter without external dependencies.
+
+    convert() and convert_stream() keep the state of the document being
+    converted (open lists and tables, heading IDs, recorded headings, links
+    and images) on the converter and reset it when the next document starts,
+    so one converter converts documents one after another. convert_many()
+    renders each document in a separate render context instead and never
+    touches the converter's own state, so one converter can be shared by
+    any number of threads.
+    """
 
-    def __init__(self):
+    def __init__(self, image_catalog=None, table_data_name=None, pagination_rows=TABLE_PAGINATION_ROWS,
+                 search_postings=None, table_data_dir='.'):
+        """
+        Args:
+            image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+            table_data_name: Stem of the page; if given, tables longer than
+                             pagination_rows are paginated and their rows streamed
+                             to a row data file each, see TableDataWriter
+            pagination_rows: Row count above which a table is paginated
+            search_postings: Optional search_index.GuidePostings that collects the
+                             search terms of every block as it is rendered
+            table_data_dir: Directory of the page, where the row data files are written
+        """
+        self.table_data_name = table_data_name
+        self.table_data_dir = table_data_dir
+        self.pagination_rows = pagination_rows
+        self.search_postings = search_postings
+        self.image_catalog = image_catalog or {}  # Image sizes and variants, see image_pipeline.py
+        self.reset()
+
+    def reset(self):
+        """Clear the per-document state before converting another document."""
         self.list_stack = []
-        self.in_code_block = False
         self.in_table = False
+        self.table_rows = []   # Rows of the open table, held back until its size is known
+        self.table_data = None # TableDataWriter of the open table once it is paginated
+        self.tables = []       # Row count of each paginated table, in document order
+        self.code_carry = []   # Lines of the open code block carried over to its next chunk
+        self.code_language = None  # Highlighting language of the open code block
         self.used_ids = set()  # Track used heading IDs to prevent duplicates
+        self.id_counters = {}  # Next duplicate suffix per heading ID
+        self.headings = []     # (level, id, text) of every heading, in document order
+        self.links = []        # href of every link, in document order
+        self.images = []       # src of every image, relative to the page
+        self.image_count = 0
+
+    def render_context(self):
+        """
+        Return a render context: a converter with the same settings and fresh per-document state.
+
+        Settings and the (read-only) image catalog are shared, so creating a
+        context is cheap; the context belongs to the caller alone.
+        """
+        context = copy.copy(self)
+        context.search_postings = None
+        context.reset()
+        return context
 
     def convert(self, markdown_text):
         """Convert markdown text to HTML."""
-        lines = markdown_text.split('\n')
-        html_lines = []
-        i = 0
+        self.reset()
+        return self.render(self.parse(markdown_text))
+
+    def convert_many(self, texts):
+        """
+        Convert many markdown documents, each independently of the others.
+
+        All documents are rendered in one render context of their own, which
+        is reset between documents, so the call is safe while other threads
+        use the same converter.
+
+        Args:
+            texts: Iterable of markdown texts
+
+        Returns:
+            List of HTML strings, in the same order as texts
+        """
+        context = self.render_context()
+        return [context.convert(text) for text in texts]
+
+    def convert_stream(self, lines):
+        """
+        Convert markdown lines to HTML incrementally.
+
+        Only one block (at most BLOCK_CHUNK_LINES lines of a table or code
+        block) is held at a time, so memory use does not grow with the
+        document size.
+
+        Args:
+            lines: Iterable of markdown lines, e.g. an open text file; trailing
+                   newlines are optional
+
+        Yields:
+            HTML chunks whose concatenation equals convert() of the same text
+        """
+        self.reset()
+        return self.render_chunks(self.parse_lines(iter_source_lines(lines)))
+
+    def parse(self, markdown_text):
+        """
+        Tokenize markdown text into a compact block AST.
+
+        Args:
+            markdown_text: The markdown content as string
+
+        Returns:
+            List of blocks, see parse_lines()
+        """
+        return list(self.parse_lines(markdown_text.split('\n')))
+
+    def parse_lines(self, lines):
+        """
+        Tokenize markdown lines into a compact block AST.
+
+        Every line is classified once. Consecutive table rows are grouped into
+        'table' blocks and fenced code into 'code' blocks, each holding at most
+        BLOCK_CHUNK_LINES lines; all other blocks map to a single source line.
+
+        Args:
+            lines: Iterable of markdown lines without line terminators
+
+        Yields:
+            Block tuples whose first element is the block kind:
+            ('code', lang, lines, continued, closed), ('table', rows), ('heading', level, text),
+            ('raw', text), ('hr',), ('quote', text), ('list_item', list_type, indent_level, text),
+            ('list_break',), ('para', text) and ('blank',).
+            A continued code block carries on the previous one without opening
+            a new element. Table rows are lists of cell strings, or None for
+            separator rows.
+        """
+        code_block = None
+        table_rows = None
+
+        for line in lines:
+            stripped = line.strip()
+
+            # Fenced code blocks
+            if code_block is not None:
+                if stripped.startswith('```'):
+                    yield ('code', code_block[0], code_block[1], code_block[2], True)
+                    code_block = None
+                elif len(code_block[1]) < BLOCK_CHUNK_LINES:
+                    code_block[1].append(line)
+                else:
+                    yield ('code', code_block[0], code_block[1], code_block[2], False)
+                    code_block = (code_block[0], [line], True)
+                continue
 
-        while i < len(lines):
-            line = lines[i]
+            if stripped.startswith('```'):
+                if table_rows:
+                    yield ('table', table_rows)
+                table_rows = None
+                code_block = (stripped[3:].strip(), [], False)
+                continue
 
-            # Handle code blocks
-            if line.strip().startswith('```'):
-                if not self.in_code_block:
-                    self.in_code_block = True
-                    lang = line.strip()[3:].strip()
-                    html_lines.append('<pre><code>')
+            # Tables
+            if stripped.startswith('|'):
+                cells = [cell.strip() for cell in stripped.strip('|').split('|')]
+                if all(TABLE_SEPARATOR_PATTERN.match(cell) for cell in cells):
+                    cells = None
+                if table_rows is None:
+                    table_rows = []
+                elif len(table_rows) >= BLOCK_CHUNK_LINES:
+                    yield ('table', table_rows)
+                    table_rows = []
+                table_rows.append(cells)
+                continue
+            if table_rows is not None:
+                yield ('table', table_rows)
+                table_rows = None
+
+            if not stripped:
+                yield ('blank',)
+                continue
+
+            first = line[0]
+
+            # Headers
+            if first == '#':
+                match = HEADING_PATTERN.match(line)
+                if match:
+                    yield ('heading', len(match.group(1)), match.group(2))
                 else:
-                    self.in_code_block = False
-                    html_lines.append('</code></pre>')
-                i += 1
+                    yield ('raw', line)
                 continue
 
-            if self.in_code_block:
-                # Escape HTML characters in code blocks
-                escaped_line = self.escape_html(line)
-                html_lines.append(escaped_line)
-                i += 1
+            # Horizontal rule
+            if HR_PATTERN.match(stripped):
+                yield ('hr',)
                 continue
 
-            # Process the line
-            converted_line = self.convert_line(line)
+            # Blockquote
+            if first == '>':
+                yield ('quote', line[1:].strip())
+                continue
 
-            # Handle lists
-            converted_line = self.handle_lists(converted_line, line)
+            # List items
+            match = UL_ITEM_PATTERN.match(line)
+            if match:
+                yield ('list_item', 'ul', len(match.group(1)) // 2, match.group(2))
+                continue
+            match = OL_ITEM_PATTERN.match(line)
+            if match:
+                yield ('list_item', 'ol', len(match.group(1)) // 2, match.group(2))
+                continue
+            if LIST_MARKER_PATTERN.match(line):
+                # A bare list marker without content only closes open lists
+                yield ('list_break',)
+                continue
 
-            # Handle tables
-            if self.is_table_line(line):
-                if not self.in_table:
-                    self.in_table = True
-                    html_lines.append('<table class="table table-bordered">')
-                converted_line = self.convert_table_row(line)
-            elif self.in_table and not self.is_table_line(line):
-                self.in_table = False
-                html_lines.append('</table>')
+            # Paragraph
+            yield ('para', line)
 
-            if converted_line:
-                html_lines.append(converted_line)
+        if table_rows is not None:
+            yield ('table', table_rows)
+        if code_block is not None:
+            yield ('code', code_block[0], code_block[1], code_block[2], False)
 
-            i += 1
+    def render(self, blocks):
+        """
+        Render a block AST produced by parse() to HTML.
 
-        # Close any open lists
-        while self.list_stack:
-            tag = self.list_stack.pop()
-            html_lines.append(f'</{tag}>')
+        Args:
+            blocks: Iterable of block tuples
+
+        Returns:
+            HTML content as string
+        """
+        return ''.join(self.render_chunks(blocks))
+
+    def render_chunks(self, blocks):
+        """
+        Render a block AST to HTML, one chunk per block.
+
+        Args:
+            blocks: Iterable of block tuples
+
+        Yields:
+            HTML chunks; output lines are separated by newlines across chunks
+        """
+        separator = ''
+
+        try:
+            for block in blocks:
+                html_lines = self.render_block(block)
+                if self.search_postings is not None:
+                    self.search_postings.add_block(block, self.headings)
+                if html_lines:
+                    yield separator + '\n'.join(html_lines)
+                    separator = '\n'
+
+            html_lines = []
+
+            # Highlight the lines carried over by a code block left open at the end of the document
+            if self.code_carry:
+                html_lines.extend(highlight_chunk(self.code_language, self.code_carry, True)[0])
+
+            # Close any open lists
+            while self.list_stack:
+                tag = self.list_stack.pop()
+                html_lines.append(f'</{tag}>')
+
+            # Close table if still open
+            if self.in_table:
+                html_lines.extend(self.close_table())
+
+            if html_lines:
+                yield separator + '\n'.join(html_lines)
+        finally:
+            if self.table_data is not None:
+                # The conversion failed or was abandoned inside a paginated table
+                self.table_data.discard()
+                self.table_data = None
+
+    def render_block(self, block):
+        """
+        Render a single block.
+
+        Args:
+            block: Block tuple
+
+        Returns:
+            List of HTML output lines
+        """
+        html_lines = []
+        kind = block[0]
+
+        # Code blocks neither close open lists nor open tables
+        if kind == 'code':
+            language = get_language(block[1])
+            if not block[3]:
+                html_lines.append(f'<pre><code class="language-{language}">' if language else '<pre><code>')
+            lines = self.code_carry + block[2]
+            if language and lines:
+                highlighted, self.code_carry = highlight_chunk(language, lines, block[4])
+                self.code_language = language
+                html_lines.extend(highlighted)
+            else:
+                html_lines.extend(self.escape_html(line) for line in block[2])
+            if block[4]:
+                html_lines.append('</code></pre>')
+            return html_lines
+
+        # Table rows silently drop any open lists
+        if kind == 'table':
+            self.list_stack.clear()
+            if not self.in_table:
+                self.in_table = True
+                if self.table_data_name is None:
+                    html_lines.append(TABLE_OPEN_TAG)
+            for cells in block[1]:
+                if cells is not None:
+                    self.add_table_row(self.convert_table_cells(cells), html_lines)
+            return html_lines
 
-        # Close table if still open
         if self.in_table:
-            html_lines.append('</table>')
+            html_lines.extend(self.close_table())
+
+        if kind == 'list_item':
+            html_lines.append(self.manage_list_stack(block[1], block[2], block[3]))
+            return html_lines
+
+        if kind == 'heading':
+            converted_line = self.convert_header(block[1], block[2])
+        elif kind == 'para':
+            converted_line = f'<p>{self.convert_inline(block[1])}</p>'
+        elif kind == 'quote':
+            converted_line = f'<blockquote>{self.convert_inline(block[1])}</blockquote>'
+        elif kind == 'hr':
+            converted_line = '<hr>'
+        elif kind == 'raw':
+            converted_line = block[1]
+        else:
+            converted_line = ''
 
-        return '\n'.join(html_lines)
+        # Not a list item, close all lists if any are open
+        if self.list_stack:
+            closing = []
+            while self.list_stack:
+                closing.append(f'</{self.list_stack.pop()}>')
+            html_lines.append('\n'.join(closing) + '\n' + converted_line)
+        elif converted_line:
+            html_lines.append(converted_line)
+
+        return html_lines
 
     def escape_html(self, text):
         """Escape HTML special characters."""
@@ -97,70 +466,43 @@ class MarkdownToHTMLConverter:
                 .replace('"', '&quot;')
                 .replace("'", '&#39;'))
 
-    def convert_line(self, line):
-        """Convert a single line of markdown to HTML."""
-        if not line.strip():
-            return ''
-
-        # Headers
-        if line.startswith('#'):
-            return self.convert_header(line)
-
-        # Horizontal rule
-        if re.match(r'^[\-\*_]{3,}$', line.strip()):
-            return '<hr>'
+    def convert_header(self, level, content):
+        """Convert a markdown header to HTML with ID generation."""
+        # Generate ID from heading text
+        heading_id = self.generate_heading_id(content)
+        heading_html = self.convert_inline(content)
 
-        # Blockquote
-        if line.startswith('>'):
-            content = line[1:].strip()
-            return f'<blockquote>{self.convert_inline(content)}</blockquote>'
+        # Record the heading as plain text for the table of contents
+        self.headings.append((level, heading_id, unescape(HTML_TAG_PATTERN.sub('', heading_html)).strip()))
 
-        # List items are handled separately
-        if re.match(r'^\s*[\*\-\+]\s+', line) or re.match(r'^\s*\d+\.\s+', line):
-            return None  # Will be handled by handle_lists
-
-        # Paragraph
-        if line.strip() and not self.is_table_line(line):
-            return f'<p>{self.convert_inline(line)}</p>'
-
-        return line
-
-    def convert_header(self, line):
-        """Convert markdown header to HTML with ID generation."""
-        match = re.match(r'^(#{1,6})\s+(.+)', line)
-        if match:
-            level = len(match.group(1))
-            content = match.group(2)
-
-            # Generate ID from heading text
-            heading_id = self.generate_heading_id(content)
-
-            return f'<h{level} id="{heading_id}">{self.convert_inline(content)}</h{level}>'
-        return line
+        return f'<h{level} id="{heading_id}">{heading_html}</h{level}>'
 
     def generate_heading_id(self, text):
         """Generate a URL-friendly ID from heading text."""
         # Remove any existing HTML tags for ID generation
-        import re
-        clean_text = re.sub(r'<[^>]+>', '', text)
+        clean_text = HTML_TAG_PATTERN.sub('', text)
 
         # Convert to lowercase and replace spaces with hyphens
         heading_id = clean_text.lower()
-        heading_id = re.sub(r'[^\w\s-]', '', heading_id)  # Remove special characters
-        heading_id = re.sub(r'\s+', '-', heading_id)      # Replace spaces with hyphens
-        heading_id = re.sub(r'-+', '-', heading_id)       # Replace multiple hyphens with single
-        heading_id = heading_id.strip('-')                # Remove leading/trailing hyphens
+        heading_id = ID_SPECIAL_CHARS_PATTERN.sub('', heading_id)  # Remove special characters
+        heading_id = WHITESPACE_PATTERN.sub('-', heading_id)       # Replace spaces with hyphens
+        heading_id = HYPHENS_PATTERN.sub('-', heading_id)          # Replace multiple hyphens with single
+        heading_id = heading_id.strip('-')                         # Remove leading/trailing hyphens
 
         # Ensure it starts with a letter
-        if not heading_id or not re.match(r'^[a-z]', heading_id):
+        if not heading_id or not LETTER_START_PATTERN.match(heading_id):
             heading_id = 'heading-' + heading_id if heading_id else 'heading'
 
-        # Handle duplicates by adding a counter
+        # Handle duplicates by adding a counter, continuing from the last one used for this ID;
+        # only suffixed IDs taken by other headings (e.g. a literal "Setup 1") are skipped
         original_id = heading_id
-        counter = 1
-        while heading_id in self.used_ids:
+        counter = self.id_counters.get(original_id, 0)
+        if counter:
             heading_id = f"{original_id}-{counter}"
+        while heading_id in self.used_ids:
             counter += 1
+            heading_id = f"{original_id}-{counter}"
+        self.id_counters[original_id] = counter + 1
 
         # Add to used IDs set
         self.used_ids.add(heading_id)
@@ -168,135 +510,173 @@ class MarkdownToHTMLConverter:
         return heading_id
 
     def convert_inline(self, text):
-        """Convert inline markdown elements to HTML."""
-        # Handle images first, before any other processing
-        text = self.convert_images(text)
-
-        # Process text formatting while preserving image tags
-        text = self.process_formatting_with_images(text)
-
-        # Links [text](url) - process after image handling
-        text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<a href="\2">\1</a>', text)
-
-        return text
-
-    def process_formatting_with_images(self, text):
-        """Process text formatting while preserving image tag content and code blocks."""
-        # Store image tags to protect them from formatting
-        image_placeholders = {}
-        code_placeholders = {}
-        image_counter = 0
-        code_counter = 0
-
-        def store_image_tag(match):
-            nonlocal image_counter
-            placeholder = f'IMGPLACEHOLDER{image_counter}IMGPLACEHOLDER'
-            image_placeholders[placeholder] = match.group(0)
-            image_counter += 1
-            return placeholder
-
-        def store_code_block(code_html):
-            nonlocal code_counter
-            placeholder = f'CODEPLACEHOLDER{code_counter}CODEPLACEHOLDER'
-            code_placeholders[placeholder] = code_html
-            code_counter += 1
-            return placeholder
-
-        # Temporarily replace image tags
-        text = re.sub(r'<img[^>]*>', store_image_tag, text)
-
-        # First convert inline code and store it to protect from formatting
-        def process_code_match(match):
-            code_content = self.escape_html(match.group(1))
-            return store_code_block(f'<code>{code_content}</code>')
-
-        text = re.sub(r'`([^`]+)`', process_code_match, text)
-
-        # Now safely apply text formatting (without HTML escaping for placeholders)
-        # First escape HTML but preserve our placeholders
-        escaped_text = ""
-        parts = text.split('IMGPLACEHOLDER')
-
-        for i, part in enumerate(parts):
-            if i % 2 == 0:  # Regular text parts
-                # Apply HTML escaping and formatting to regular text
-                part = self.escape_html_selective(part)
-
-                # Bold (** or __)
-                part = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', part)
-                part = re.sub(r'__(.+?)__', r'<strong>\1</strong>', part)
-
-                # Italic (* or _) - now safe from image paths and code blocks
-                part = re.sub(r'\*(.+?)\*', r'<em>\1</em>', part)
-                part = re.sub(r'_(.+?)_', r'<em>\1</em>', part)
-
-                escaped_text += part
-            else:  # Placeholder numbers - reconstruct placeholder
-                if part:  # Only if there's a number
-                    escaped_text += f'IMGPLACEHOLDER{part}IMGPLACEHOLDER'
-
-        text = escaped_text
-
-        # Restore image tags
-        for placeholder, image_tag in image_placeholders.items():
-            text = text.replace(placeholder, image_tag)
-
-        # Restore code blocks
-        for placeholder, code_block in code_placeholders.items():
-            text = text.replace(placeholder, code_block)
-
-        return text
-
-    def convert_images(self, text):
-        """Convert image markdown to HTML with proper path resolution."""
-        def replace_image(match):
-            alt_text = match.group(1) or ''
-            image_path = match.group(2)
-
-            # Fix path resolution for user_guide subdirectory
-            if image_path.startswith('images/'):
-                image_path = '../' + image_path
+        """
+        Convert inline markdown elements to HTML in a single left-to-right scan.
+
+        Code spans, images, links and HTML escaping are emitted as the scanner
+        reaches them. Emphasis delimiters are recorded as output slots and
+        paired once the current run ends (at a line break, an image or the
+        end of the text), so no intermediate copies of the string are made.
+        """
+        out = []
+        delimiters = []
+        pos = 0
+        length = len(text)
+        escape_html = self.escape_html
+        search = INLINE_SPECIAL_PATTERN.search
+
+        while pos < length:
+            match = search(text, pos)
+            if match is None:
+                out.append(escape_html(text[pos:]))
+                break
+
+            start = match.start()
+            if start > pos:
+                out.append(escape_html(text[pos:start]))
+            char = text[start]
+            pos = start + 1
+
+            # Emphasis delimiters are resolved at the end of the run
+            if char == '*' or char == '_':
+                delimiters.append(len(out))
+                out.append(char)
+                continue
 
+            # Line breaks (from <br> in table cells) end an emphasis run
+            if char == '\n':
+                if delimiters:
+                    self.resolve_emphasis(out, delimiters)
+                    delimiters = []
+                out.append(char)
+                continue
+
+            # Inline code
+            if char == '`':
+                end = text.find('`', pos)
+                if end > pos:
+                    out.append(f'<code>{escape_html(text[pos:end])}</code>')
+                    pos = end + 1
+                else:
+                    out.append(char)
+                continue
+
+            # Images and raw <img> tags end an emphasis run
+            if char == '!':
+                image = IMAGE_PATTERN.match(text, start)
+                if image:
+                    image_html = self.convert_image(image.group(1), image.group(2))
+            elif char == '<':
+                image = RAW_IMAGE_PATTERN.match(text, start)
+                if image:
+                    image_html = image.group(0)
+                    src = RAW_IMAGE_SRC_PATTERN.search(image_html)
+                    if src:
+                        self.images.append(unescape(src.group(1)))
+            else:
+                image = None
+            if image:
+                if delimiters:
+                    self.resolve_emphasis(out, delimiters)
+                    delimiters = []
+                out.append(image_html)
+                pos = image.end()
+                continue
+
+            # Links [text](url), including links around images
+            if char == '[':
+                link = match_link(text, start)
+                if link:
+                    label, url, pos = link
+                    label = self.convert_inline(label)
+                    self.links.append(url)
+                    out.append(f'<a href="{escape_html(url)}">{label}</a>')
+                    continue
+
+            out.append(escape_html(char))
+
+        if delimiters:
+            self.resolve_emphasis(out, delimiters)
+
+        return ''.join(out)
+
+    def resolve_emphasis(self, out, delimiters):
+        """
+        Pair emphasis delimiters recorded in an output run and replace them with tags.
+
+        Doubled delimiters are paired first (bold), the remaining ones second
+        (italic), each from left to right with at least one character of
+        content between the pair.
+
+        Args:
+            out: List of output slots, one slot per delimiter character
+            delimiters: Slot indices of the '*' and '_' characters of the run
+        """
+        for char in ('*', '_'):
+            positions = [index for index in delimiters if out[index] == char]
+            if len(positions) < 2:
+                continue
+
+            # Bold (** or __)
+            consumed = set()
+            opener = None
+            count = len(positions)
+            k = 0
+            while k < count:
+                index = positions[k]
+                doubled = k + 1 < count and positions[k + 1] == index + 1
+                if doubled and opener is None:
+                    opener = index
+                    k += 2
+                    continue
+                if doubled and index >= opener + 3:
+                    out[opener] = '<strong>'
+                    out[opener + 1] = ''
+                    out[index] = '</strong>'
+                    out[index + 1] = ''
+                    consumed.update((opener, opener + 1, index, index + 1))
+                    opener = None
+                    k += 2
+                    continue
+                k += 1
+
+            # Italic (* or _)
+            opener = None
+            for index in positions:
+                if index in consumed:
+                    continue
+                if opener is None:
+                    opener = index
+                elif index >= opener + 2:
+                    out[opener] = '<em>'
+                    out[index] = '</em>'
+                    opener = None
+
+    def convert_image(self, alt_text, image_path):
+        """Convert an image reference to HTML with proper path resolution."""
+        image = self.image_catalog.get(image_path)
+        self.image_count += 1
+
+        # Fix path resolution for user_guide subdirectory
+        path_prefix = '../' if image_path.startswith('images/') else ''
+        image_path = path_prefix + image_path
+        self.images.append(image_path)
+
+        if image is None:
             return f'<img src="{image_path}" alt="{alt_text}" class="img-responsive guide-image">'
 
-        return re.sub(r'!\[([^\]]*)\]\(([^\)]+)\)', replace_image, text)
+        # Intrinsic size avoids layout shift, variants let the browser pick a smaller file
+        attributes = f'width="{image["width"]}" height="{image["height"]}"'
+        if image['variants']:
+            srcset = ', '.join(f'{path_prefix}{path} {width}w' for width, _, path in image['variants'])
+            srcset += f', {image_path.replace(" ", "%20")} {image["width"]}w'
+            attributes += f' srcset="{srcset}" sizes="{IMAGE_SIZES}"'
 
-    def escape_html_selective(self, text):
-        """Escape HTML special characters but preserve placeholders."""
-        # Simple HTML escaping - placeholders will be handled separately
-        text = (text
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+        if self.image_count > EAGER_IMAGE_COUNT:
+            attributes += ' loading="lazy"'
 
-        return text
-
-    def handle_lists(self, converted_line, original_line):
-        """Handle list items and manage list stack."""
-        # Check for unordered list
-        ul_match = re.match(r'^(\s*)[\*\-\+]\s+(.+)', original_line)
-        # Check for ordered list
-        ol_match = re.match(r'^(\s*)\d+\.\s+(.+)', original_line)
-
-        if ul_match:
-            indent_level = len(ul_match.group(1)) // 2
-            content = ul_match.group(2)
-            return self.manage_list_stack('ul', indent_level, content)
-        elif ol_match:
-            indent_level = len(ol_match.group(1)) // 2
-            content = ol_match.group(2)
-            return self.manage_list_stack('ol', indent_level, content)
-        else:
-            # Not a list item, close all lists if any are open
-            result = []
-            while self.list_stack:
-                tag = self.list_stack.pop()
-                result.append(f'</{tag}>')
-            if result:
-                return '\n'.join(result) + '\n' + (converted_line or '')
-            return converted_line
+        attributes += ' decoding="async"'
+        return f'<img src="{image_path}" alt="{alt_text}" {attributes} class="img-responsive guide-image">'
 
     def manage_list_stack(self, list_type, indent_level, content):
         """Manage nested lists."""
@@ -319,44 +699,374 @@ class MarkdownToHTMLConverter:
 
         return '\n'.join(result)
 
-    def is_table_line(self, line):
-        """Check if a line is part of a table."""
-        return '|' in line and line.strip().startswith('|')
-
-    def convert_table_row(self, line):
-        """Convert a table row to HTML."""
-        # Remove leading and trailing pipes
-        line = line.strip().strip('|')
-        cells = [cell.strip() for cell in line.split('|')]
-
-        # Check if it's a separator line
-        if all(re.match(r'^[\-:]+$', cell) for cell in cells):
-            return ''  # Skip separator lines
-
-        # Determine if it's a header (simplified: first row is header)
-        tag = 'th' if not self.in_table else 'td'
-
-        row_html = '<tr>'
+    def convert_table_cells(self, cells):
+        """Convert the cells of a table row to HTML, one string per cell."""
+        converted = []
         for cell in cells:
+            # Plain text cells only need escaping
+            if INLINE_SPECIAL_PATTERN.search(cell) is None:
+                converted.append(self.escape_html(cell))
+                continue
             # Convert <br> tags to actual line breaks in table cells
             cell_content = cell.replace('<br>', '\n')
             # Convert the cell content and then replace newlines with <br> for HTML rendering
-            converted_cell = self.convert_inline(cell_content)
-            # Replace actual line breaks with HTML line breaks for proper display
-            converted_cell = converted_cell.replace('\n', '<br>')
-            row_html += f'<{tag}>{converted_cell}</{tag}>'
-        row_html += '</tr>'
+            converted.append(self.convert_inline(cell_content).replace('\n', '<br>'))
+        return converted
+
+    def convert_table_row(self, cells):
+        """Convert the cells of a table row to HTML."""
+        # Header detection is simplified: every rendered row uses data cells
+        return create_table_row(self.convert_table_cells(cells))
+
+    def add_table_row(self, cells, html_lines):
+        """
+        Add a converted row to the open table.
+
+        Without a table_data_name rows are emitted right away. Otherwise up to
+        pagination_rows rows are held back; once a table grows beyond that it
+        is opened as a paginated table showing the first TABLE_PAGE_ROWS rows
+        (plus the first row, repeated on every page), and every row is
+        streamed to its row data file, so only the row count is kept.
+
+        Args:
+            cells: Converted cells of the row
+            html_lines: Output lines of the current block, extended in place
+        """
+        if self.table_data_name is None:
+            html_lines.append(create_table_row(cells))
+        elif self.table_data is not None:
+            self.table_data.write_row(cells)
+            self.tables[-1] += 1
+        elif len(self.table_rows) < self.pagination_rows:
+            self.table_rows.append(cells)
+        else:
+            self.table_rows.append(cells)
+            self.tables.append(len(self.table_rows))
+            data_name = self.table_data_name + TABLE_DATA_SUFFIX.format(len(self.tables))
+            self.table_data = TableDataWriter(Path(self.table_data_dir) / data_name)
+            for row in self.table_rows:
+                self.table_data.write_row(row)
+            html_lines.append(f'<table class="table table-bordered paginated-table" data-rows="{data_name}" '
+                              f'data-page-rows="{TABLE_PAGE_ROWS}">')
+            html_lines.extend(create_table_row(row) for row in self.table_rows[:TABLE_PAGE_ROWS + 1])
+            self.table_rows = []
+
+    def close_table(self):
+        """Close the open table and return its remaining output lines."""
+        html_lines = []
+        if self.table_data_name is not None and self.table_data is None:
+            html_lines.append(TABLE_OPEN_TAG)
+            html_lines.extend(create_table_row(row) for row in self.table_rows)
+        html_lines.append('</table>')
+        if self.table_data is not None:
+            self.table_data.close()
+        self.in_table = False
+        self.table_rows = []
+        self.table_data = None
+        return html_lines
+
+
+def match_link(text, start):
+    """
+    Match a link [label](url) starting at a '['.
+
+    The label ends at the first ']' that is not part of an image, so images
+    (e.g. badges) can be linked together with text.
+
+    Args:
+        text: Inline markdown text
+        start: Position of the '['
+
+    Returns:
+        Tuple of (label, url, end position), or None if there is no link
+    """
+    pos = start + 1
+    while True:
+        close = text.find(']', pos)
+        if close < 0:
+            return None
+        image = None
+        image_start = text.find('![', pos, close)
+        while image_start >= 0:
+            image = IMAGE_PATTERN.match(text, image_start)
+            if image:
+                break
+            image_start = text.find('![', image_start + 2, close)
+        if image is None:
+            break
+        pos = image.end()
 
-        return row_html
+    target = LINK_TARGET_PATTERN.match(text, close + 1)
+    if close == start + 1 or target is None:
+        return None
+    return text[start + 1:close], target.group(1), target.end()
+
+
+def create_table_row(cells):
+    """Wrap converted cells into a table row."""
+    return '<tr><td>' + '</td><td>'.join(cells) + '</td></tr>'
+
+
+# Styles for the converted markdown content, served as one cacheable stylesheet
+DOC_CONTENT_CSS = """/* Clean, modern documentation styles */
+.doc-content {
+	padding: 60px 0;
+	min-height: 600px;
+	background: white;
+}
+
+.content-wrapper {
+	max-width: 900px;
+	margin: 0 auto;
+	padding: 0 40px;
+}
+
+/* Typography */
+.doc-content h1 {
+	color: #192a45;
+	font-size: 2.5rem;
+	font-weight: 700;
+	border-bottom: 3px solid #17B794;
+	padding-bottom: 15px;
+	margin-bottom: 35px;
+}
+
+.doc-content h2 {
+	color: #2c3e50;
+	font-size: 1.8rem;
+	font-weight: 600;
+	margin-top: 45px;
+	margin-bottom: 25px;
+	padding-top: 20px;
+}
+
+.doc-content h3 {
+	color: #34495e;
+	font-size: 1.4rem;
+	font-weight: 600;
+	margin-top: 35px;
+	margin-bottom: 20px;
+}
+
+.doc-content p {
+	font-size: 16px;
+	line-height: 1.8;
+	color: #4a5568;
+	margin: 20px 0;
+}
+
+/* Code blocks */
+.doc-content pre {
+	background: #f7fafc;
+	border: 1px solid #e2e8f0;
+	border-left: 4px solid #17B794;
+	padding: 20px;
+	border-radius: 8px;
+	overflow-x: auto;
+	margin: 25px 0;
+	font-size: 14px;
+}
+
+.doc-content code {
+	background: #f7fafc;
+	padding: 3px 6px;
+	border-radius: 4px;
+	font-family: 'Monaco', 'Courier New', monospace;
+	font-size: 0.9em;
+	color: #e53e3e;
+}
+
+.doc-content pre code {
+	background: transparent;
+	padding: 0;
+	color: #2d3748;
+}
+
+/* Syntax highlighting, see syntax_highlight.py */
+.doc-content pre .hl-kw { color: #805ad5; font-weight: 600; }
+.doc-content pre .hl-str { color: #2f855a; }
+.doc-content pre .hl-com { color: #718096; font-style: italic; }
+.doc-content pre .hl-num,
+.doc-content pre .hl-lit { color: #c05621; }
+.doc-content pre .hl-fn,
+.doc-content pre .hl-tag { color: #2b6cb0; }
+.doc-content pre .hl-var,
+.doc-content pre .hl-attr,
+.doc-content pre .hl-key { color: #b7791f; }
+.doc-content pre .hl-opt,
+.doc-content pre .hl-meta { color: #0e7c61; }
+
+/* Blockquotes */
+.doc-content blockquote {
+	background: #f0fdf4;
+	border-left: 4px solid #17B794;
+	margin: 25px 0;
+	padding: 20px 25px;
+	color: #2d3748;
+	font-style: italic;
+	border-radius: 0 8px 8px 0;
+}
+
+/* Lists */
+.doc-content ul, .doc-content ol {
+	margin: 20px 0;
+	padding-left: 35px;
+	color: #4a5568;
+}
+
+.doc-content li {
+	margin: 10px 0;
+	line-height: 1.7;
+}
+
+/* Images */
+.doc-content img {
+	margin: 30px auto;
+	display: block;
+}
+
+.doc-content .guide-image {
+	max-width: 100%;
+	height: auto;
+	border: 2px solid #e2e8f0;
+	border-radius: 12px;
+	box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+	margin: 35px auto;
+	display: block;
+	transition: all 0.3s ease;
+}
+
+.doc-content .guide-image:hover {
+	transform: translateY(-2px);
+	box-shadow: 0 8px 24px rgba(0,0,0,0.12);
+	border-color: #008793;
+}
+
+/* Links */
+.doc-content a {
+	color: #17B794;
+	text-decoration: none;
+	font-weight: 500;
+	transition: all 0.2s ease;
+	border-bottom: 1px solid transparent;
+}
+
+.doc-content a:hover {
+	color: #0e7c61;
+	border-bottom-color: #17B794;
+}
+
+/* Tables */
+.doc-content table {
+	width: 100%;
+	margin: 30px 0;
+	border-collapse: collapse;
+	border: 1px solid #e2e8f0;
+	border-radius: 8px;
+	overflow: hidden;
+}
+
+.doc-content table th {
+	background: #f7fafc;
+	padding: 12px 15px;
+	text-align: left;
+	font-weight: 600;
+	color: #2d3748;
+	border-bottom: 2px solid #e2e8f0;
+}
+
+.doc-content table td {
+	padding: 12px 15px;
+	border-bottom: 1px solid #e2e8f0;
+}
+
+.doc-content table tr:last-child td {
+	border-bottom: none;
+}
+
+.doc-content table.paginated-table {
+	margin-bottom: 10px;
+}
+
+.doc-content .table-pager {
+	display: flex;
+	align-items: center;
+	justify-content: space-between;
+	margin-bottom: 30px;
+	color: #4a5568;
+	font-size: 14px;
+}
+
+/* Horizontal rule */
+.doc-content hr {
+	border: none;
+	height: 2px;
+	background: linear-gradient(to right, transparent, #e2e8f0, transparent);
+	margin: 50px 0;
+}
+
+/* Responsive adjustments */
+@media (max-width: 768px) {
+	.content-wrapper {
+		padding: 0 20px;
+	}
+
+	.doc-content h1 {
+		font-size: 2rem;
+	}
+
+	.doc-content h2 {
+		font-size: 1.5rem;
+	}
+
+	.doc-content h3 {
+		font-size: 1.2rem;
+	}
+}
+"""
+
+# Bundles referenced by the page template, by logical name; asset_bundler.py
+# writes them under content-hashed names recorded in the asset manifest
+ASSET_MANIFEST = 'asset-manifest.json'
+CSS_BUNDLE = 'css/site.css'
+JS_BUNDLE = 'js/site.js'
+
+# Files inlined into pages in place of their w3-include-html placeholders
+INCLUDE_FILES = ('navbar.html', 'footer.html')
+
+# Unresolved include placeholders, and regions inlined by an earlier build
+INCLUDE_PATTERN = re.compile(
+    r'''<div w3-include-html=(["'])(?P<ref>[^"']+)\1></div>'''
+    r'|<!-- include: (?P<resolved>\S+) -->.*?<!-- /include: (?P=resolved) -->', re.S)
+INCLUDE_SCRIPT_PATTERN = re.compile(
+    r'''[ \t]*(?:<!-- W3 Include -->\n[ \t]*)?<script src=(["'])(?:\.\.?/)*js/w3-include\.js\1></script>\n?''')
+RELATIVE_HREF_PATTERN = re.compile(r'href="(?![a-z][a-z0-9+.-]*:|/|#|\.\./)')
+
+# Per-guide detail files of the guide index, relative to the guide output directory
+GUIDE_DETAIL_DIR = 'guides'
+
+# Bump whenever the layout of index.json changes
+GUIDE_INDEX_VERSION = 2
 
+# Length of the guide descriptions in the listing
+GUIDE_SUMMARY_LENGTH = 150
 
-def create_coming_soon_template(title="Document", relative_path=""):
+# Index description of disabled guides
+COMING_SOON_DESCRIPTION = 'This guide is currently under development and will be available soon.'
+
+# Mark where the page title and table of contents go in precompiled template segments
+TITLE_SLOT = '\x00title\x00'
+TOC_SLOT = '\x00toc\x00'
+
+
+def create_coming_soon_template(title="Document", relative_path="", site_dir="."):
     """
     Create a "Coming Soon" template for disabled guides.
 
     Args:
         title: The title for the HTML document
         relative_path: The relative path from the HTML file to the root directory
+        site_dir: The root directory of the site whose template is used
 
     Returns:
         Complete HTML document as string
@@ -379,10 +1089,10 @@ def create_coming_soon_template(title="Document", relative_path=""):
         </a>
     </div>"""
 
-    return create_html_template(coming_soon_content, title, relative_path)
+    return create_html_template(coming_soon_content, title, relative_path, site_dir=site_dir)
 
 
-def create_html_template(content, title="Document", relative_path=""):
+def create_html_template(content, title="Document", relative_path="", toc="", site_dir="."):
     """
     Wrap the converted markdown content in the website's HTML template.
 
@@ -390,15 +1100,215 @@ def create_html_template(content, title="Document", relative_path=""):
         content: The HTML content converted from markdown
         title: The title for the HTML document
         relative_path: The relative path from the HTML file to the root directory
+        toc: Sidebar table of contents links, see create_toc()
+        site_dir: The root directory of the site whose asset bundles and includes are used
 
     Returns:
         Complete HTML document as string
     """
+    head, tail = create_html_template_parts(title, relative_path, toc, site_dir)
+    return head + content + tail
+
+
+def create_html_template_parts(title="Document", relative_path="", toc="", site_dir="."):
+    """
+    Create the parts of the website's HTML template before and after the content.
+
+    Args:
+        title: The title for the HTML document
+        relative_path: The relative path from the HTML file to the root directory
+        toc: Sidebar table of contents links, see create_toc()
+        site_dir: The root directory of the site whose asset bundles and includes are used
+
+    Returns:
+        Tuple of (head, tail) strings to be written around the content
+    """
     # Calculate the path prefix based on the depth of the file
     path_depth = relative_path.count('/') if relative_path else 0
-    path_prefix = '../' * path_depth if path_depth > 0 else ''
 
-    html_template = f"""<!DOCTYPE HTML>
+    head_segments, tail_segments = get_template_segments(path_depth, str(site_dir))
+    return title.join(head_segments), toc.join(tail_segments)
+
+
+def create_toc(headings):
+    """
+    Render the sidebar table of contents of a converted guide.
+
+    Args:
+        headings: (level, id, text) tuples recorded by MarkdownToHTMLConverter
+
+    Returns:
+        HTML links to the headings up to TOC_MAX_LEVEL, one per line
+    """
+    links = []
+    for level, heading_id, text in headings:
+        if level <= TOC_MAX_LEVEL:
+            text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+            links.append(f'\n\t\t\t<a href="#{heading_id}"><i class="ti-angle-right"></i> {text}</a>')
+    return ''.join(links)
+
+
+def build_heading_tree(headings):
+    """
+    Nest a flat list of headings by level.
+
+    Args:
+        headings: (level, id, text) tuples in document order
+
+    Returns:
+        List of heading dictionaries, each with the headings below it as children
+    """
+    tree = []
+    stack = []
+    for level, heading_id, text in headings:
+        node = {'level': level, 'id': heading_id, 'text': text, 'children': []}
+        while stack and stack[-1]['level'] >= level:
+            stack.pop()
+        (stack[-1]['children'] if stack else tree).append(node)
+        stack.append(node)
+    return tree
+
+
+def get_heading_index_path(output_file_path):
+    """Return the path of the heading index belonging to a generated HTML page."""
+    output_file_path = Path(output_file_path)
+    return output_file_path.with_name(output_file_path.stem + HEADING_INDEX_SUFFIX)
+
+
+def write_heading_index(output_file_path, title, slug, headings, links=(), images=()):
+    """
+    Write the heading tree of a guide as JSON next to its HTML page.
+
+    The outgoing links and images are recorded as well, so link_checker.py can
+    validate every reference without parsing the generated HTML.
+
+    Args:
+        output_file_path: Path of the generated HTML file
+        title: The guide title
+        slug: The guide slug
+        headings: (level, id, text) tuples recorded by MarkdownToHTMLConverter
+        links: href of every link in the guide, recorded by MarkdownToHTMLConverter
+        images: src of every image in the guide, relative to the page
+    """
+    heading_index = {
+        'title': title,
+        'slug': slug,
+        'headings': build_heading_tree(headings),
+        'links': list(links),
+        'images': list(images)
+    }
+    write_if_changed(get_heading_index_path(output_file_path), json.dumps(heading_index, indent=2, ensure_ascii=False))
+
+
+def get_table_data_paths(output_file_path):
+    """Return the row data files of the paginated tables of a generated HTML page that exist."""
+    output_file_path = Path(output_file_path)
+    return sorted(output_file_path.parent.glob(output_file_path.stem + TABLE_DATA_SUFFIX.format('*')))
+
+
+def get_table_data_path(output_file_path, number):
+    """Return the path of the row data of the paginated table with the given number (from 1) of a page."""
+    output_file_path = Path(output_file_path)
+    return output_file_path.with_name(output_file_path.stem + TABLE_DATA_SUFFIX.format(number))
+
+
+def remove_stale_table_data(output_file_path, table_count):
+    """
+    Remove the row data of paginated tables a guide no longer has.
+
+    Args:
+        output_file_path: Path of the generated HTML file
+        table_count: Number of paginated tables of the guide, see MarkdownToHTMLConverter.tables
+    """
+    current = {get_table_data_path(output_file_path, number).name for number in range(1, table_count + 1)}
+    for stale_path in get_table_data_paths(output_file_path):
+        if stale_path.name not in current:
+            stale_path.unlink()
+
+
+class TableDataWriter:
+    """
+    Streams the rows of a paginated table into its row data file, {"rows": [[cells...], ...]}.
+
+    Rows go to a temporary file that replaces the row data once the table is
+    complete, unless the row data already has the same content.
+    """
+
+    def __init__(self, data_path):
+        """
+        Args:
+            data_path: Path of the row data file, see get_table_data_path
+        """
+        self.data_path = Path(data_path)
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        self.temp_path = self.data_path.with_name(self.data_path.name + '.tmp')
+        self.file = open(self.temp_path, 'w', encoding='utf-8')
+        self.file.write('{"rows":[')
+        self.separator = ''
+
+    def write_row(self, cells):
+        """Append the converted cells of a row."""
+        self.file.write(self.separator + json.dumps(cells, ensure_ascii=False, separators=(',', ':')))
+        self.separator = ','
+
+    def close(self):
+        """Complete the row data file."""
+        self.file.write(']}')
+        self.file.close()
+        replace_if_changed(self.temp_path, self.data_path)
+
+    def discard(self):
+        """Drop the incomplete row data, keeping the previous file."""
+        self.file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=None)
+def get_asset_paths(base_dir="."):
+    """
+    Return the content-hashed paths of the template's asset bundles.
+
+    The bundles are built first if the asset manifest does not list them yet.
+
+    Args:
+        base_dir: The root directory of the website
+
+    Returns:
+        Dictionary mapping logical bundle names to paths relative to the root directory
+    """
+    try:
+        with open(Path(base_dir) / ASSET_MANIFEST, 'r', encoding='utf-8') as f:
+            assets = json.load(f).get('assets', {})
+    except (OSError, ValueError):
+        assets = {}
+
+    if not all(name in assets for name in (CSS_BUNDLE, JS_BUNDLE)):
+        # Imported here to avoid a circular import
+        from asset_bundler import build_asset_bundles
+        assets = build_asset_bundles(base_dir)['assets']
+    return assets
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_segments(path_depth, site_dir="."):
+    """
+    Precompile the page template for files at a given directory depth.
+
+    Path prefixes are resolved once per depth; the head is split at the title
+    slots so a page only needs a single join to fill in its title.
+
+    Args:
+        path_depth: Number of directories between the HTML file and the root directory
+        site_dir: The root directory of the site whose asset bundles and includes are used
+
+    Returns:
+        Tuple of (head segments, tail segments)
+    """
+    path_prefix = '../' * path_depth
+    title = TITLE_SLOT
+    assets = get_asset_paths(site_dir)
+
+    head = f"""<!DOCTYPE HTML>
 <html>
 <head>
 	<meta charset="utf-8">
@@ -422,21 +1332,8 @@ def create_html_template(content, title="Document", relative_path=""):
 
 	<link href="https://fonts.googleapis.com/css?family=Raleway:100,300,400,700" rel="stylesheet">
 
-	<!-- Animate.css -->
-	<link rel="stylesheet" href="{path_prefix}css/animate.css">
-	<!-- Icomoon Icon Fonts-->
-	<link rel="stylesheet" href="{path_prefix}css/icomoon.css">
-	<!-- Themify Icons-->
-	<link rel="stylesheet" href="{path_prefix}css/themify-icons.css">
-	<!-- Bootstrap  -->
-	<link rel="stylesheet" href="{path_prefix}css/bootstrap.css">
-	<!-- Magnific Popup -->
-	<link rel="stylesheet" href="{path_prefix}css/magnific-popup.css">
-	<!-- Owl Carousel  -->
-	<link rel="stylesheet" href="{path_prefix}css/owl.carousel.min.css">
-	<link rel="stylesheet" href="{path_prefix}css/owl.theme.default.min.css">
-	<!-- Theme style  -->
-	<link rel="stylesheet" href="{path_prefix}css/style.css">
+	<!-- Site styles: theme, icon fonts, plugins, documentation content and sidebar -->
+	<link rel="stylesheet" href="{path_prefix}{assets[CSS_BUNDLE]}">
 
 	<!-- Modernizr JS -->
 	<script src="{path_prefix}js/modernizr-2.6.2.min.js"></script>
@@ -446,197 +1343,6 @@ def create_html_template(content, title="Document", relative_path=""):
 	<!--[if lt IE 9]>
 	<script src="{path_prefix}js/respond.min.js"></script>
 	<![endif]-->
-
-	<style>
-		/* Clean, modern documentation styles */
-		.doc-content {{
-			padding: 60px 0;
-			min-height: 600px;
-			background: white;
-		}}
-
-		.content-wrapper {{
-			max-width: 900px;
-			margin: 0 auto;
-			padding: 0 40px;
-		}}
-
-		/* Typography */
-		.doc-content h1 {{
-			color: #192a45;
-			font-size: 2.5rem;
-			font-weight: 700;
-			border-bottom: 3px solid #17B794;
-			padding-bottom: 15px;
-			margin-bottom: 35px;
-		}}
-
-		.doc-content h2 {{
-			color: #2c3e50;
-			font-size: 1.8rem;
-			font-weight: 600;
-			margin-top: 45px;
-			margin-bottom: 25px;
-			padding-top: 20px;
-		}}
-
-		.doc-content h3 {{
-			color: #34495e;
-			font-size: 1.4rem;
-			font-weight: 600;
-			margin-top: 35px;
-			margin-bottom: 20px;
-		}}
-
-		.doc-content p {{
-			font-size: 16px;
-			line-height: 1.8;
-			color: #4a5568;
-			margin: 20px 0;
-		}}
-
-		/* Code blocks */
-		.doc-content pre {{
-			background: #f7fafc;
-			border: 1px solid #e2e8f0;
-			border-left: 4px solid #17B794;
-			padding: 20px;
-			border-radius: 8px;
-			overflow-x: auto;
-			margin: 25px 0;
-			font-size: 14px;
-		}}
-
-		.doc-content code {{
-			background: #f7fafc;
-			padding: 3px 6px;
-			border-radius: 4px;
-			font-family: 'Monaco', 'Courier New', monospace;
-			font-size: 0.9em;
-			color: #e53e3e;
-		}}
-
-		.doc-content pre code {{
-			background: transparent;
-			padding: 0;
-			color: #2d3748;
-		}}
-
-		/* Blockquotes */
-		.doc-content blockquote {{
-			background: #f0fdf4;
-			border-left: 4px solid #17B794;
-			margin: 25px 0;
-			padding: 20px 25px;
-			color: #2d3748;
-			font-style: italic;
-			border-radius: 0 8px 8px 0;
-		}}
-
-		/* Lists */
-		.doc-content ul, .doc-content ol {{
-			margin: 20px 0;
-			padding-left: 35px;
-			color: #4a5568;
-		}}
-
-		.doc-content li {{
-			margin: 10px 0;
-			line-height: 1.7;
-		}}
-
-		/* Images */
-		.doc-content img {{
-			margin: 30px auto;
-			display: block;
-		}}
-
-		.doc-content .guide-image {{
-			max-width: 100%;
-			height: auto;
-			border: 2px solid #e2e8f0;
-			border-radius: 12px;
-			box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-			margin: 35px auto;
-			display: block;
-			transition: all 0.3s ease;
-		}}
-
-		.doc-content .guide-image:hover {{
-			transform: translateY(-2px);
-			box-shadow: 0 8px 24px rgba(0,0,0,0.12);
-			border-color: #008793;
-		}}
-
-		/* Links */
-		.doc-content a {{
-			color: #17B794;
-			text-decoration: none;
-			font-weight: 500;
-			transition: all 0.2s ease;
-			border-bottom: 1px solid transparent;
-		}}
-
-		.doc-content a:hover {{
-			color: #0e7c61;
-			border-bottom-color: #17B794;
-		}}
-
-		/* Tables */
-		.doc-content table {{
-			width: 100%;
-			margin: 30px 0;
-			border-collapse: collapse;
-			border: 1px solid #e2e8f0;
-			border-radius: 8px;
-			overflow: hidden;
-		}}
-
-		.doc-content table th {{
-			background: #f7fafc;
-			padding: 12px 15px;
-			text-align: left;
-			font-weight: 600;
-			color: #2d3748;
-			border-bottom: 2px solid #e2e8f0;
-		}}
-
-		.doc-content table td {{
-			padding: 12px 15px;
-			border-bottom: 1px solid #e2e8f0;
-		}}
-
-		.doc-content table tr:last-child td {{
-			border-bottom: none;
-		}}
-
-		/* Horizontal rule */
-		.doc-content hr {{
-			border: none;
-			height: 2px;
-			background: linear-gradient(to right, transparent, #e2e8f0, transparent);
-			margin: 50px 0;
-		}}
-
-		/* Responsive adjustments */
-		@media (max-width: 768px) {{
-			.content-wrapper {{
-				padding: 0 20px;
-			}}
-
-			.doc-content h1 {{
-				font-size: 2rem;
-			}}
-
-			.doc-content h2 {{
-				font-size: 1.5rem;
-			}}
-
-			.doc-content h3 {{
-				font-size: 1.2rem;
-			}}
-		}}
-	</style>
 </head>
 <body>
 
@@ -658,43 +1364,132 @@ def create_html_template(content, title="Document", relative_path=""):
 		</div>
 	</header>
 
-	<!-- Dynamic Sidebar will be inserted here by JavaScript -->
-
 	<!-- Main Content -->
 	<section class="main doc-content ">
   		<div class="content-wrapper">
- 			{content}
+ 			"""
+
+    tail = f"""
   		</div>
 	</section>
 
+	<!-- Sidebar with the table of contents, written once the content is converted -->
+	<div class="sidenav" id="dynamicSidebar">
+		<div class="sidenav-trademark">
+			<div class="trademark-title">ECLIPSE FREE BIRD TOOLS&trade;</div>
+		</div>
+		<nav class="sidenav-navigation" aria-label="Table of contents">
+			<a href="{path_prefix}documentation.html#user-guides"><i class="ti-list"></i> All Guides</a>{TOC_SLOT}
+		</nav>
+		<hr class="sidenav-separator">
+		<div class="sidenav-community">
+			<a href="https://chat.eclipse.org/#/room/%23technology.efbt:matrix.eclipse.org" target="_blank">
+				<i class="ti-comments"></i> Eclipse Chat
+			</a>
+			<a href="mailto:efbt-dev@eclipse.org">
+				<i class="ti-email"></i> Contact Email
+			</a>
+		</div>
+		<hr class="sidenav-separator">
+		<div class="sidenav-github">
+			<a href="https://github.com/eclipse/efbt" target="_blank"><i class="ti-github"></i> GitHub</a>
+		</div>
+	</div>
+
 	<!-- Footer Include -->
 	<div w3-include-html="{path_prefix}footer.html"></div>
 
 </div>
 
-<!-- jQuery -->
-<script src="{path_prefix}js/jquery.min.js"></script>
-<!-- jQuery Easing -->
-<script src="{path_prefix}js/jquery.easing.1.3.js"></script>
-<!-- Bootstrap -->
-<script src="{path_prefix}js/bootstrap.min.js"></script>
-<!-- Waypoints -->
-<script src="{path_prefix}js/jquery.waypoints.min.js"></script>
-<!-- Carousel -->
-<script src="{path_prefix}js/owl.carousel.min.js"></script>
-<!-- Magnific Popup -->
-<script src="{path_prefix}js/jquery.magnific-popup.min.js"></script>
-<script src="{path_prefix}js/magnific-popup-options.js"></script>
-<!-- Main -->
-<script src="{path_prefix}js/main.js"></script>
-<!-- W3 Include -->
-<script src="{path_prefix}js/w3-include.js"></script>
-<!-- Dynamic Sidebar -->
-<script src="{path_prefix}js/dynamic-sidebar.js"></script>
+<!-- Site scripts: jQuery, plugins, main and sidebar scroll behaviour -->
+<script src="{path_prefix}{assets[JS_BUNDLE]}"></script>
 
 </body>
 </html>"""
-    return html_template
+    # Navbar and footer are inlined here instead of being fetched by the browser
+    head = resolve_includes(head, path_depth, base_dir=site_dir)
+    tail = resolve_includes(tail, path_depth, base_dir=site_dir)
+
+    return tuple(head.split(TITLE_SLOT)), tuple(tail.split(TOC_SLOT))
+
+
+def load_include(include_name, path_depth=0, base_dir="."):
+    """
+    Read an include file and adjust its relative links for the including page.
+
+    Args:
+        include_name: File name of the include relative to the root directory
+        path_depth: Directory depth of the including page
+        base_dir: The root directory of the website
+
+    Returns:
+        Include content as string
+    """
+    with open(Path(base_dir) / include_name, 'r', encoding='utf-8') as f:
+        content = f.read().rstrip('\n')
+
+    # Pages in subdirectories need their relative links to go up to the root
+    if path_depth:
+        content = RELATIVE_HREF_PATTERN.sub('href="' + '../' * path_depth, content)
+    return content
+
+
+def resolve_includes(html, path_depth=0, page_name=None, base_dir="."):
+    """
+    Inline w3-include-html includes into a page at build time.
+
+    Both unresolved <div w3-include-html="..."> placeholders and regions inlined
+    by an earlier build are (re)filled, so the result can be resolved again
+    after an include file changed. The w3-include.js script tag is dropped.
+
+    Args:
+        html: The page HTML
+        path_depth: Directory depth of the page
+        page_name: File name of the page, used to mark the active menu item
+        base_dir: The root directory of the website
+
+    Returns:
+        Page HTML with includes inlined
+    """
+    def replace_include(match):
+        include_ref = match.group('ref') or match.group('resolved')
+        include_name = include_ref.lstrip('./')
+        try:
+            content = load_include(include_name, path_depth, base_dir)
+        except OSError:
+            print(f"Warning: include '{include_name}' not found")
+            return match.group(0)
+
+        if page_name:
+            content = content.replace(f'<li><a href="{page_name}">', f'<li class="active"><a href="{page_name}">')
+        return f'<!-- include: {include_ref} -->\n<div>\n{content}\n</div>\n<!-- /include: {include_ref} -->'
+
+    html = INCLUDE_PATTERN.sub(replace_include, html)
+    return INCLUDE_SCRIPT_PATTERN.sub('', html)
+
+
+def resolve_page_includes(base_dir="."):
+    """
+    Inline the navbar and footer into the hand-written top-level pages.
+
+    The pages are tracked sources, so each keeps its line endings and is only
+    rewritten when an include changed; resolving them again is a no-op.
+
+    Args:
+        base_dir: The root directory of the website
+    """
+    for page_path in sorted(Path(base_dir).glob('*.html')):
+        if page_path.name in INCLUDE_FILES:
+            continue
+
+        with open(page_path, 'r', encoding='utf-8', newline='') as f:
+            html = f.read()
+        newline = '\r\n' if '\r\n' in html else '\n'
+        resolved = resolve_includes(html.replace('\r\n', '\n'), 0, page_path.name, base_dir)
+        resolved = resolved.replace('\n', newline)
+        if resolved != html:
+            write_html_file(page_path, [resolved])
+            print(f"Resolved includes in: {page_path}")
 
 
 def extract_description_from_markdown(markdown_content):
@@ -707,7 +1502,22 @@ def extract_description_from_markdown(markdown_content):
     Returns:
         Description string or empty string if not found
     """
-    lines = markdown_content.split('\n')
+    return extract_description_from_lines(markdown_content.split('\n'))
+
+
+def extract_description_from_lines(lines):
+    """
+    Extract the first paragraph line from markdown lines as description.
+
+    Stops reading at the first matching line, so only the top of a file
+    object is consumed.
+
+    Args:
+        lines: Iterable of markdown lines
+
+    Returns:
+        Description string or empty string if not found
+    """
     description = ""
 
     for line in lines:
@@ -723,13 +1533,41 @@ def extract_description_from_markdown(markdown_content):
     return description
 
 
-def convert_markdown_to_html(markdown_file_path, output_file_path):
+def write_html_file(output_file_path, chunks):
+    """
+    Stream HTML chunks to a file, replacing it atomically once complete.
+
+    Args:
+        output_file_path: Path where the HTML file should be saved
+        chunks: Iterable of HTML strings
+    """
+    output_file_path = Path(output_file_path)
+
+    # Create output directory if it doesn't exist
+    output_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = output_file_path.with_name(output_file_path.name + '.tmp')
+    try:
+        # Newlines are written as given, so the bytes match write_if_changed's comparison
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, output_file_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def convert_markdown_to_html(markdown_file_path, output_file_path, image_catalog=None, render_cache=None):
     """
     Convert a single markdown file to HTML.
 
     Args:
         markdown_file_path: Path to the input markdown file
         output_file_path: Path where the HTML file should be saved
+        image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+        render_cache: Optional render_cache.DiskRenderCache; a cached conversion of the
+                      same source is restored instead of converting the file again
 
     Returns:
         Dictionary with guide metadata if successful, None otherwise
@@ -748,101 +1586,372 @@ def convert_markdown_to_html(markdown_file_path, output_file_path):
         if slug in DISABLED_GUIDES:
             print(f"        Guide '{slug}' is disabled - creating 'Coming Soon' page")
 
-            # Create a "Coming Soon" page instead
+            # Create a "Coming Soon" page instead (this will overwrite any existing content)
             full_html = create_coming_soon_template(title, relative_path)
-
-            # Create output directory if it doesn't exist
-            output_dir = Path(output_file_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write the HTML file (this will overwrite any existing content)
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(full_html)
+            write_html_file(output_file_path, [full_html])
+            write_heading_index(output_file_path, title, slug, [])
+            remove_stale_table_data(output_file_path, 0)
 
             # Return metadata for index generation (marked as disabled)
-            return {
-                'title': title,
-                'description': 'This guide is currently under development and will be available soon.',
-                'filename': Path(output_file_path).name,
-                'path': str(Path(output_file_path).relative_to(Path('.'))),
-                'last_modified': datetime.now().isoformat(),
-                'slug': slug,
-                'disabled': True,
-                'status': 'coming_soon'
-            }
+            return create_guide_metadata(title, COMING_SOON_DESCRIPTION, output_file_path, slug, disabled=True)
+
+        # The search terms of the guide are collected while converting it
+        from search_index import GuidePostings, write_guide_postings
+
+        # Restore an identical earlier conversion from the render cache
+        if render_cache:
+            cache_key = render_cache.get_key(Path(markdown_file_path).read_bytes(), relative_path)
+            entry = render_cache.get(cache_key)
+            if entry:
+                print(f"        Restored '{slug}' from the render cache", flush=True)
+                copy_if_changed(render_cache.get_attachment_path(cache_key, 'page.html'), output_file_path)
+                write_heading_index(output_file_path, title, slug, entry['headings'], entry['links'], entry['images'])
+                for number in range(1, entry['tables'] + 1):
+                    copy_if_changed(render_cache.get_attachment_path(cache_key, f'table-{number}.json'),
+                                    get_table_data_path(output_file_path, number))
+                remove_stale_table_data(output_file_path, entry['tables'])
+                write_guide_postings(relative_path, entry['search'])
+                return create_guide_metadata(title, entry['description'], output_file_path, slug)
 
         # Normal processing for enabled guides
-        # Read the markdown file
+        # Extract description from the top of the markdown file
         with open(markdown_file_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
-
-        # Convert markdown to HTML using our custom converter
-        converter = MarkdownToHTMLConverter()
-        html_content = converter.convert(markdown_content)
+            description = extract_description_from_lines(f)
 
-        # Extract description from markdown content
-        description = extract_description_from_markdown(markdown_content)
-
-        # Wrap in HTML template with proper path prefixes
-        full_html = create_html_template(html_content, title, relative_path)
-
-        # Create output directory if it doesn't exist
-        output_dir = Path(output_file_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write the HTML file
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        # Stream the converted markdown into the HTML template with proper path prefixes
+        search_postings = GuidePostings()
+        converter = MarkdownToHTMLConverter(image_catalog, Path(output_file_path).stem,
+                                            search_postings=search_postings,
+                                            table_data_dir=Path(output_file_path).parent)
+        with open(markdown_file_path, 'r', encoding='utf-8') as f:
+            write_html_file(output_file_path, stream_guide_page(converter, f, title, relative_path))
+        write_heading_index(output_file_path, title, slug, converter.headings, converter.links, converter.images)
+        remove_stale_table_data(output_file_path, len(converter.tables))
+        search_postings = search_postings.to_dict()
+        write_guide_postings(relative_path, search_postings)
+
+        if render_cache:
+            # The written page and row data files are copied into the cache as attachments
+            attachments = {f'table-{number}.json': get_table_data_path(output_file_path, number)
+                           for number in range(1, len(converter.tables) + 1)}
+            attachments['page.html'] = output_file_path
+            try:
+                render_cache.put(cache_key, {
+                    'description': description,
+                    'headings': converter.headings,
+                    'links': converter.links,
+                    'images': converter.images,
+                    'tables': len(converter.tables),
+                    'search': search_postings
+                }, attachments)
+            except OSError as e:
+                print(f"Warning: could not write {markdown_file_path} to the render cache: {e}")
 
         # Return metadata for index generation
-        return {
-            'title': title,
-            'description': description,
-            'filename': Path(output_file_path).name,
-            'path': str(Path(output_file_path).relative_to(Path('.'))),
-            'last_modified': datetime.now().isoformat(),
-            'slug': slug,
-            'disabled': False,
-            'status': 'available'
-        }
+        return create_guide_metadata(title, description, output_file_path, slug)
 
     except Exception as e:
         print(f"Error converting {markdown_file_path}: {str(e)}")
         return None
 
 
-def generate_guide_index(guides_metadata, output_dir="user-guide"):
+def stream_guide_page(converter, lines, title, relative_path):
+    """
+    Convert markdown lines into a complete guide page, chunk by chunk.
+
+    The sidebar table of contents follows the content in the page, so it is
+    rendered from the headings the converter recorded once the content is done.
+
+    Args:
+        converter: A fresh MarkdownToHTMLConverter
+        lines: Iterable of markdown lines
+        title: The title for the HTML document
+        relative_path: The relative path from the HTML file to the root directory
+
+    Yields:
+        HTML chunks of the page
+    """
+    head, _ = create_html_template_parts(title, relative_path)
+    yield head
+    yield from converter.convert_stream(lines)
+    _, tail = create_html_template_parts(title, relative_path, create_toc(converter.headings))
+    yield tail
+
+
+def create_guide_metadata(title, description, output_file_path, slug, disabled=False):
+    """
+    Create the index metadata for a converted guide.
+
+    Args:
+        title: The guide title
+        description: The guide description
+        output_file_path: Path of the generated HTML file
+        slug: The guide slug
+        disabled: Whether the guide was rendered as a "Coming Soon" page
+
+    Returns:
+        Dictionary with guide metadata
+    """
+    return {
+        'title': title,
+        'description': description,
+        'filename': Path(output_file_path).name,
+        'path': str(Path(output_file_path).relative_to(Path('.'))),
+        'slug': slug,
+        'disabled': disabled,
+        'status': 'coming_soon' if disabled else 'available'
+    }
+
+
+def get_commit_dates(source_path, names=None):
+    """
+    Look up the date of the last commit of files that have no local changes.
+
+    Args:
+        source_path: Path of the markdown source directory
+        names: Paths relative to source_path to look up one by one, or None to
+               read the log of the whole directory at once
+
+    Returns:
+        Dictionary mapping relative path to an ISO 8601 commit date
     """
-    Generate an index.json file with metadata about all guides.
+    commit_dates = {}
+    pathspec = names if names is not None else ['.']
+    try:
+        if names is None:
+            # Newest commits come first, so the first date seen for a file is its latest;
+            # merges are skipped here as in the per-file lookup, so both agree
+            log = subprocess.run(['git', 'log', '--no-merges', '--format=%x00%cI', '--name-only', '--relative',
+                                  '--', '.'],
+                                 cwd=source_path, capture_output=True, text=True, check=True).stdout
+            for commit in log.split('\x00')[1:]:
+                date, *commit_names = commit.strip().split('\n')
+                for name in commit_names:
+                    if name:
+                        commit_dates.setdefault(name, date)
+        else:
+            for name in names:
+                date = subprocess.run(['git', 'log', '-1', '--no-merges', '--format=%cI', '--', name],
+                                      cwd=source_path, capture_output=True, text=True, check=True).stdout.strip()
+                if date:
+                    commit_dates[name] = date
+        dirty = subprocess.run(['git', 'diff', '--name-only', '--relative', 'HEAD', '--'] + pathspec,
+                               cwd=source_path, capture_output=True, text=True, check=True).stdout.split('\n')
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    for name in dirty:
+        commit_dates.pop(name, None)
+    return commit_dates
+
+
+def get_source_dates(markdown_files, source_dir="markdown_content", known_dates=None):
+    """
+    Determine when each markdown file last changed, reproducibly.
+
+    Files committed without local changes get the date of their last commit,
+    so a fresh checkout produces the same dates; other files (and all files
+    outside a git repository) get their modification time. Files that no
+    longer exist are left out.
 
     Args:
-        guides_metadata: List of guide metadata dictionaries
+        markdown_files: Paths of the markdown files
+        source_dir: The directory containing markdown files
+        known_dates: Optional dictionary of the dates determined by an earlier call,
+                     updated in place; only the files missing from it are looked
+                     up, so a caller drops the files that changed since
+
+    Returns:
+        Dictionary mapping each path (as given) to an ISO 8601 UTC timestamp
+    """
+    source_path = Path(source_dir)
+    if known_dates is None:
+        known_dates = {}
+    missing = [markdown_file_path for markdown_file_path in markdown_files if markdown_file_path not in known_dates]
+
+    if missing:
+        names = [Path(markdown_file_path).relative_to(source_path).as_posix() for markdown_file_path in missing]
+        # Refreshing a few files is cheaper one by one than reading the whole log
+        commit_dates = get_commit_dates(source_path, names if known_dates else None)
+        for markdown_file_path, key in zip(missing, names):
+            if key in commit_dates:
+                date = datetime.fromisoformat(commit_dates[key])
+            else:
+                try:
+                    date = datetime.fromtimestamp(int(os.stat(markdown_file_path).st_mtime), timezone.utc)
+                except FileNotFoundError:
+                    # Deleted while building; the next build drops the guide
+                    continue
+            known_dates[markdown_file_path] = date.astimezone(timezone.utc).isoformat()
+
+    return {markdown_file_path: known_dates[markdown_file_path] for markdown_file_path in markdown_files
+            if markdown_file_path in known_dates}
+
+
+def create_guide_summary(description, max_length=GUIDE_SUMMARY_LENGTH):
+    """
+    Shorten a guide description for the guide listing.
+
+    Args:
+        description: The full guide description
+        max_length: Maximum number of characters kept
+
+    Returns:
+        The description, truncated with '...' if it is longer than max_length
+    """
+    if len(description) <= max_length:
+        return description
+    return description[:max_length].strip() + '...'
+
+
+def generate_guide_index(guides, output_dir="user-guide", source_dir="markdown_content", source_dates=None):
+    """
+    Generate the guide listing (index.json) and one detail file per guide.
+
+    The listing holds only what the guide cards need; the full metadata of a
+    guide is in guides/<slug>.json. Both are derived from the sources alone,
+    so they are byte-identical between builds of the same sources, and they
+    are only rewritten when their content changes.
+
+    Args:
+        guides: List of (markdown_file_path, guide_metadata) tuples, in listing order
         output_dir: Directory where to save the index.json file
+        source_dir: The directory containing markdown files
+        source_dates: Optional dates of the sources kept between calls, see get_source_dates
     """
+    output_path = Path(output_dir)
+    detail_path = output_path / GUIDE_DETAIL_DIR
+    dates = get_source_dates([markdown_file_path for markdown_file_path, _ in guides], source_dir, source_dates)
+
+    listing = []
+    for markdown_file_path, guide_metadata in guides:
+        if markdown_file_path not in dates:
+            # The source was deleted
+            continue
+        last_modified = dates[markdown_file_path]
+        detail = f"{output_path.name}/{GUIDE_DETAIL_DIR}/{guide_metadata['slug']}.json"
+        listing.append({
+            'slug': guide_metadata['slug'],
+            'title': guide_metadata['title'],
+            'summary': create_guide_summary(guide_metadata['description']),
+            'path': guide_metadata['path'],
+            'last_modified': last_modified,
+            'disabled': guide_metadata['disabled'],
+            'status': guide_metadata['status'],
+            'detail': detail
+        })
+        guide_detail = dict(guide_metadata, last_modified=last_modified,
+                            headings=get_heading_index_path(guide_metadata['path']).as_posix())
+        write_if_changed(detail_path / f"{guide_metadata['slug']}.json",
+                         json.dumps(guide_detail, indent=2, ensure_ascii=False))
+
+    # Remove detail files of guides that no longer exist
+    slugs = {guide['slug'] for guide in listing}
+    for stale_path in detail_path.glob('*.json'):
+        if stale_path.stem not in slugs:
+            stale_path.unlink()
+
     index_data = {
-        'generated_at': datetime.now().isoformat(),
-        'total_guides': len(guides_metadata),
-        'guides': guides_metadata
+        'version': GUIDE_INDEX_VERSION,
+        'generated_at': max((guide['last_modified'] for guide in listing), default=None),
+        'total_guides': len(listing),
+        'guides': listing
     }
+    index_file = output_path / "index.json"
+    write_if_changed(index_file, json.dumps(index_data, indent=2, ensure_ascii=False))
 
-    # Ensure output directory exists
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    print(f"Generated guide index: {index_file}")
 
-    # Write index.json
-    index_file = Path(output_dir) / "index.json"
-    with open(index_file, 'w', encoding='utf-8') as f:
-        json.dump(index_data, f, indent=2, ensure_ascii=False)
 
-    print(f"Generated guide index: {index_file}")
+def replace_if_changed(temp_path, file_path):
+    """
+    Move a complete temporary file into place, unless the file already has the same content.
+
+    Unchanged files keep their modification time, see write_if_changed.
+
+    Args:
+        temp_path: Path of the temporary file, next to file_path
+        file_path: Path of the file
+    """
+    try:
+        if os.stat(temp_path).st_size == os.stat(file_path).st_size:
+            with open(temp_path, 'rb') as new_file, open(file_path, 'rb') as old_file:
+                while True:
+                    chunk = new_file.read(COMPARE_CHUNK_SIZE)
+                    if chunk != old_file.read(COMPARE_CHUNK_SIZE):
+                        break
+                    if not chunk:
+                        os.unlink(temp_path)
+                        return
+    except OSError:
+        pass
+    os.replace(temp_path, file_path)
+
+
+def copy_if_changed(source_path, file_path):
+    """
+    Atomically copy a file, unless the target already has the same content.
+
+    Args:
+        source_path: Path of the file to copy
+        file_path: Path of the copy
+    """
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        shutil.copyfile(source_path, temp_path)
+        replace_if_changed(temp_path, file_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def write_if_changed(file_path, content):
+    """
+    Atomically write a text file unless it already has the given content.
 
+    Unchanged files keep their modification time, so HTTP validators and
+    precompressed sidecars stay valid; writes never modify a file in place,
+    so files hard-linked into theme worktrees are safe.
 
-def process_markdown_directory(source_dir="markdown_content", base_output_dir="."):
+    Args:
+        file_path: Path of the file
+        content: Text content
+
+    Returns:
+        Size of the content in bytes
+    """
+    file_path = Path(file_path)
+    data = content.encode('utf-8')
+    try:
+        if file_path.stat().st_size == len(data) and file_path.read_bytes() == data:
+            return len(data)
+    except OSError:
+        pass
+    write_html_file(file_path, [content])
+    return len(data)
+
+
+def process_markdown_directory(source_dir="markdown_content", base_output_dir=".", force=False, jobs=1,
+                               profiler=None, render_cache_dir=RENDER_CACHE_DIR,
+                               render_cache_size=RENDER_CACHE_MAX_BYTES):
     """
     Process all markdown files in the source directory and convert them to HTML.
 
+    Files whose source content and build settings are unchanged since the
+    last run (according to the build manifest) are skipped, and their cached
+    metadata is reused for the guide index.
+
     Args:
         source_dir: The directory containing markdown files
         base_output_dir: The base directory for output files
+        force: Convert every file even if the build manifest says it is unchanged
+        jobs: Number of worker processes used for conversion (0 for one per CPU core)
+        profiler: Optional build_profiler.BuildProfiler that converts and times each file
+        render_cache_dir: Directory of the persistent render cache shared by builds, None to disable
+                          it; profiled builds always convert
+        render_cache_size: Size cap of the render cache in bytes
     """
     source_path = Path(source_dir)
     base_output_path = Path(base_output_dir)
@@ -1010,9 +2119,31 @@ Now that you have Eclipse Free BIRD Tools installed and understand the basics:
     print(f"Found {len(markdown_files)} markdown file(s) to convert.")
     print("-" * 50)
 
+    # Minified, content-hashed CSS and JS bundles referenced by every generated page
+    from asset_bundler import build_asset_bundles
+    build_asset_bundles(base_output_path)
+
+    # Image sizes and responsive variants, reprocessed only for changed images
+    from image_pipeline import Image, build_image_catalog, get_catalog_hash
+    if Image is None:
+        print("Pillow is not installed, guide images get sizes but no responsive variants")
+    image_catalog = build_image_catalog(base_output_path)
+
+    manifest_path = base_output_path / BUILD_MANIFEST
+    manifest = load_build_manifest(manifest_path)
+    settings = get_build_settings(get_catalog_hash(image_catalog))
+    previous_files = get_reusable_manifest_files(manifest, settings, force)
+    manifest_files = {}
+
+    render_cache = None
+    if render_cache_dir and not profiler:
+        render_cache = DiskRenderCache(settings, render_cache_dir, render_cache_size)
+
     successful = 0
     failed = 0
-    guides_metadata = []
+    skipped = 0
+    manifest_keys = []
+    pending = []
 
     for md_file in markdown_files:
         # Calculate the relative path from source_dir
@@ -1021,27 +2152,236 @@ Now that you have Eclipse Free BIRD Tools installed and understand the basics:
         # Create the output path (remove markdown_content prefix)
         output_path = base_output_path / relative_path.with_suffix('.html')
 
+        # Skip files that have not changed since the last build
+        manifest_key = relative_path.as_posix()
+        manifest_keys.append(manifest_key)
+        entry = get_unchanged_manifest_entry(md_file, output_path, previous_files.get(manifest_key))
+        if entry:
+            skipped += 1
+            manifest_files[manifest_key] = entry
+        else:
+            pending.append((md_file, output_path, manifest_key))
+
+    conversions = [(md_file, output_path) for md_file, output_path, _ in pending]
+    if profiler:
+        # Profiled conversions run in this process so every stage can be timed
+        with profiler.instrument():
+            results = [profiler.convert_markdown_to_html(md_file, output_path, image_catalog)
+                       for md_file, output_path in conversions]
+    else:
+        # Results arrive in submission order, whatever order the workers finish in
+        results = convert_files(conversions, jobs, image_catalog, render_cache)
+
+    for (md_file, output_path, manifest_key), guide_metadata in zip(pending, results):
         print(f"Converting: {md_file}")
         print(f"        to: {output_path}")
 
-        guide_metadata = convert_markdown_to_html(md_file, output_path)
         if guide_metadata:
             successful += 1
-            guides_metadata.append(guide_metadata)
+            manifest_files[manifest_key] = create_manifest_entry(md_file, guide_metadata)
             print("        ✓ Success")
         else:
             failed += 1
             print("        ✗ Failed")
         print()
 
+    guides = [(source_path / key, manifest_files[key]['metadata']) for key in manifest_keys if key in manifest_files]
+
     # Generate index.json file
-    if guides_metadata:
-        generate_guide_index(guides_metadata)
+    if guides:
+        generate_guide_index(guides, source_dir=source_dir)
+
+    # Merge the converted guides into the search index
+    from search_index import SEARCH_INDEX_FILE, build_search_index
+    if pending or not (Path("user-guide") / SEARCH_INDEX_FILE).exists():
+        searchable = [(source_path / key, manifest_files[key]['metadata']) for key in manifest_keys
+                      if key in manifest_files and not manifest_files[key]['metadata']['disabled']]
+        converted = {manifest_files[key]['metadata']['path'] for _, _, key in pending if key in manifest_files}
+        stats = build_search_index(searchable, changed=converted)
+        print(f"Generated search index: {stats['sections']} sections in {stats['shards']} shards "
+              f"({stats['bytes'] / 1024:.1f} KB)")
+
+    save_build_manifest({'settings': settings, 'files': manifest_files}, manifest_path)
+
+    if render_cache:
+        print_cache_report(render_cache.prune())
 
     print("-" * 50)
+    if skipped:
+        print(f"Skipped {skipped} unchanged file(s)")
     print(f"Conversion complete: {successful} successful, {failed} failed")
 
 
+def convert_files(conversions, jobs=1, image_catalog=None, render_cache=None):
+    """
+    Convert several markdown files, optionally across a pool of worker processes.
+
+    Args:
+        conversions: List of (markdown_file_path, output_file_path) tuples
+        jobs: Number of worker processes; 1 converts in this process and
+              0 uses one worker per CPU core
+        image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+        render_cache: Optional render_cache.DiskRenderCache checked before converting each file
+
+    Returns:
+        List of guide metadata dictionaries (None for failed files),
+        in the same order as conversions
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(conversions))
+
+    sources = [source for source, _ in conversions]
+    outputs = [output for _, output in conversions]
+    convert = functools.partial(convert_markdown_to_html, image_catalog=image_catalog, render_cache=render_cache)
+
+    if jobs <= 1:
+        return list(map(convert, sources, outputs))
+
+    chunksize = max(1, len(conversions) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(convert, sources, outputs, chunksize=chunksize))
+
+
+def hash_file(file_path):
+    """
+    Compute the SHA-256 hex digest of a file's content.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_build_settings(image_hash=None, site_dir="."):
+    """
+    Describe every build input that is shared by all files.
+
+    A change to any of these values invalidates the whole build manifest.
+
+    Args:
+        image_hash: Hash of the image catalog, see image_pipeline.get_catalog_hash
+        site_dir: The root directory of the site whose page template is used
+
+    Returns:
+        Dictionary with the converter version, a hash of the page template
+        shape, the image catalog hash and the disabled guides
+    """
+    template_shape = (create_html_template('{content}', '{title}', 'user-guide/page.html', site_dir=site_dir)
+                      + create_coming_soon_template('{title}', 'user-guide/page.html', site_dir))
+    return {
+        'converter_version': CONVERTER_VERSION,
+        'template_hash': hashlib.sha256(template_shape.encode('utf-8')).hexdigest(),
+        'image_hash': image_hash,
+        'disabled_guides': sorted(DISABLED_GUIDES)
+    }
+
+
+def load_build_manifest(manifest_path):
+    """
+    Load the build manifest written by a previous run.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        Manifest dictionary, empty if the file is missing or unreadable
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def get_reusable_manifest_files(manifest, settings, force=False):
+    """
+    Return the file entries of a previous build that may still be skipped.
+
+    Args:
+        manifest: Manifest dictionary from load_build_manifest
+        settings: Build settings of this build, see get_build_settings
+        force: Whether every file is rebuilt anyway
+
+    Returns:
+        Dictionary of file entries; empty when forced or when any build setting changed
+    """
+    if force or manifest.get('settings') != settings:
+        return {}
+    return manifest.get('files', {})
+
+
+def save_build_manifest(manifest, manifest_path):
+    """
+    Atomically write the build manifest.
+
+    Args:
+        manifest: Manifest dictionary
+        manifest_path: Path to the manifest file
+    """
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, manifest_path)
+
+
+def create_manifest_entry(markdown_file_path, guide_metadata):
+    """
+    Create the build manifest entry for a freshly converted file.
+
+    Args:
+        markdown_file_path: Path to the source markdown file
+        guide_metadata: Metadata returned by convert_markdown_to_html
+
+    Returns:
+        Manifest entry dictionary
+    """
+    stat = os.stat(markdown_file_path)
+    return {
+        'hash': hash_file(markdown_file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'metadata': guide_metadata
+    }
+
+
+def get_unchanged_manifest_entry(markdown_file_path, output_file_path, entry):
+    """
+    Check whether a file can be skipped because it is unchanged since the last build.
+
+    The size and modification time are compared first so unchanged files are
+    usually not even read; the content hash decides when they differ.
+
+    Args:
+        markdown_file_path: Path to the source markdown file
+        output_file_path: Path of the generated HTML file
+        entry: Manifest entry from the previous build, or None
+
+    Returns:
+        The (refreshed) manifest entry if the file is unchanged, None otherwise
+    """
+    if not entry or not Path(output_file_path).exists() or not get_heading_index_path(output_file_path).exists():
+        return None
+
+    stat = os.stat(markdown_file_path)
+    if stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns'):
+        return entry
+    if stat.st_size != entry.get('size') or hash_file(markdown_file_path) != entry.get('hash'):
+        return None
+
+    return dict(entry, mtime_ns=stat.st_mtime_ns)
+
+
 def disable_guide(guide_slug):
     """
     Disable a guide by adding it to the DISABLED_GUIDES list.
@@ -1074,6 +2414,38 @@ def enable_guide(guide_slug):
 
 def main():
     """Main function to run the converter."""
+    parser = argparse.ArgumentParser(description="Convert markdown_content/ to website-styled HTML.")
+    parser.add_argument('--force', action='store_true',
+                        help="convert every file, ignoring the build manifest")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="convert files in N worker processes (0 = one per CPU core)")
+    parser.add_argument('--profile', action='store_true',
+                        help="record per-stage timings of converted files (combine with --force to profile all)")
+    parser.add_argument('--profile-output', default='build-profile.json', metavar='FILE',
+                        help="JSON report written by --profile (default: build-profile.json)")
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help="number of slowest files listed by --profile (default: 10)")
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help="with --profile, also dump cProfile stats of the conversions to FILE")
+    parser.add_argument('--render-cache', default=RENDER_CACHE_DIR, metavar='DIR',
+                        help=f"persistent render cache shared by builds (default: {RENDER_CACHE_DIR})")
+    parser.add_argument('--render-cache-size', type=int, default=RENDER_CACHE_MAX_BYTES // (1024 * 1024),
+                        metavar='MB', help=f"size cap of the render cache "
+                                           f"(default: {RENDER_CACHE_MAX_BYTES // (1024 * 1024)})")
+    parser.add_argument('--no-render-cache', action='store_true',
+                        help="convert every changed file instead of restoring it from the render cache")
+    parser.add_argument('--no-precompress', action='store_true',
+                        help="do not write .gz/.br sidecars of the generated files")
+    parser.add_argument('--themes', nargs='*', metavar='NAME',
+                        help="also build the theme worktrees (all, or the named ones) in a single pass")
+    parser.add_argument('--watch', action='store_true',
+                        help="after building, serve the site and rebuild changed files with live reload")
+    parser.add_argument('--port', type=int, default=8000,
+                        help="port for the --watch development server (default: 8000)")
+    args = parser.parse_args()
+    if args.themes is not None and (args.profile or args.watch):
+        parser.error("--themes cannot be combined with --profile or --watch")
+
     print("Markdown to HTML Converter (Website Styled)")
     print("=" * 50)
 
@@ -1088,8 +2460,50 @@ def main():
         Path("markdown_content").mkdir(exist_ok=True)
         print("Please place your markdown files in the 'markdown_content' directory.")
 
-    # Process the markdown files
-    process_markdown_directory()
+    profiler = None
+    if args.profile:
+        from build_profiler import BuildProfiler
+        profiler = BuildProfiler(top=args.profile_top, cprofile_path=args.cprofile)
+
+    site_dirs = ['.']
+    if args.themes is not None:
+        # Convert every file once and write it into the main site and each theme worktree
+        from theme_build import build_themes, get_theme_dirs
+        site_dirs += get_theme_dirs(args.themes)
+        build_themes(site_dirs, force=args.force, jobs=args.jobs)
+    else:
+        # Process the markdown files
+        process_markdown_directory(force=args.force, jobs=args.jobs, profiler=profiler,
+                                   render_cache_dir=None if args.no_render_cache else args.render_cache,
+                                   render_cache_size=args.render_cache_size * 1024 * 1024)
+
+        # Inline navbar and footer into the hand-written pages
+        resolve_page_includes()
+
+    # Workflow pages rendered from data/workflow.json, so they do not wait for it in the browser
+    from workflow_pages import prerender_workflow_pages
+    for site_dir in site_dirs:
+        prerender_workflow_pages(site_dir)
+
+    # Internal links and images of the guides, checked against the anchor index of the build
+    from link_checker import check_internal_links, load_link_index, print_link_report
+    print_link_report(check_internal_links(load_link_index()))
+
+    # Sidecars for static servers, written only for files that changed
+    if not args.no_precompress:
+        from precompress import precompress_site, print_compression_report
+        for site_dir in site_dirs:
+            print_compression_report(precompress_site(site_dir))
+
+    if profiler:
+        print()
+        profiler.print_summary()
+        profiler.write_report(args.profile_output)
+
+    if args.watch:
+        from dev_server import watch_and_serve
+        watch_and_serve(port=args.port)
+        return
 
     # Show usage instructions
     print()
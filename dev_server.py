@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Development Server with Watch Mode and Live Reload
+Serves the website, watches markdown_content/ for changes, rebuilds only the
+affected HTML pages and user-guide/index.json, and tells open browsers to
+reload the pages that changed. Changes to the page template inputs (navbar,
+footer and the bundled CSS and JS) rebuild the bundles and every page. The outputs of deleted sources are removed,
+and precompressed sidecars of rewritten outputs are dropped until the next
+full build. Started by `convert_markdown.py --watch`.
+"""
+
+import json
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from asset_bundler import BUNDLE_SOURCES, build_asset_bundles
+from convert_markdown import (BUILD_MANIFEST, INCLUDE_FILES, convert_markdown_to_html, create_manifest_entry,
+                              generate_guide_index, get_asset_paths, get_build_settings, get_heading_index_path,
+                              get_source_dates, get_table_data_paths, get_template_segments, load_build_manifest,
+                              resolve_page_includes, save_build_manifest)
+from image_pipeline import build_image_catalog, get_catalog_hash
+from precompress import remove_stale_sidecars
+from search_index import SearchIndexBuilder, get_postings_path
+
+# Endpoint the injected script listens on for reload events
+LIVE_RELOAD_PATH = '/__livereload'
+
+LIVE_RELOAD_SCRIPT = f"""<script>
+(function () {{
+	var source = new EventSource('{LIVE_RELOAD_PATH}');
+	source.onmessage = function (event) {{
+		var changed = JSON.parse(event.data);
+		var page = location.pathname.replace(/^\\//, '') || 'index.html';
+		if (page.slice(-1) === '/') page += 'index.html';
+		if (changed.indexOf(page) !== -1 ||
+			(page === 'documentation.html' && changed.indexOf('user-guide/index.json') !== -1)) {{
+			location.reload();
+		}}
+	}};
+}})();
+</script>
+"""
+
+
+class LiveReloadHub:
+    """Hands the list of changed output paths to every waiting browser connection."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.version = 0
+        self.changed = []
+
+    def publish(self, changed_paths):
+        """Announce that the given output paths (relative to the site root) changed."""
+        with self.condition:
+            self.version += 1
+            self.changed = list(changed_paths)
+            self.condition.notify_all()
+
+    def wait(self, version, timeout):
+        """Wait for a version newer than the given one; returns (version, changed paths)."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version, self.changed
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that injects the live reload script and streams reload events."""
+
+    def __init__(self, *args, hub=None, **kwargs):
+        # The base class handles the request from __init__, so set the hub first
+        self.hub = hub
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        """Serve reload events, HTML pages with the reload script, or plain files."""
+        path = self.path.split('?', 1)[0]
+        if path == LIVE_RELOAD_PATH:
+            self.send_reload_events()
+        elif path.endswith('.html') or path.endswith('/'):
+            self.send_html_with_reload_script()
+        else:
+            super().do_GET()
+
+    def send_html_with_reload_script(self):
+        """Send an HTML page with the live reload script appended to its body."""
+        file_path = Path(self.translate_path(self.path))
+        if file_path.is_dir():
+            file_path = file_path / 'index.html'
+        if not file_path.is_file():
+            super().do_GET()
+            return
+
+        html = file_path.read_text(encoding='utf-8')
+        if '</body>' in html:
+            html = html.replace('</body>', LIVE_RELOAD_SCRIPT + '</body>', 1)
+        else:
+            html += LIVE_RELOAD_SCRIPT
+        body = html.encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_reload_events(self):
+        """Keep the connection open and push a server-sent event for every rebuild."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+
+        version = self.hub.version
+        try:
+            while True:
+                new_version, changed = self.hub.wait(version, timeout=15)
+                if new_version == version:
+                    # Keep-alive comment so proxies and browsers don't drop the stream
+                    self.wfile.write(b': ping\n\n')
+                else:
+                    version = new_version
+                    self.wfile.write(f"data: {json.dumps(changed)}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        """Silence per-request logging; rebuilds are reported instead."""
+
+
+def scan_markdown_files(source_path):
+    """
+    Take a snapshot of the markdown sources.
+
+    Args:
+        source_path: Path of the markdown source directory
+
+    Returns:
+        Dictionary mapping the path relative to source_path to (mtime_ns, size),
+        in the same order the full build visits the files
+    """
+    snapshot = {}
+    for md_file in source_path.rglob("*.md"):
+        try:
+            stat = md_file.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[md_file.relative_to(source_path).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def scan_template_inputs(base_path):
+    """
+    Take a snapshot of the files the page template is built from.
+
+    Args:
+        base_path: Path of the site root
+
+    Returns:
+        Dictionary mapping the path relative to base_path to (mtime_ns, size),
+        or None for files that don't exist
+    """
+    snapshot = {}
+    for name in list(INCLUDE_FILES) + [source for sources in BUNDLE_SOURCES.values() for source in sources]:
+        try:
+            stat = (base_path / name).stat()
+            snapshot[name] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            snapshot[name] = None
+    return snapshot
+
+
+def get_guide_outputs(output_path):
+    """Return the files generated for a guide page that exist: the page, its heading index and table data."""
+    outputs = [Path(output_path), get_heading_index_path(output_path)] + get_table_data_paths(output_path)
+    return [path for path in outputs if path.exists()]
+
+
+def remove_guide_outputs(output_path):
+    """
+    Remove the files generated for a guide whose source was deleted, with their sidecars
+    and stored search postings.
+
+    Args:
+        output_path: Path of the generated HTML page
+    """
+    for path in get_guide_outputs(output_path):
+        path.unlink(missing_ok=True)
+        remove_stale_sidecars(path)
+    get_postings_path(output_path).unlink(missing_ok=True)
+
+
+def get_searchable_guides(keys, source_path, manifest_files):
+    """Return (markdown file path, guide metadata) of the guides that are built and not disabled, in build order."""
+    return [(source_path / key, manifest_files[key]['metadata']) for key in keys
+            if key in manifest_files and not manifest_files[key]['metadata']['disabled']]
+
+
+def rebuild_changed_files(changed, source_path, base_output_path, manifest_files, image_catalog=None):
+    """
+    Convert the changed markdown files and update their manifest entries.
+
+    Args:
+        changed: Source paths (relative to source_path) that were added or modified
+        source_path: Path of the markdown source directory
+        base_output_path: Base directory for output files
+        manifest_files: Manifest file entries, updated in place
+        image_catalog: Image catalog from image_pipeline.build_image_catalog
+
+    Returns:
+        List of the output paths (relative to base_output_path) that were rewritten
+    """
+    rebuilt = []
+    for key in changed:
+        md_file = source_path / key
+        output_path = base_output_path / Path(key).with_suffix('.html')
+
+        guide_metadata = convert_markdown_to_html(md_file, output_path, image_catalog)
+        try:
+            if not guide_metadata:
+                raise ValueError("conversion failed")
+            manifest_files[key] = create_manifest_entry(md_file, guide_metadata)
+        except (OSError, ValueError) as e:
+            # E.g. the source was deleted while it was converted; the next scan reports it as removed
+            print(f"        ✗ Failed: {md_file}: {e}")
+            continue
+
+        # Sidecars of rewritten outputs would be served in place of the new content
+        for path in get_guide_outputs(output_path):
+            remove_stale_sidecars(path)
+        rebuilt.append(Path(key).with_suffix('.html').as_posix())
+    return rebuilt
+
+
+def watch_and_serve(source_dir="markdown_content", base_output_dir=".", port=8000, interval=0.25):
+    """
+    Serve the site and rebuild changed markdown files until interrupted.
+
+    Expects a full build to have run first, so that the build manifest holds
+    the metadata of every guide.
+
+    Args:
+        source_dir: The directory containing markdown files
+        base_output_dir: The base directory for output files, also the site root
+        port: Port the development server listens on
+        interval: Seconds between two scans of the source directory and template inputs
+    """
+    source_path = Path(source_dir)
+    base_output_path = Path(base_output_dir)
+    manifest_path = base_output_path / BUILD_MANIFEST
+
+    build_asset_bundles(base_output_path)
+    image_catalog = build_image_catalog(base_output_path)
+    settings = get_build_settings(get_catalog_hash(image_catalog))
+    manifest_files = load_build_manifest(manifest_path).get('files', {})
+
+    # Source dates are looked up again only for the changed files
+    source_dates = {}
+
+    # The search index builder keeps the fragments of every guide, a rebuild merges only the changed ones
+    search_index = SearchIndexBuilder()
+
+    hub = LiveReloadHub()
+    handler = partial(DevRequestHandler, hub=hub, directory=str(base_output_path))
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"Serving {base_output_path.resolve()} at http://localhost:{port}")
+    print(f"Watching {source_path} and the template inputs for changes (Ctrl+C to stop)")
+
+    snapshot = scan_markdown_files(source_path)
+    template_snapshot = scan_template_inputs(base_output_path)
+    get_source_dates([source_path / key for key in snapshot], source_path, source_dates)
+    search_index.build(get_searchable_guides(snapshot, source_path, manifest_files), set())
+    try:
+        while True:
+            time.sleep(interval)
+            current = scan_markdown_files(source_path)
+            current_template = scan_template_inputs(base_output_path)
+            template_changed = current_template != template_snapshot
+            if current == snapshot and not template_changed:
+                continue
+
+            started = time.perf_counter()
+            changed = [key for key, state in current.items() if snapshot.get(key) != state]
+            removed = [key for key in snapshot if key not in current]
+            snapshot = current
+            template_snapshot = current_template
+            changed_pages = []
+            if template_changed:
+                try:
+                    # Cached templates reference the old includes and bundles
+                    get_asset_paths.cache_clear()
+                    get_template_segments.cache_clear()
+                    build_asset_bundles(base_output_path)
+                    resolve_page_includes(base_output_path)
+                except OSError as e:
+                    print(f"        ✗ Rebuild failed: {e}")
+                    continue
+                settings = get_build_settings(get_catalog_hash(image_catalog))
+                # Every page embeds the template
+                changed = list(current)
+                changed_pages = [path.name for path in base_output_path.glob('*.html')]
+
+            for key in changed + removed:
+                source_dates.pop(source_path / key, None)
+
+            try:
+                changed_outputs = rebuild_changed_files(changed, source_path, base_output_path, manifest_files,
+                                                        image_catalog)
+                for key in removed:
+                    manifest_files.pop(key, None)
+                    remove_guide_outputs(base_output_path / Path(key).with_suffix('.html'))
+                    changed_outputs.append(Path(key).with_suffix('.html').as_posix())
+
+                # Only the index entries of the touched guides change, in full-build order
+                generate_guide_index([(source_path / key, manifest_files[key]['metadata']) for key in current
+                                      if key in manifest_files], base_output_path / 'user-guide', source_path,
+                                     source_dates)
+                search_index.build(get_searchable_guides(current, source_path, manifest_files),
+                                   {manifest_files[key]['metadata']['path'] for key in changed if key in manifest_files})
+                save_build_manifest({'settings': settings, 'files': manifest_files}, manifest_path)
+            except OSError as e:
+                # Keep watching; the next change rebuilds again
+                print(f"        ✗ Rebuild failed: {e}")
+                continue
+
+            changed_outputs.append('user-guide/index.json')
+            hub.publish(changed_outputs + changed_pages)
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if template_changed:
+                print("Template inputs changed, rebuilt the bundles and every page")
+            for key in changed:
+                print(f"Rebuilt: {key}")
+            for key in removed:
+                print(f"Removed: {key}")
+            print(f"        ✓ Reloaded in {elapsed_ms:.1f} ms")
+    except KeyboardInterrupt:
+        print()
+        print("Stopping development server...")
+    finally:
+        server.shutdown()
+        server.server_close()
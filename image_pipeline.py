@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Image Pipeline for the User Guides
+Reads the intrinsic size of every image under images/ from its file header
+and, when Pillow is installed, writes downscaled variants for srcset. Results
+are cached by source hash in an image cache file so unchanged images are never
+reprocessed. The resulting catalog is used by MarkdownToHTMLConverter to emit
+width/height, srcset and lazy loading attributes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+from pathlib import Path
+
+from convert_markdown import hash_file
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: without Pillow only the image dimensions are used
+    Image = None
+
+# Directory of the source images and of the generated variants, relative to the root directory
+IMAGE_DIR = 'images'
+IMAGE_VARIANT_DIR = 'images/variants'
+
+# Cache of processed images, relative to the output directory
+IMAGE_CACHE = '.image-cache.json'
+
+# Bump whenever variant generation changes
+IMAGE_PIPELINE_VERSION = 1
+
+# Widths of the downscaled variants; only widths below the intrinsic width are generated
+IMAGE_VARIANT_WIDTHS = (480, 960, 1440)
+
+# A variant is only kept if it is at most this fraction of the source file size
+IMAGE_VARIANT_MAX_RATIO = 0.8
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+# Characters kept in variant file names; anything else (e.g. spaces, which break srcset) becomes '-'
+VARIANT_NAME_PATTERN = re.compile(r'[^A-Za-z0-9._-]+')
+
+# JPEG start-of-frame markers, which carry the image size
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def read_image_size(image_path):
+    """
+    Read the intrinsic size of an image from its file header.
+
+    Supports PNG, GIF, JPEG and WebP without decoding the image.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Tuple of (width, height), or None if the format is not recognised
+    """
+    with open(image_path, 'rb') as f:
+        header = f.read(32)
+
+        if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+            return struct.unpack('>II', header[16:24])
+
+        if header[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', header[6:10])
+
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            chunk = header[12:16]
+            if chunk == b'VP8 ':
+                width, height = struct.unpack('<HH', header[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L':
+                bits = int.from_bytes(header[21:25], 'little')
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b'VP8X':
+                return int.from_bytes(header[24:27], 'little') + 1, int.from_bytes(header[27:30], 'little') + 1
+            return None
+
+        if header[:2] == b'\xff\xd8':
+            # Walk the JPEG segments up to the first start-of-frame marker
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                while marker[:1] == b'\xff' and marker[1:2] == b'\xff':
+                    marker = marker[1:] + f.read(1)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                length_bytes = f.read(2)
+                if len(length_bytes) < 2:
+                    return None
+                length = struct.unpack('>H', length_bytes)[0]
+                if marker[1] in JPEG_SOF_MARKERS:
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(length - 2, os.SEEK_CUR)
+
+    return None
+
+
+def write_image_variants(image_path, key, digest, width, height, base_dir="."):
+    """
+    Write downscaled copies of an image for srcset.
+
+    Variant file names contain the source hash, so a changed image never
+    reuses an outdated variant. Variants that would not be clearly smaller
+    than the source file are not kept.
+
+    Args:
+        image_path: Path to the source image
+        key: Image path relative to the root directory
+        digest: SHA-256 hex digest of the source image
+        width: Intrinsic width of the image
+        height: Intrinsic height of the image
+        base_dir: The root directory of the website
+
+    Returns:
+        List of [width, height, path] entries, paths relative to the root directory
+    """
+    widths = [variant_width for variant_width in IMAGE_VARIANT_WIDTHS if variant_width < width]
+    if not widths:
+        return []
+
+    variant_dir = Path(base_dir) / IMAGE_VARIANT_DIR
+    variant_dir.mkdir(parents=True, exist_ok=True)
+    stem = VARIANT_NAME_PATTERN.sub('-', Path(key).relative_to(IMAGE_DIR).with_suffix('').as_posix().replace('/', '--'))
+    suffix = Path(key).suffix.lower()
+    max_size = os.path.getsize(image_path) * IMAGE_VARIANT_MAX_RATIO
+
+    variants = []
+    with Image.open(image_path) as image:
+        image_format = image.format
+        if image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+            image = image.convert('RGBA' if image_format != 'JPEG' else 'RGB')
+        if image.mode == 'RGBA' and image.getextrema()[3][0] == 255:
+            # Screenshots are usually opaque, an unused alpha channel only adds bytes
+            image = image.convert('RGB')
+
+        for variant_width in widths:
+            variant_height = max(1, round(height * variant_width / width))
+            variant_key = f'{IMAGE_VARIANT_DIR}/{stem}.{digest[:12]}.{variant_width}w{suffix}'
+            variant_path = Path(base_dir) / variant_key
+            temp_path = variant_path.with_name(variant_path.name + '.tmp')
+            resized = image.resize((variant_width, variant_height), Image.LANCZOS)
+            if image_format == 'JPEG':
+                resized.save(temp_path, format=image_format, quality=82, optimize=True, progressive=True)
+            else:
+                resized.save(temp_path, format=image_format, optimize=True)
+
+            if os.path.getsize(temp_path) > max_size:
+                temp_path.unlink()
+                continue
+            os.replace(temp_path, variant_path)
+            variants.append([variant_width, variant_height, variant_key])
+    return variants
+
+
+def process_image(image_path, key, entry, base_dir="."):
+    """
+    Return the catalog entry of an image, reprocessing it only if it changed.
+
+    The size and modification time are compared first, so unchanged images
+    are usually not even read; the content hash decides when they differ.
+
+    Args:
+        image_path: Path to the image file
+        key: Image path relative to the root directory
+        entry: Cache entry from the previous build, or None
+        base_dir: The root directory of the website
+
+    Returns:
+        Cache entry with the image size and its variants (None when Pillow is
+        not installed), or None if the image format is not recognised
+    """
+    stat = os.stat(image_path)
+    if entry and entry.get('variants') is None and Image is not None:
+        entry = None  # Processed without Pillow before, variants are still missing
+    if entry and not all((Path(base_dir) / variant[2]).exists() for variant in entry.get('variants') or []):
+        entry = None  # Variants were deleted since, write them again
+
+    if entry and (stat.st_size, stat.st_mtime_ns) == (entry.get('size'), entry.get('mtime_ns')):
+        return entry
+
+    digest = hash_file(image_path)
+    if entry and stat.st_size == entry.get('size') and digest == entry.get('hash'):
+        return dict(entry, mtime_ns=stat.st_mtime_ns)
+
+    size = read_image_size(image_path)
+    if not size:
+        return None
+
+    width, height = size
+    variants = write_image_variants(image_path, key, digest, width, height, base_dir) if Image else None
+    return {
+        'hash': digest,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'width': width,
+        'height': height,
+        'variants': variants
+    }
+
+
+def build_image_catalog(base_dir="."):
+    """
+    Process every image under images/ and return the image catalog.
+
+    Variants of images that changed or disappeared are removed.
+
+    Args:
+        base_dir: The root directory of the website
+
+    Returns:
+        Dictionary mapping image paths relative to the root directory
+        (e.g. 'images/screenshots/x.png') to their cache entries
+    """
+    base_path = Path(base_dir)
+    cache_path = base_path / IMAGE_CACHE
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    previous = cache.get('images', {}) if cache.get('version') == IMAGE_PIPELINE_VERSION else {}
+
+    catalog = {}
+    variant_path = base_path / IMAGE_VARIANT_DIR
+    for image_path in sorted((base_path / IMAGE_DIR).rglob('*')):
+        if image_path.suffix.lower() not in IMAGE_EXTENSIONS or variant_path in image_path.parents:
+            continue
+        key = image_path.relative_to(base_path).as_posix()
+        entry = process_image(image_path, key, previous.get(key), base_dir)
+        if entry:
+            catalog[key] = entry
+
+    # Drop variants that no longer belong to a current image
+    current_variants = {variant[2] for entry in catalog.values() for variant in entry['variants'] or []}
+    for stale_path in variant_path.glob('*') if variant_path.exists() else []:
+        if stale_path.relative_to(base_path).as_posix() not in current_variants:
+            stale_path.unlink()
+
+    if catalog != previous:
+        temp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': IMAGE_PIPELINE_VERSION, 'images': catalog}, f, indent=2)
+        os.replace(temp_path, cache_path)
+
+    return catalog
+
+
+def get_catalog_hash(image_catalog):
+    """
+    Hash the parts of the image catalog that end up in the generated HTML.
+
+    Args:
+        image_catalog: Catalog returned by build_image_catalog
+
+    Returns:
+        Hex digest string
+    """
+    rendered = {key: [entry['width'], entry['height'], entry['variants']] for key, entry in image_catalog.items()}
+    return hashlib.sha256(json.dumps(rendered, sort_keys=True).encode('utf-8')).hexdigest()
@@ -20,217 +20,37 @@ class DynamicSidebar {
 
         // Wait for DOM to be ready
         if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', () => this.render());
+            document.addEventListener('DOMContentLoaded', () => this.start());
+        } else {
+            this.start();
+        }
+    }
+
+    /**
+     * Use the sidebar prebuilt by the markdown converter, or render one
+     */
+    start() {
+        if (document.getElementById('dynamicSidebar')) {
+            this.attachBehaviour();
         } else {
             this.render();
         }
     }
 
     /**
-     * Add required CSS styles for the dynamic sidebar
+     * Link the sidebar stylesheet unless the page already references it
      */
     addStyles() {
-        const styleId = 'dynamic-sidebar-styles';
-
-        // Check if styles already exist
-        if (document.getElementById(styleId)) {
+        // Generated guide pages ship these styles in their CSS bundle
+        if (document.getElementById('dynamicSidebar') ||
+            document.querySelector('link[href$="css/dynamic-sidebar.css"]')) {
             return;
         }
 
-        const style = document.createElement('style');
-        style.id = styleId;
-        style.textContent = `
-            /* Dynamic Sidebar Styles */
-            .sidenav {
-                height: 100vh;
-                width: 200px;
-                position: fixed;
-                z-index: 1000;
-                top: 0;
-                left: 0;
-                background: #008793;
-                overflow-x: hidden;
-                overflow-y: auto;
-                padding: 20px 0 30px 0;
-                box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);
-                border-right: 1px solid rgba(0, 0, 0, 0.1);
-                display: flex;
-                flex-direction: column;
-            }
-
-            .sidenav a {
-                padding: 12px 16px 12px 24px;
-                text-decoration: none;
-                font-size: 16px;
-                font-weight: 500;
-                color: rgba(255, 255, 255, 0.7);
-                display: block;
-                transition: all 0.3s ease;
-                border-left: 3px solid transparent;
-                margin: 2px 0;
-                position: relative;
-            }
-
-            .sidenav a:hover {
-                color: #ffffff;
-                background: rgba(255, 255, 255, 0.1);
-                border-left-color: #ffffff;
-                transform: translateX(5px);
-            }
-
-            .sidenav a.active {
-                color: #ffffff;
-                background: rgba(255, 255, 255, 0.15);
-                border-left-color: #ffffff;
-                font-weight: 600;
-            }
-
-            .sidenav a:before {
-                content: '';
-                position: absolute;
-                left: 0;
-                top: 0;
-                bottom: 0;
-                width: 3px;
-                background: #ffffff;
-                transform: scaleY(0);
-                transition: transform 0.3s ease;
-            }
-
-            .sidenav a:hover:before,
-            .sidenav a.active:before {
-                transform: scaleY(1);
-            }
-
-            .sidenav i {
-                margin-right: 8px;
-                font-size: 14px;
-                opacity: 0.9;
-                color: rgba(255, 255, 255, 0.9);
-            }
-
-            /* Sidebar trademark */
-            .sidenav-trademark {
-                padding: 20px 24px;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-                color: white;
-                font-size: 25px;
-                line-height: 1.4;
-                text-align: center;
-                background: transparent;
-            }
-
-            .sidenav-trademark .trademark-title {
-                font-weight: 600;
-                color: #ffffff;
-                text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-            }
-
-            .sidenav-trademark .trademark-text {
-              font-size: 12px;
-                opacity: 0.8;
-            }
-
-            /* Sidebar separator */
-            .sidenav-separator {
-                border: none;
-                border-top: 1px solid rgba(255, 255, 255, 0.2);
-                margin: 10px 24px;
-                opacity: 0.6;
-            }
-
-            /* GitHub section */
-            .sidenav-github {
-                margin-top: 5px;
-            }
-
-            /* Main content adjustment - handled in style.css */
-
-            /* Navbar adjustment to prevent overlap */
-            .gtco-nav {
-                margin-left: 200px;
-                background: white;
-                border-bottom: 1px solid #e9ecef;
-            }
-
-            .gtco-nav .gtco-container {
-                max-width: calc(1140px - 200px);
-            }
-
-            /* On smaller screens, adjust sidebar */
-            @media screen and (max-height: 450px) {
-                .sidenav {
-                    padding: 15px 0;
-                }
-                .sidenav a {
-                    font-size: 14px;
-                    padding: 8px 16px 8px 20px;
-                }
-            }
-
-            /* On mobile screens, hide the sidebar and adjust main content */
-            @media screen and (max-width: 768px) {
-                .sidenav {
-                    display: none !important;
-                    visibility: hidden !important;
-                }
-
-                .main {
-                    margin-left: 0 !important;
-                }
-
-                .gtco-nav {
-                    margin-left: 0 !important;
-                }
-
-                .gtco-nav .gtco-container {
-                    max-width: 1140px;
-                }
-
-                /* Ensure footer is visible on mobile */
-                .footer-modern,
-                #gtco-footer {
-                    position: relative !important;
-                    z-index: 1 !important;
-                    margin-left: 0 !important;
-                    width: 100% !important;
-                }
-            }
-
-            /* Additional mobile safety for very narrow screens */
-            @media screen and (max-width: 480px) {
-                .sidenav {
-                    display: none !important;
-                    visibility: hidden !important;
-                    pointer-events: none !important;
-                }
-
-                body {
-                    overflow-x: hidden;
-                }
-
-                .footer-modern,
-                #gtco-footer {
-                    position: relative !important;
-                    z-index: 1 !important;
-                    margin-left: 0 !important;
-                    width: 100vw !important;
-                }
-            }
-
-            /* Adjust TOC positioning when main sidebar is present */
-            .guide-toc-container {
-                left: 220px !important;
-            }
-
-            @media screen and (max-width: 768px) {
-                .guide-toc-container {
-                    left: 15px !important;
-                }
-            }
-        `;
-
-        document.head.appendChild(style);
+        const link = document.createElement('link');
+        link.rel = 'stylesheet';
+        link.href = `${this.pathPrefix}css/dynamic-sidebar.css`;
+        document.head.appendChild(link);
     }
 
     /**
@@ -390,6 +210,13 @@ class DynamicSidebar {
             header.insertAdjacentHTML('afterend', sidebarHTML);
         }
 
+        this.attachBehaviour();
+    }
+
+    /**
+     * Attach smooth scrolling and scroll-spy to the sidebar links
+     */
+    attachBehaviour() {
         // Add event listeners for smooth scrolling
         this.addSmoothScrolling();
 
@@ -501,9 +328,12 @@ class DynamicSidebar {
             rootMargin: '-20% 0px -70% 0px'
         });
 
-        // Observe all elements with IDs
-        document.querySelectorAll('[id]').forEach(element => {
-            observer.observe(element);
+        // Observe only the sections the sidebar links to
+        document.querySelectorAll('.sidenav a[href^="#"]').forEach(link => {
+            const target = document.getElementById(decodeURIComponent(link.getAttribute('href').slice(1)));
+            if (target) {
+                observer.observe(target);
+            }
         });
     }
 
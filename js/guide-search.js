@@ -0,0 +1,208 @@
+/**
+ * User Guide Search
+ * Queries the sharded search index written by convert_markdown.py,
+ * fetching only the shards the query terms need
+ */
+
+class GuideSearch {
+    constructor(indexPath = 'user-guide/search-index.json', shardPath = 'user-guide/search/') {
+        this.indexPath = indexPath;
+        this.shardPath = shardPath;
+        this.index = null;
+        this.shards = new Map();
+        this.stopWords = new Set([
+            'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in', 'into', 'is', 'it',
+            'its', 'of', 'on', 'or', 'so', 'that', 'the', 'then', 'this', 'to', 'was', 'will', 'with'
+        ]);
+    }
+
+    /**
+     * Initialize the search box if the page has one
+     */
+    init() {
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', () => this.attach());
+        } else {
+            this.attach();
+        }
+    }
+
+    /**
+     * Run a search whenever the search box changes
+     */
+    attach() {
+        const input = document.getElementById('guide-search-input');
+        this.resultsElement = document.getElementById('guide-search-results');
+        if (!input || !this.resultsElement) return;
+
+        let pending = null;
+        input.addEventListener('input', () => {
+            clearTimeout(pending);
+            pending = setTimeout(() => this.showResults(input.value), 150);
+        });
+    }
+
+    /**
+     * Split text into index terms, the same way the index was built
+     * @param {string} text - Query text
+     * @returns {string[]} Lowercase terms
+     */
+    tokenize(text) {
+        return (text.toLowerCase().match(/[a-z0-9]{2,}/g) || []).filter(term => !this.stopWords.has(term));
+    }
+
+    /**
+     * Load the index description once
+     */
+    async loadIndex() {
+        if (!this.index) {
+            const response = await fetch(this.indexPath);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            this.index = await response.json();
+        }
+        return this.index;
+    }
+
+    /**
+     * Load one shard, at most once per page
+     * @param {string} prefix - Shard prefix
+     * @returns {Promise<Array>} [guide number, terms] fragments of the shard
+     */
+    loadShard(prefix) {
+        if (!this.shards.has(prefix)) {
+            const request = fetch(`${this.shardPath}${prefix}.json`)
+                .then(response => response.ok ? response.json() : []);
+            this.shards.set(prefix, request);
+        }
+        return this.shards.get(prefix);
+    }
+
+    /**
+     * Find the positions of a term
+     * @param {string} term - Index term
+     * @param {boolean} prefix - Also match every term starting with term
+     * @returns {Promise<Map<string, Set<number>>>} Word positions per 'guide:section' key
+     */
+    async lookup(term, prefix) {
+        const length = this.index.prefix_length;
+        const shardNames = term.length >= length
+            ? this.index.shards.filter(name => name === term.slice(0, length))
+            : this.index.shards.filter(name => name.startsWith(term));
+        const shards = await Promise.all(shardNames.map(name => this.loadShard(name)));
+
+        const positions = new Map();
+        shards.forEach(fragments => fragments.forEach(([guide, terms]) => {
+            const keys = prefix ? Object.keys(terms).filter(key => key.startsWith(term)) : [term];
+            keys.forEach(key => {
+                (terms[key] || []).forEach(([section, ...sectionPositions]) => {
+                    const sectionKey = `${guide}:${section}`;
+                    if (!positions.has(sectionKey)) positions.set(sectionKey, new Set());
+                    sectionPositions.forEach(position => positions.get(sectionKey).add(position));
+                });
+            });
+        }));
+        return positions;
+    }
+
+    /**
+     * Search the guides; ranking matches SearchIndex.search in search_index.py
+     * @param {string} query - Free text query
+     * @param {number} limit - Maximum number of results
+     * @returns {Promise<Object[]>} Results with title, heading and path
+     */
+    async search(query, limit = 10) {
+        const terms = this.tokenize(query);
+        if (terms.length === 0) return [];
+
+        const index = await this.loadIndex();
+        const matches = await Promise.all(terms.map((term, k) => this.lookup(term, k === terms.length - 1)));
+        const parseKey = sectionKey => sectionKey.split(':').map(Number);
+
+        // Guides have to contain every term
+        let guides = null;
+        matches.forEach(positions => {
+            const termGuides = new Set([...positions.keys()].map(sectionKey => parseKey(sectionKey)[0]));
+            guides = guides === null ? termGuides : new Set([...guides].filter(guide => termGuides.has(guide)));
+        });
+
+        const scores = new Map();
+        matches.forEach((positions, k) => {
+            const following = matches[k + 1] || new Map();
+            positions.forEach((sectionPositions, section) => {
+                if (!guides.has(parseKey(section)[0])) return;
+                if (!scores.has(section)) scores.set(section, [0, 0, 0]);
+                const score = scores.get(section);
+                score[0] += 1;
+                score[2] += sectionPositions.size;
+                if (following.has(section)) {
+                    const nextPositions = following.get(section);
+                    sectionPositions.forEach(position => {
+                        if (nextPositions.has(position + 1)) score[1] += 1;
+                    });
+                }
+            });
+        });
+
+        const compareKeys = (keyA, keyB) => {
+            const [guideA, sectionA] = parseKey(keyA);
+            const [guideB, sectionB] = parseKey(keyB);
+            return (guideA - guideB) || (sectionA - sectionB);
+        };
+        return [...scores.entries()]
+            .sort(([keyA, a], [keyB, b]) => (b[0] - a[0]) || (b[1] - a[1]) || (b[2] - a[2]) || compareKeys(keyA, keyB))
+            .slice(0, limit)
+            .map(([section]) => {
+                const [guideNumber, sectionNumber] = parseKey(section);
+                const guide = index.guides[guideNumber];
+                const [anchor, heading] = guide.sections[sectionNumber];
+                return {
+                    title: guide.title,
+                    heading: heading || guide.title,
+                    path: guide.path + (anchor ? `#${anchor}` : '')
+                };
+            });
+    }
+
+    /**
+     * Render the results of a query below the search box
+     * @param {string} query - Free text query
+     */
+    async showResults(query) {
+        if (!query.trim()) {
+            this.resultsElement.innerHTML = '';
+            return;
+        }
+
+        try {
+            const results = await this.search(query);
+            this.resultsElement.innerHTML = results.length === 0
+                ? '<p class="guide-search-empty">No matching sections found.</p>'
+                : `<ul class="guide-search-list">${results.map(result => `
+                    <li><a href="${this.escapeHtml(result.path)}">
+                        <strong>${this.escapeHtml(result.heading)}</strong>
+                        <span>${this.escapeHtml(result.title)}</span>
+                    </a></li>`).join('')}
+                </ul>`;
+        } catch (error) {
+            console.error('Error searching user guides:', error);
+            this.resultsElement.innerHTML = '<p class="guide-search-empty">Search is not available right now.</p>';
+        }
+    }
+
+    /**
+     * Escape HTML to prevent XSS
+     * @param {string} text - Text to escape
+     * @returns {string} Escaped text
+     */
+    escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+}
+
+// Initialize the user guide search
+const guideSearch = new GuideSearch();
+guideSearch.init();
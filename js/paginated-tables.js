@@ -0,0 +1,123 @@
+/**
+ * Paginated Tables
+ * Pages through the large tables of the generated guides. The page only
+ * holds the first rows of such a table; all rows are loaded from its JSON
+ * row data the first time the reader moves to another page.
+ */
+
+class PaginatedTable {
+    /**
+     * @param {HTMLTableElement} table - Table with data-rows and data-page-rows attributes
+     */
+    constructor(table) {
+        this.table = table;
+        this.dataPath = table.dataset.rows;
+        this.pageRows = parseInt(table.dataset.pageRows, 10) || 50;
+        this.page = 0;
+        this.rows = null;
+        this.request = null;
+    }
+
+    /**
+     * Add the pager below the table
+     */
+    init() {
+        this.pager = document.createElement('div');
+        this.pager.className = 'table-pager';
+        this.pager.innerHTML = `
+            <button type="button" class="btn btn-default btn-sm" data-step="-1">&laquo; Previous</button>
+            <span class="table-pager-status"></span>
+            <button type="button" class="btn btn-default btn-sm" data-step="1">Next &raquo;</button>
+        `;
+        this.status = this.pager.querySelector('.table-pager-status');
+        this.previousButton = this.pager.querySelector('[data-step="-1"]');
+        this.nextButton = this.pager.querySelector('[data-step="1"]');
+        this.pager.addEventListener('click', event => {
+            const button = event.target.closest('button[data-step]');
+            if (button) {
+                this.showPage(this.page + parseInt(button.dataset.step, 10));
+            }
+        });
+        this.table.parentNode.insertBefore(this.pager, this.table.nextSibling);
+        this.updatePager();
+    }
+
+    /**
+     * Load the row data of the table, at most once
+     * @returns {Promise<Array>} Rows, each an array of cell HTML strings
+     */
+    loadRows() {
+        if (!this.request) {
+            this.request = fetch(this.dataPath)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP error! status: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(data => {
+                    this.rows = data.rows;
+                    return this.rows;
+                })
+                .catch(error => {
+                    this.request = null;
+                    throw error;
+                });
+        }
+        return this.request;
+    }
+
+    /**
+     * Number of pages, once the row data is loaded
+     */
+    getPageCount() {
+        return Math.max(1, Math.ceil((this.rows.length - 1) / this.pageRows));
+    }
+
+    /**
+     * Render one page of rows; the first row is repeated on every page
+     * @param {number} page - Zero-based page number
+     */
+    async showPage(page) {
+        try {
+            await this.loadRows();
+        } catch (error) {
+            console.error('Error loading table rows:', error);
+            this.status.textContent = 'Rows could not be loaded';
+            return;
+        }
+
+        this.page = Math.min(Math.max(page, 0), this.getPageCount() - 1);
+        const start = 1 + this.page * this.pageRows;
+        const rows = [this.rows[0], ...this.rows.slice(start, start + this.pageRows)];
+        const body = this.table.tBodies[0] || this.table.createTBody();
+        body.innerHTML = rows.map(cells => `<tr><td>${cells.join('</td><td>')}</td></tr>`).join('');
+        this.updatePager();
+    }
+
+    /**
+     * Update the row range and the state of the buttons
+     */
+    updatePager() {
+        const first = this.page * this.pageRows + 1;
+        if (!this.rows) {
+            this.status.textContent = `Rows ${first}–${first + this.pageRows - 1}`;
+            this.previousButton.disabled = true;
+            this.nextButton.disabled = false;
+            return;
+        }
+
+        const total = this.rows.length - 1;
+        const last = Math.min(first + this.pageRows - 1, total);
+        this.status.textContent = `Rows ${first}–${last} of ${total} (page ${this.page + 1} of ${this.getPageCount()})`;
+        this.previousButton.disabled = this.page === 0;
+        this.nextButton.disabled = this.page >= this.getPageCount() - 1;
+    }
+}
+
+// Initialize when DOM is loaded
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('table.paginated-table[data-rows]').forEach(table => {
+        new PaginatedTable(table).init();
+    });
+});
@@ -1,6 +1,7 @@
 /**
  * User Guides Dynamic Loader
- * Dynamically loads and displays user guides from the index.json file
+ * Dynamically loads and displays user guides from the index.json listing;
+ * the full details of a guide are only fetched when its card is hovered
  */
 
 class UserGuidesLoader {
@@ -9,6 +10,7 @@ class UserGuidesLoader {
         this.loadingElement = null;
         this.errorElement = null;
         this.guides = [];
+        this.details = new Map();
     }
 
     /**
@@ -123,6 +125,36 @@ class UserGuidesLoader {
         `;
 
         this.guidesContainer.innerHTML = guidesHtml;
+        this.attachDetailLoading();
+    }
+
+    /**
+     * Show the full description of a guide as tooltip once its card is hovered
+     */
+    attachDetailLoading() {
+        this.guidesContainer.querySelectorAll('[data-detail]').forEach(card => {
+            card.addEventListener('mouseenter', async () => {
+                const detail = await this.loadGuideDetail(card.dataset.detail);
+                if (detail && detail.description) {
+                    card.title = detail.description;
+                }
+            }, { once: true });
+        });
+    }
+
+    /**
+     * Load the detail file of a guide, at most once per page
+     * @param {string} detailPath - Path of the guide detail file
+     * @returns {Promise<Object|null>} Full guide metadata, or null if unavailable
+     */
+    loadGuideDetail(detailPath) {
+        if (!this.details.has(detailPath)) {
+            const request = fetch(detailPath)
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => null);
+            this.details.set(detailPath, request);
+        }
+        return this.details.get(detailPath);
     }
 
     /**
@@ -147,7 +179,8 @@ class UserGuidesLoader {
      * @returns {string} HTML string for the guide miniature
      */
     createGuideMiniature(guide) {
-        const truncatedDescription = this.truncateText(guide.description, 150);
+        // The listing carries a ready-made summary; older indexes only have the full description
+        const truncatedDescription = guide.summary !== undefined ? guide.summary : this.truncateText(guide.description, 150);
         const formattedDate = this.formatDate(guide.last_modified);
         const guideIcon = this.getGuideIcon(guide.slug);
         const isDisabled = guide.disabled === true || guide.status === 'coming_soon';
@@ -160,9 +193,10 @@ class UserGuidesLoader {
         // For disabled guides, use a div instead of a link to make them non-clickable
         const elementTag = isDisabled ? 'div' : 'a';
         const hrefAttribute = isDisabled ? '' : `href="${guide.path}"`;
+        const detailAttribute = guide.detail ? `data-detail="${this.escapeHtml(guide.detail)}"` : '';
 
         return `
-            <${elementTag} ${hrefAttribute} class="${linkClass}">
+            <${elementTag} ${hrefAttribute} ${detailAttribute} class="${linkClass}">
                 <div class="miniature-header">
                     <div class="miniature-icon ${isDisabled ? 'disabled' : ''}">
                         <i class="${iconClass}"></i>
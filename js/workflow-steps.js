@@ -0,0 +1,77 @@
+/**
+ * Workflow Step Details
+ * task.html is pre-rendered from data/workflow.json by workflow_pages.py;
+ * the inputs, outputs and links of a step are loaded from its fragment the
+ * first time its details are expanded.
+ */
+
+class WorkflowStepDetails {
+    /**
+     * Load the details of every step when it is first expanded
+     */
+    init() {
+        document.querySelectorAll('details.step-details[data-src]').forEach(details => {
+            details.addEventListener('toggle', () => {
+                if (details.open && !details.dataset.loaded) {
+                    details.dataset.loaded = 'true';
+                    this.loadDetails(details);
+                }
+            });
+        });
+    }
+
+    /**
+     * Fetch a step fragment and render it into its details element
+     * @param {HTMLDetailsElement} details - Details element with the fragment path in data-src
+     */
+    async loadDetails(details) {
+        const body = document.createElement('div');
+        body.className = 'step-details-body';
+        body.textContent = 'Loading…';
+        details.appendChild(body);
+
+        try {
+            const response = await fetch(details.dataset.src);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            body.innerHTML = this.renderStep(await response.json(), details.closest('.card').id);
+        } catch (error) {
+            console.error('Error loading step details:', error);
+            body.textContent = 'Unable to load step details';
+            delete details.dataset.loaded;
+        }
+    }
+
+    /**
+     * Render the inputs, outputs and links of a step
+     * @param {Object} step - Step from data/workflow.json
+     * @param {string} anchor - Element ID of the step's card, unique even for repeated step IDs
+     * @returns {string} HTML string
+     */
+    renderStep(step, anchor) {
+        const list = values => (values || []).filter(Boolean).map(value => this.escapeHtml(value)).join(', ');
+        return `
+            <p><b>Inputs:</b> ${list(step.inputs)}</p>
+            <p><b>Outputs:</b> ${list(step.outputs)}</p>
+            <p><a href="${this.escapeHtml(step.wikiUrl || '#')}">Wiki detail</a> · <a href="${this.escapeHtml(step.discussionUrl || '#')}">Discussion</a> · <a href="https://github.com/eclipse-efbt/efbt/tree/master">Reference implementation code</a> · <a href="https://eclipse.dev/efbt/documentation.html">Reference implementation tools</a></p>
+            <p><small>Anchor: <code>#${this.escapeHtml(anchor)}</code></small></p>
+        `;
+    }
+
+    /**
+     * Escape HTML characters
+     * @param {string} text - Text to escape
+     * @returns {string} Escaped text
+     */
+    escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML.replace(/"/g, '&quot;');
+    }
+}
+
+// Initialize when DOM is loaded
+document.addEventListener('DOMContentLoaded', () => {
+    new WorkflowStepDetails().init();
+});
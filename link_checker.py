@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Link Checker for the Generated Guides
+Validates every link and image of the converted guides against the anchor
+index of the site. The heading IDs, links and images of each guide are
+recorded by the converter in its heading index (*.headings.json), so the
+check is a single pass over those indexes and never parses the generated
+HTML. External URLs can optionally be checked as well, by a bounded pool of
+concurrent requests that can be pointed at a local stand-in server.
+"""
+
+import argparse
+import json
+import posixpath
+import sys
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote, urlsplit, urlunsplit
+
+from convert_markdown import BUILD_MANIFEST, get_heading_index_path
+
+# Links with these schemes are checked by the external checker
+EXTERNAL_SCHEMES = ('http', 'https')
+
+# Default number of concurrent requests and per-request timeout of the external checker
+EXTERNAL_CONCURRENCY = 8
+EXTERNAL_TIMEOUT = 10
+
+USER_AGENT = 'efbt-link-checker/1.0'
+
+
+def collect_anchor_ids(headings, anchors):
+    """Add the IDs of a heading tree from the heading index to a set."""
+    for heading in headings:
+        anchors.add(heading['id'])
+        collect_anchor_ids(heading['children'], anchors)
+
+
+def load_link_index(base_dir="."):
+    """
+    Build the anchor index and link list of the site from the heading indexes.
+
+    Args:
+        base_dir: The root directory of the website
+
+    Returns:
+        Dictionary with 'anchors' ({page: set of heading IDs}) and 'links'
+        (list of (page, href, kind) tuples, kind being 'link' or 'image'),
+        pages given relative to the root directory
+    """
+    base_path = Path(base_dir)
+    try:
+        with open(base_path / BUILD_MANIFEST, 'r', encoding='utf-8') as f:
+            pages = [Path(key).with_suffix('.html').as_posix() for key in json.load(f).get('files', {})]
+    except (OSError, ValueError):
+        pages = []
+
+    anchors = {}
+    links = []
+    for page in pages:
+        try:
+            with open(get_heading_index_path(base_path / page), 'r', encoding='utf-8') as f:
+                heading_index = json.load(f)
+        except (OSError, ValueError):
+            continue
+        anchors[page] = set()
+        collect_anchor_ids(heading_index['headings'], anchors[page])
+        links.extend((page, href, 'link') for href in heading_index.get('links', []))
+        links.extend((page, src, 'image') for src in heading_index.get('images', []))
+
+    return {'anchors': anchors, 'links': links}
+
+
+def resolve_reference(page, href):
+    """
+    Resolve a link or image reference of a page to a path within the site.
+
+    Args:
+        page: Path of the linking page relative to the root directory
+        href: The href or src as written in the guide
+
+    Returns:
+        Tuple of (target path relative to the root directory, fragment), or
+        None for references that do not point into the site (external URLs,
+        mailto: and similar)
+    """
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc:
+        return None
+
+    path = unquote(parts.path)
+    if not path:
+        target = page
+    elif path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/'))
+    else:
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+    return target, unquote(parts.fragment)
+
+
+def check_internal_links(link_index, base_dir="."):
+    """
+    Validate every internal link and image against the anchor index.
+
+    Fragments are verified for links to generated guides; for other pages
+    only the existence of the file is checked.
+
+    Args:
+        link_index: Dictionary returned by load_link_index
+        base_dir: The root directory of the website
+
+    Returns:
+        List of (page, href, problem) tuples of the broken references
+    """
+    base_path = Path(base_dir)
+    anchors = link_index['anchors']
+    exists = {}
+    problems = []
+
+    for page, href, kind in link_index['links']:
+        resolved = resolve_reference(page, href)
+        if resolved is None:
+            continue
+        target, fragment = resolved
+
+        if target.startswith('../') or target == '..':
+            problems.append((page, href, 'points outside the site'))
+            continue
+        if target not in anchors:
+            if target not in exists:
+                exists[target] = (base_path / target).is_file()
+            if not exists[target]:
+                problems.append((page, href, f"missing {'image' if kind == 'image' else 'page'} {target}"))
+            continue
+        if fragment and fragment not in anchors[target]:
+            problems.append((page, href, f"no heading #{fragment} in {target}"))
+
+    return problems
+
+
+def get_external_urls(link_index):
+    """
+    Collect the external URLs of the site.
+
+    Args:
+        link_index: Dictionary returned by load_link_index
+
+    Returns:
+        Dictionary mapping each URL (without fragment) to the pages linking to it
+    """
+    urls = {}
+    for page, href, _ in link_index['links']:
+        parts = urlsplit(href)
+        if parts.scheme in EXTERNAL_SCHEMES:
+            url = urlunsplit(parts._replace(fragment=''))
+            pages = urls.setdefault(url, [])
+            if page not in pages:
+                pages.append(page)
+    return urls
+
+
+def fetch_status(url, timeout=EXTERNAL_TIMEOUT):
+    """
+    Request a URL and return an error description, or None if it is reachable.
+
+    A HEAD request is tried first; servers that do not support it get a GET.
+
+    Args:
+        url: URL to check
+        timeout: Seconds to wait for the server
+
+    Returns:
+        None if the server answered with a non-error status, otherwise a description of the failure
+    """
+    for method in ('HEAD', 'GET'):
+        request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout):
+                return None
+        except urllib.error.HTTPError as e:
+            if method == 'HEAD' and e.code in (403, 405, 501):
+                continue
+            return f"HTTP {e.code}"
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            return str(getattr(e, 'reason', e))
+    return None
+
+
+def check_external_links(urls, concurrency=EXTERNAL_CONCURRENCY, timeout=EXTERNAL_TIMEOUT, stand_in=None):
+    """
+    Check external URLs with a bounded number of concurrent requests.
+
+    Args:
+        urls: Iterable of URLs, each checked once
+        concurrency: Maximum number of requests in flight
+        timeout: Seconds to wait for each server
+        stand_in: Optional base URL (e.g. 'http://127.0.0.1:9000') that
+                  replaces the scheme and host of every URL, so the check can
+                  run against a local stand-in server
+
+    Returns:
+        Dictionary mapping each URL to None if it is reachable, or a description of the failure
+    """
+    urls = list(dict.fromkeys(urls))
+    targets = urls
+    if stand_in:
+        base = urlsplit(stand_in)
+        targets = [urlunsplit(urlsplit(url)._replace(scheme=base.scheme, netloc=base.netloc)) for url in urls]
+    if not urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls)))) as executor:
+        results = executor.map(fetch_status, targets, [timeout] * len(targets))
+        return dict(zip(urls, results))
+
+
+def print_link_report(problems):
+    """
+    Print the broken references found by check_internal_links.
+
+    Args:
+        problems: List of (page, href, problem) tuples
+    """
+    if not problems:
+        print("All internal links and images resolve")
+        return
+    print(f"Found {len(problems)} broken link(s):")
+    for page, href, problem in problems:
+        print(f"  {page}: {href} ({problem})")
+
+
+def main():
+    """Check the links of the generated guides."""
+    parser = argparse.ArgumentParser(description="Check the links and images of the generated guides.")
+    parser.add_argument('--root', default='.', help="site to check (default: .)")
+    parser.add_argument('--external', action='store_true', help="also check external http(s) URLs")
+    parser.add_argument('--concurrency', type=int, default=EXTERNAL_CONCURRENCY, metavar='N',
+                        help=f"concurrent external requests (default: {EXTERNAL_CONCURRENCY})")
+    parser.add_argument('--timeout', type=float, default=EXTERNAL_TIMEOUT, metavar='SECONDS',
+                        help=f"timeout per external request (default: {EXTERNAL_TIMEOUT})")
+    parser.add_argument('--stand-in', metavar='URL',
+                        help="send external requests to this server instead, e.g. http://127.0.0.1:9000")
+    args = parser.parse_args()
+
+    link_index = load_link_index(args.root)
+    if not link_index['anchors']:
+        print(f"No heading indexes found under {args.root}, build the site first")
+        return 1
+
+    print(f"Checking {len(link_index['links'])} reference(s) in {len(link_index['anchors'])} page(s)")
+    problems = check_internal_links(link_index, args.root)
+    print_link_report(problems)
+
+    if args.external:
+        urls = get_external_urls(link_index)
+        print(f"Checking {len(urls)} external URL(s) with {args.concurrency} concurrent request(s)")
+        for url, error in check_external_links(urls, args.concurrency, args.timeout, args.stand_in).items():
+            if error:
+                problems.append((urls[url][0], url, error))
+                print(f"  {url}: {error} (linked from {', '.join(urls[url])})")
+
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Precompressed Sidecars for the Generated Site
+Writes .gz (and, when the brotli package is installed, .br) files next to the
+generated HTML, JSON, CSS and JS at maximum compression, so a static server can
+send them as-is instead of compressing on every request. Only files whose
+content changed since the last run are recompressed.
+
+Every sidecar gets the modification time of its source; a server should only
+use a sidecar whose modification time equals that of the source, so a source
+rewritten without recompression is never answered with outdated content.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+from convert_markdown import hash_file
+
+try:
+    import brotli
+except ImportError:  # Optional: without brotli only gzip sidecars are written
+    brotli = None
+
+# Files to precompress, relative to the root directory
+PRECOMPRESS_PATTERNS = (
+    '*.html',
+    'user-guide/**/*.html',
+    'user-guide/**/*.json',
+    'data/**/*.json',
+    'css/**/*.css',
+    'js/**/*.js',
+)
+
+# Files smaller than this are not worth a sidecar
+PRECOMPRESS_MIN_SIZE = 1024
+
+# Cache of compressed files, relative to the root directory
+PRECOMPRESS_CACHE = '.precompress-cache.json'
+
+# Bump whenever compression settings change
+PRECOMPRESS_VERSION = 1
+
+# Sidecar suffix per content encoding
+SIDECAR_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+
+def compress(data, encoding):
+    """
+    Compress data at maximum compression.
+
+    Args:
+        data: Bytes to compress
+        encoding: 'gzip' or 'br'
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    # A fixed timestamp keeps the output byte-stable between builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def get_encodings():
+    """Return the content encodings sidecars are written for."""
+    return ['gzip', 'br'] if brotli is not None else ['gzip']
+
+
+def get_sidecar_path(file_path, encoding):
+    """Return the path of a file's sidecar for a content encoding."""
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + SIDECAR_SUFFIXES[encoding])
+
+
+def remove_stale_sidecars(file_path):
+    """
+    Remove the sidecars of a file that no longer match it.
+
+    A sidecar is stale when its source is gone or has a different
+    modification time; the next precompress_site run writes it again.
+
+    Args:
+        file_path: Path of the source file
+
+    Returns:
+        Number of removed sidecars
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    removed = 0
+    for encoding in SIDECAR_SUFFIXES:
+        sidecar_path = get_sidecar_path(file_path, encoding)
+        try:
+            if mtime_ns is None or os.stat(sidecar_path).st_mtime_ns != mtime_ns:
+                sidecar_path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def write_sidecars(file_path, encodings):
+    """
+    Write the sidecars of one file.
+
+    A sidecar that is not smaller than its source is removed instead.
+
+    Args:
+        file_path: Path of the source file
+        encodings: Content encodings to write sidecars for
+
+    Returns:
+        Dictionary mapping each encoding to the sidecar size in bytes, or None if no sidecar was kept
+    """
+    data = Path(file_path).read_bytes()
+    stat = os.stat(file_path)
+    sizes = {}
+    for encoding in encodings:
+        sidecar_path = get_sidecar_path(file_path, encoding)
+        compressed = compress(data, encoding)
+        if len(compressed) >= len(data):
+            sidecar_path.unlink(missing_ok=True)
+            sizes[encoding] = None
+            continue
+
+        temp_path = sidecar_path.with_name(sidecar_path.name + '.tmp')
+        temp_path.write_bytes(compressed)
+        os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(temp_path, sidecar_path)
+        sizes[encoding] = len(compressed)
+    return sizes
+
+
+def sidecars_current(file_path, entry, encodings, mtime_ns=None):
+    """
+    Check that every sidecar recorded in a cache entry exists.
+
+    Args:
+        file_path: Path of the source file
+        entry: Cache entry of the file
+        encodings: Content encodings sidecars are needed for
+        mtime_ns: If given, every sidecar must also have this modification time
+
+    Returns:
+        True if the sidecars are complete
+    """
+    for encoding in encodings:
+        if encoding not in entry['sidecars']:
+            return False
+        if entry['sidecars'][encoding] is None:
+            continue
+        try:
+            sidecar_mtime_ns = os.stat(get_sidecar_path(file_path, encoding)).st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns is not None and sidecar_mtime_ns != mtime_ns:
+            return False
+    return True
+
+
+def find_precompress_files(base_path):
+    """
+    Find the files that get sidecars.
+
+    Args:
+        base_path: Path of the root directory
+
+    Returns:
+        Sorted list of file paths relative to the root directory
+    """
+    files = set()
+    for pattern in PRECOMPRESS_PATTERNS:
+        for file_path in base_path.glob(pattern):
+            if file_path.is_file():
+                files.add(file_path.relative_to(base_path).as_posix())
+    return sorted(files)
+
+
+def precompress_site(base_dir=".", min_size=PRECOMPRESS_MIN_SIZE):
+    """
+    Write sidecars for every changed output file and remove outdated ones.
+
+    Unchanged files are recognised by size and modification time, or by their
+    content hash when those differ, and are not recompressed.
+
+    Args:
+        base_dir: The root directory of the website
+        min_size: Files smaller than this many bytes get no sidecars
+
+    Returns:
+        Dictionary with the number of compressed and reused files and per-type
+        totals: {suffix: {'files': n, 'bytes': n, 'gzip': n, 'br': n}}
+    """
+    base_path = Path(base_dir)
+    cache_path = base_path / PRECOMPRESS_CACHE
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    previous = cache.get('files', {}) if cache.get('version') == PRECOMPRESS_VERSION else {}
+
+    encodings = get_encodings()
+    files = {}
+    compressed = 0
+    reused = 0
+    for key in find_precompress_files(base_path):
+        file_path = base_path / key
+        stat = os.stat(file_path)
+        if stat.st_size < min_size:
+            continue
+
+        entry = previous.get(key)
+        if (entry and (stat.st_size, stat.st_mtime_ns) == (entry['size'], entry['mtime_ns'])
+                and sidecars_current(file_path, entry, encodings, stat.st_mtime_ns)):
+            files[key] = entry
+            reused += 1
+            continue
+
+        digest = hash_file(file_path)
+        if entry and digest == entry['hash'] and sidecars_current(file_path, entry, encodings):
+            # Rewritten with the same content: only the modification times need updating
+            for encoding in encodings:
+                if entry['sidecars'][encoding] is not None:
+                    os.utime(get_sidecar_path(file_path, encoding), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            files[key] = dict(entry, mtime_ns=stat.st_mtime_ns)
+            reused += 1
+            continue
+
+        files[key] = {
+            'hash': digest,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sidecars': write_sidecars(file_path, encodings)
+        }
+        compressed += 1
+
+    # Remove sidecars of files that disappeared or shrank below the threshold
+    for key, entry in previous.items():
+        for encoding, size in entry['sidecars'].items():
+            if size is not None and (key not in files or files[key]['sidecars'].get(encoding) is None):
+                get_sidecar_path(base_path / key, encoding).unlink(missing_ok=True)
+
+    if files != previous:
+        temp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PRECOMPRESS_VERSION, 'files': files}, f, indent=2)
+        os.replace(temp_path, cache_path)
+
+    types = {}
+    for key, entry in files.items():
+        totals = types.setdefault(Path(key).suffix, {'files': 0, 'bytes': 0, 'gzip': 0, 'br': 0})
+        totals['files'] += 1
+        totals['bytes'] += entry['size']
+        for encoding, size in entry['sidecars'].items():
+            totals[encoding] += entry['size'] if size is None else size
+
+    return {'compressed': compressed, 'reused': reused, 'types': types}
+
+
+def print_compression_report(stats):
+    """
+    Print the compression ratio per file type.
+
+    Args:
+        stats: Dictionary returned by precompress_site
+    """
+    print(f"Precompressed {stats['compressed']} file(s), {stats['reused']} unchanged")
+    if brotli is None:
+        print("brotli is not installed, only gzip sidecars are written")
+    for suffix, totals in sorted(stats['types'].items()):
+        line = f"  {suffix:6s} {totals['files']:4d} file(s) {totals['bytes'] / 1024:9.1f} KB"
+        for encoding in get_encodings():
+            ratio = totals[encoding] / totals['bytes'] if totals['bytes'] else 1
+            line += f"   {encoding} {totals[encoding] / 1024:8.1f} KB ({ratio:.1%})"
+        print(line)
+
+
+def main():
+    """Precompress the generated site."""
+    parser = argparse.ArgumentParser(description="Write .gz/.br sidecars for the generated site.")
+    parser.add_argument('--min-size', type=int, default=PRECOMPRESS_MIN_SIZE, metavar='BYTES',
+                        help=f"skip files smaller than this (default: {PRECOMPRESS_MIN_SIZE})")
+    args = parser.parse_args()
+
+    print_compression_report(precompress_site(min_size=args.min_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
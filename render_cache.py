@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Persistent Render Cache
+A content-addressed on-disk cache of converted guides, shared by builds: the
+metadata extracted while converting a guide (description, headings, links,
+images and search postings), with the files written for it copied into the
+cache as attachments of the entry: the rendered page and the row data of its
+paginated tables. Pages are copied file to file and never held in memory.
+Entries are keyed by a hash of the markdown source, its output path, the
+converter version, the page template hash and the image catalog hash, so an
+entry is only ever reused for identical output and never needs invalidating.
+
+The build manifest only knows the previous build of one checkout; the render
+cache makes a fresh checkout cheap to build as well, e.g. in CI with the
+cache directory restored between jobs. Entries are written atomically under
+unique temporary names, so concurrent builds can share a cache directory.
+Reading an entry refreshes its modification time, and prune() evicts the
+least recently used entries beyond the size cap.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+# Default cache directory, relative to the root directory
+RENDER_CACHE_DIR = '.render-cache'
+
+# Default size cap of the cache directory
+RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the layout of the entries changes
+RENDER_CACHE_VERSION = 4
+
+# Temporary files left behind by interrupted writers are removed after this many seconds
+STALE_TEMP_SECONDS = 3600
+
+
+class DiskRenderCache:
+    """On-disk cache of converted guides, addressed by the hash of everything their output depends on."""
+
+    def __init__(self, settings, cache_dir=RENDER_CACHE_DIR, max_bytes=RENDER_CACHE_MAX_BYTES):
+        """
+        Args:
+            settings: Build settings from convert_markdown.get_build_settings
+            cache_dir: Directory holding the entries
+            max_bytes: Size cap enforced by prune()
+        """
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = max_bytes
+        self.settings_key = json.dumps([RENDER_CACHE_VERSION, settings['converter_version'],
+                                        settings['template_hash'], settings['image_hash']])
+
+    def get_key(self, source, relative_path):
+        """
+        Compute the key of a guide.
+
+        Args:
+            source: Content of the markdown file as bytes
+            relative_path: Path of the generated HTML file relative to the root
+                           directory; it determines the title, asset paths and table data names
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256()
+        digest.update(self.settings_key.encode('utf-8'))
+        digest.update(b'\0' + Path(relative_path).as_posix().encode('utf-8') + b'\0')
+        digest.update(source)
+        return digest.hexdigest()
+
+    def get_entry_path(self, key):
+        """Return the path of an entry; entries are spread over 256 subdirectories."""
+        return Path(self.cache_dir) / key[:2] / f'{key}.json'
+
+    def get_attachment_path(self, key, name):
+        """Return the path of a file attached to an entry, next to the entry."""
+        return Path(self.cache_dir) / key[:2] / f'{key}-{name}'
+
+    def get(self, key):
+        """
+        Read an entry and mark it and its attachments as recently used.
+
+        Args:
+            key: Key from get_key
+
+        Returns:
+            Entry dictionary, or None if there is no (readable) entry or an attachment was evicted
+        """
+        entry_path = self.get_entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(entry_path)
+            for name in entry['attachments']:
+                os.utime(self.get_attachment_path(key, name))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def put(self, key, entry, attachments=None):
+        """
+        Atomically write an entry; entries larger than the size cap are not stored.
+
+        Attachments are copied first, so an entry is never read without them.
+
+        Args:
+            key: Key from get_key
+            entry: JSON-serializable entry dictionary
+            attachments: Optional dictionary mapping attachment name to the path of the file to copy
+        """
+        attachments = attachments or {}
+        entry = dict(entry, attachments=sorted(attachments))
+        data = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if len(data) + sum(os.path.getsize(path) for path in attachments.values()) > self.max_bytes:
+            return
+
+        entry_path = self.get_entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        for name, path in attachments.items():
+            fd, temp_path = tempfile.mkstemp(dir=entry_path.parent, prefix=f'{key}.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f, open(path, 'rb') as source:
+                    shutil.copyfileobj(source, f)
+                os.replace(temp_path, self.get_attachment_path(key, name))
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+        fd, temp_path = tempfile.mkstemp(dir=entry_path.parent, prefix=f'{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, entry_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def prune(self):
+        """
+        Evict the least recently used entries until the cache fits its size cap.
+
+        Entries and attachments are evicted file by file; an entry whose
+        attachment was evicted is a miss and ages out like any unused entry.
+
+        Returns:
+            Dictionary with the number and total size of the remaining and evicted entries
+        """
+        entries = []
+        now = time.time()
+        for path in Path(self.cache_dir).glob('*/*'):
+            try:
+                stat = path.stat()
+                if path.suffix == '.tmp':
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        path.unlink()
+                    continue
+            except OSError:
+                # Removed by a concurrent build
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        # Attachments are named '<key>-<name>' and only count towards the size
+        count = sum(1 for _, _, path in entries if '-' not in path.name)
+        evicted = 0
+        evicted_bytes = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            size -= entry_size
+            evicted += '-' not in path.name
+            evicted_bytes += entry_size
+
+        return {
+            'entries': count - evicted,
+            'bytes': size,
+            'evicted': evicted,
+            'evicted_bytes': evicted_bytes
+        }
+
+
+def print_cache_report(stats):
+    """Print the summary returned by DiskRenderCache.prune."""
+    print(f"Render cache: {stats['entries']} entries ({stats['bytes'] / (1024 * 1024):.1f} MB)"
+          + (f", evicted {stats['evicted']} ({stats['evicted_bytes'] / (1024 * 1024):.1f} MB)"
+             if stats['evicted'] else ''))
+
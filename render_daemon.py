@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Render Daemon for Live Previews
+A long-running asyncio service that renders guide markdown the way the build
+does, for authoring tools that preview a guide while it is edited. Markdown
+POSTed to /render is returned as an HTML fragment (the converted content) or
+as a full page (the content in the site template with its sidebar table of
+contents).
+
+Rendered responses are kept in a size-bounded LRU cache keyed by the SHA-256
+of the markdown and the template variant, so re-sending unchanged text is
+answered from memory; identical requests arriving while one is being rendered
+share that render. Large documents render in worker threads, each in a
+render context of one shared converter, so the event loop keeps answering
+cache hits and /__stats while they convert. Request, cache and render latency
+counters are served as JSON at /__stats.
+
+The site template, asset bundles and image catalog are read once at start;
+restart the daemon after rebuilding them.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict, deque
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from convert_markdown import MarkdownToHTMLConverter, create_html_template, create_toc
+from static_server import KEEP_ALIVE_TIMEOUT, LATENCY_SAMPLES, MAX_HEADER_SIZE, STATS_PATH, ServerStats, StaticServer
+
+# Default port of the daemon; it only listens on the loopback interface unless told otherwise
+RENDER_PORT = 8090
+
+# Endpoint rendering the POSTed markdown
+RENDER_PATH = '/render'
+
+# Requests with a larger markdown body are rejected
+MAX_BODY_SIZE = 8 * 1024 * 1024
+
+# Smaller documents render in well under a millisecond and are rendered on the event loop;
+# larger ones go to a worker thread so the loop keeps answering cache hits meanwhile
+INLINE_RENDER_MAX_BYTES = 16 * 1024
+
+# Memory for cached responses
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+SERVER_NAME = 'efbt-render'
+
+# Page path assumed for full pages when the request names none; it sets the depth of the asset paths
+DEFAULT_PREVIEW_PATH = 'user-guide/preview.html'
+
+RENDER_MODES = ('fragment', 'page')
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered responses, keyed by content hash and template variant."""
+
+    def __init__(self, max_bytes=RENDER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Look up a rendered response.
+
+        Args:
+            key: Cache key, see get_render_key
+
+        Returns:
+            Response body as bytes, or None on a miss
+        """
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body):
+        """Store a rendered response, evicting the least recently used ones beyond max_bytes."""
+        if len(body) > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self.entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class RenderStats(ServerStats):
+    """Request counters of the daemon, with the latencies of the renders themselves."""
+
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+        self.shared = 0
+        self.render_latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record_render(self, seconds):
+        """Count one render that was not answered from the cache."""
+        self.renders += 1
+        self.render_latencies.append(seconds)
+
+    def snapshot(self, cache):
+        """
+        Summarize the counters.
+
+        Args:
+            cache: RenderCache of the daemon
+
+        Returns:
+            Dictionary with request, cache, request latency and render latency counters
+        """
+        summary = super().snapshot(cache)
+        del summary['precompressed'], summary['sendfile']
+        summary['cache']['entries'] = summary['cache'].pop('files')
+        summary['cache']['hits'] = cache.hits
+        summary['cache']['misses'] = cache.misses
+        summary['renders'] = self.renders
+        summary['shared_renders'] = self.shared
+        latencies = sorted(self.render_latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return 0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        summary['render_latency_ms'] = {
+            'p50': round(percentile(0.5), 3),
+            'p90': round(percentile(0.9), 3),
+            'p99': round(percentile(0.99), 3),
+            'max': round(latencies[-1] * 1000, 3) if latencies else 0
+        }
+        return summary
+
+
+def get_render_key(markdown_bytes, mode, title, path_depth):
+    """
+    Build the cache key of a render request.
+
+    Args:
+        markdown_bytes: The POSTed markdown
+        mode: 'fragment' or 'page'
+        title: Page title; only part of the key for full pages
+        path_depth: Directory depth of the page; only part of the key for full pages
+
+    Returns:
+        Hashable cache key
+    """
+    digest = hashlib.sha256(markdown_bytes).hexdigest()
+    if mode == 'fragment':
+        return digest, mode
+    return digest, mode, title, path_depth
+
+
+def get_title_from_path(page_path):
+    """Derive the page title from the page file name, as the build does."""
+    return Path(page_path).stem.replace('_', ' ').replace('-', ' ').title()
+
+
+class RenderServer(StaticServer):
+    """Renders POSTed markdown over HTTP/1.1, reusing the response handling of StaticServer."""
+
+    server_name = SERVER_NAME
+
+    def __init__(self, site_dir=".", cache=None, image_catalog=None):
+        super().__init__(cache or RenderCache())
+        self.stats = RenderStats()
+        self.site_dir = str(site_dir)
+        self.converter = MarkdownToHTMLConverter(image_catalog)
+        self.pending = {}  # Cache key -> future of the render in progress
+
+    def render(self, markdown_text, mode, title, relative_path):
+        """
+        Render markdown in a render context of the shared converter.
+
+        Safe to call from worker threads.
+
+        Returns:
+            Rendered HTML as bytes
+        """
+        context = self.converter.render_context()
+        content = context.convert(markdown_text)
+        if mode == 'fragment':
+            return content.encode('utf-8')
+        return create_html_template(content, title, relative_path, create_toc(context.headings),
+                                    self.site_dir).encode('utf-8')
+
+    async def get_rendered(self, key, markdown_bytes, mode, title, relative_path):
+        """
+        Return the rendered response for a key, rendering it only once.
+
+        A request sharing a render that is cancelled renders the markdown itself.
+
+        Returns:
+            Tuple of (response body, cache status: 'hit', 'shared' or 'miss')
+        """
+        body = self.cache.get(key)
+        if body is not None:
+            return body, 'hit'
+
+        pending = self.pending.get(key)
+        while pending is not None:
+            self.stats.shared += 1
+            try:
+                return await asyncio.shield(pending), 'shared'
+            except asyncio.CancelledError:
+                # Retry unless this request was cancelled rather than the one rendering
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            pending = self.pending.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            started = time.perf_counter()
+            markdown_text = markdown_bytes.decode('utf-8')
+            if len(markdown_bytes) <= INLINE_RENDER_MAX_BYTES:
+                body = self.render(markdown_text, mode, title, relative_path)
+            else:
+                body = await asyncio.to_thread(self.render, markdown_text, mode, title, relative_path)
+            self.stats.record_render(time.perf_counter() - started)
+            self.cache.put(key, body)
+            future.set_result(body)
+        except asyncio.CancelledError:
+            # Requests waiting for this render retry it
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no other request waited for it
+            future.exception()
+            raise
+        finally:
+            del self.pending[key]
+        return body, 'miss'
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve the requests of one connection until it is closed or idle.
+
+        Args:
+            reader: asyncio StreamReader of the connection
+            writer: asyncio StreamWriter of the connection
+        """
+        self.stats.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, False, False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                started = time.perf_counter()
+                status, body_bytes, keep_alive = await self.handle_request(head, writer, reader)
+                self.stats.record(status, body_bytes, time.perf_counter() - started)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, head, writer, reader):
+        """
+        Answer one request.
+
+        Args:
+            head: Raw request line and headers
+            writer: asyncio StreamWriter of the connection
+            reader: asyncio StreamReader of the connection, positioned at the request body
+
+        Returns:
+            Tuple of (status code, body bytes sent, whether to keep the connection open)
+        """
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return await self.send_error(writer, HTTPStatus.BAD_REQUEST, False, False)
+
+        headers = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(':')
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            keep_alive = connection != 'close'
+        else:
+            keep_alive = connection == 'keep-alive'
+
+        path, _, query = target.partition('?')
+        if path == STATS_PATH and method in ('GET', 'HEAD'):
+            body = json.dumps(self.stats.snapshot(self.cache), indent=2).encode('utf-8')
+            response_headers = {'Content-Type': 'application/json; charset=utf-8', 'Cache-Control': 'no-store'}
+            return await self.send_response(writer, HTTPStatus.OK, response_headers, body, keep_alive,
+                                            method == 'HEAD')
+        if path != RENDER_PATH:
+            # The body of an unexpected request is not read, so the connection cannot be reused
+            return await self.send_error(writer, HTTPStatus.NOT_FOUND, False, method == 'HEAD')
+        if method != 'POST':
+            return await self.send_error(writer, HTTPStatus.METHOD_NOT_ALLOWED, False, method == 'HEAD')
+
+        try:
+            length = int(headers['content-length'])
+        except (KeyError, ValueError):
+            return await self.send_error(writer, HTTPStatus.LENGTH_REQUIRED, False, False)
+        if not 0 <= length <= MAX_BODY_SIZE:
+            return await self.send_error(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, False, False)
+        markdown_bytes = await reader.readexactly(length)
+
+        parameters = {name: values[-1] for name, values in parse_qs(query).items()}
+        mode = parameters.get('mode', 'fragment')
+        relative_path = parameters.get('path', DEFAULT_PREVIEW_PATH).lstrip('/')
+        title = parameters.get('title') or get_title_from_path(relative_path)
+        if mode not in RENDER_MODES:
+            return await self.send_error(writer, HTTPStatus.BAD_REQUEST, keep_alive, False)
+
+        key = get_render_key(markdown_bytes, mode, title, relative_path.count('/'))
+        try:
+            body, cache_status = await self.get_rendered(key, markdown_bytes, mode, title, relative_path)
+        except UnicodeDecodeError:
+            return await self.send_error(writer, HTTPStatus.BAD_REQUEST, keep_alive, False)
+        except Exception as e:
+            print(f"Error rendering {len(markdown_bytes)} bytes of markdown: {e}")
+            return await self.send_error(writer, HTTPStatus.INTERNAL_SERVER_ERROR, keep_alive, False)
+
+        response_headers = {
+            'Content-Type': 'text/html; charset=utf-8',
+            'Cache-Control': 'no-store',
+            'X-Render-Cache': cache_status
+        }
+        return await self.send_response(writer, HTTPStatus.OK, response_headers, body, keep_alive, False)
+
+
+async def run_daemon(render_server, host, port):
+    """
+    Listen for render requests and serve until cancelled.
+
+    Args:
+        render_server: RenderServer handling the requests
+        host: Interface to bind to
+        port: Port to listen on
+    """
+    # Build the page template before the first request needs it
+    render_server.render('', 'page', get_title_from_path(DEFAULT_PREVIEW_PATH), DEFAULT_PREVIEW_PATH)
+    server = await asyncio.start_server(render_server.handle_connection, host, port, limit=MAX_HEADER_SIZE,
+                                        reuse_address=True)
+    print(f"Rendering markdown POSTed to http://{host}:{port}{RENDER_PATH}?mode=fragment|page")
+    print(f"Request statistics at http://{host}:{port}{STATS_PATH}")
+    print("Press Ctrl+C to stop")
+    await server.serve_forever()
+
+
+def main():
+    """Run the render daemon."""
+    parser = argparse.ArgumentParser(description="Render guide markdown over HTTP for live previews.")
+    parser.add_argument('--root', default='.', help="site whose template and images are used (default: .)")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind to (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=RENDER_PORT, help=f"port to listen on (default: {RENDER_PORT})")
+    parser.add_argument('--cache-size', type=int, default=RENDER_CACHE_MAX_BYTES // (1024 * 1024), metavar='MB',
+                        help=f"memory for cached renders (default: {RENDER_CACHE_MAX_BYTES // (1024 * 1024)})")
+    parser.add_argument('--no-images', action='store_true',
+                        help="skip the image catalog; images are rendered without sizes and variants")
+    args = parser.parse_args()
+
+    image_catalog = None
+    if not args.no_images:
+        from image_pipeline import build_image_catalog
+        image_catalog = build_image_catalog(args.root)
+
+    render_server = RenderServer(args.root, RenderCache(args.cache_size * 1024 * 1024), image_catalog)
+    try:
+        asyncio.run(run_daemon(render_server, args.host, args.port))
+    except KeyboardInterrupt:
+        print()
+        print("Stopping the render daemon...")
+        print(json.dumps(render_server.stats.snapshot(render_server.cache), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
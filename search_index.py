@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Full-Text Search Index for the User Guides
+Builds an inverted index (term -> guide section and word positions) from the
+markdown converter's parsed blocks, sharded by term prefix so a browser only
+fetches the shards a query needs. Written next to user-guide/index.json by
+convert_markdown.py; js/guide-search.js queries it in the browser and the
+SearchIndex class below queries it from Python.
+
+The terms of a guide are collected while it is converted (GuidePostings) and
+stored per guide, so building the index never parses the markdown again.
+Every shard is a list of per-guide fragments: SearchIndexBuilder keeps the
+fragments between builds and rewrites only the shards whose fragments of
+the changed guides differ.
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from convert_markdown import HTML_TAG_PATTERN, MarkdownToHTMLConverter, iter_source_lines, write_if_changed
+
+# Index description read first by every client, relative to the guide output directory
+SEARCH_INDEX_FILE = 'search-index.json'
+
+# Directory holding the term shards, relative to the guide output directory
+SEARCH_SHARD_DIR = 'search'
+
+# Directory holding the postings collected while converting each guide, relative to the root directory
+SEARCH_POSTINGS_DIR = '.search-postings'
+
+# Bump whenever the index layout changes
+SEARCH_INDEX_VERSION = 2
+
+# Shards are keyed by the first character of a term, or by the first two
+# once the index holds more word positions than this
+SHARD_SPLIT_POSITIONS = 200000
+
+# Terms are lowercase ASCII words of at least two characters
+TERM_PATTERN = re.compile(r'[a-z0-9]{2,}')
+LINK_TARGET_PATTERN = re.compile(r'\]\([^\)]*\)')
+
+STOP_WORDS = frozenset([
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in', 'into', 'is', 'it',
+    'its', 'of', 'on', 'or', 'so', 'that', 'the', 'then', 'this', 'to', 'was', 'will', 'with'
+])
+
+
+def tokenize(text):
+    """
+    Split text into index terms.
+
+    Args:
+        text: Plain or markdown text
+
+    Returns:
+        List of lowercase terms, stop words removed
+    """
+    return [term for term in TERM_PATTERN.findall(text.lower()) if term not in STOP_WORDS]
+
+
+def get_block_text(block):
+    """
+    Return the searchable text of a parsed markdown block.
+
+    Link targets and raw HTML tags are dropped, link labels, image alt texts
+    and code are kept.
+
+    Args:
+        block: Block tuple produced by MarkdownToHTMLConverter.parse_lines()
+
+    Returns:
+        Text string, empty for blocks without text
+    """
+    kind = block[0]
+    if kind in ('para', 'quote', 'raw'):
+        text = block[1]
+    elif kind == 'list_item':
+        text = block[3]
+    elif kind == 'table':
+        text = ' '.join(' '.join(cells) for cells in block[1] if cells is not None)
+    elif kind == 'code':
+        text = ' '.join(block[2])
+    else:
+        return ''
+    return HTML_TAG_PATTERN.sub(' ', LINK_TARGET_PATTERN.sub('] ', text))
+
+
+class GuidePostings:
+    """
+    Collects the sections and term positions of one guide while it is converted.
+
+    Heading anchors are the ones of the converted page. Text before the first
+    heading belongs to a section with an empty anchor. Word positions count
+    from the start of their section, so an edit only changes the postings of
+    the terms in the edited section.
+    """
+
+    def __init__(self):
+        self.sections = [['', '']]
+        self.terms = {}      # term -> {section number: [word positions]}
+        self.positions = 0   # Word positions in the guide
+        self.position = 0    # Next word position in the current section
+
+    def add_block(self, block, headings):
+        """
+        Add the terms of a rendered block.
+
+        Args:
+            block: Block tuple produced by MarkdownToHTMLConverter.parse_lines()
+            headings: Headings the converter recorded so far, the block's own included
+        """
+        if block[0] == 'heading':
+            _, anchor, text = headings[-1]
+            self.sections.append([anchor, text])
+            self.position = 0
+        else:
+            text = get_block_text(block)
+            if not text:
+                return
+
+        section = len(self.sections) - 1
+        for term in tokenize(text):
+            self.terms.setdefault(term, {}).setdefault(section, []).append(self.position)
+            self.position += 1
+            self.positions += 1
+
+    def to_dict(self):
+        """
+        Return the postings in their stored form.
+
+        Returns:
+            Dictionary with the sections as [anchor, heading text] lists, the number
+            of word positions and, per term, a list of [section, positions...] lists
+        """
+        return {
+            'sections': self.sections,
+            'positions': self.positions,
+            'terms': {term: [[section] + positions for section, positions in sections.items()]
+                      for term, sections in sorted(self.terms.items())}
+        }
+
+
+def index_guide(markdown_file_path):
+    """
+    Collect the postings of one guide without converting it.
+
+    Used for guides whose postings were not stored while converting them.
+
+    Args:
+        markdown_file_path: Path to the markdown file
+
+    Returns:
+        Postings dictionary, see GuidePostings.to_dict
+    """
+    converter = MarkdownToHTMLConverter()
+    postings = GuidePostings()
+
+    with open(markdown_file_path, 'r', encoding='utf-8') as f:
+        for block in converter.parse_lines(iter_source_lines(f)):
+            if block[0] == 'heading':
+                converter.convert_header(block[1], block[2])
+            postings.add_block(block, converter.headings)
+
+    return postings.to_dict()
+
+
+def get_postings_path(guide_path, root_dir="."):
+    """
+    Return the path of the stored postings of a guide.
+
+    Args:
+        guide_path: Path of the generated HTML file relative to the root directory
+        root_dir: The root directory of the site
+    """
+    return Path(root_dir) / SEARCH_POSTINGS_DIR / Path(guide_path).with_suffix('.json')
+
+
+def write_guide_postings(guide_path, postings, root_dir="."):
+    """
+    Store the postings of a guide for the next search index build.
+
+    Args:
+        guide_path: Path of the generated HTML file relative to the root directory
+        postings: Postings dictionary, see GuidePostings.to_dict
+        root_dir: The root directory of the site
+    """
+    write_if_changed(get_postings_path(guide_path, root_dir),
+                     json.dumps(postings, separators=(',', ':'), ensure_ascii=False))
+
+
+def read_guide_postings(guide_path, root_dir="."):
+    """
+    Read the stored postings of a guide.
+
+    Args:
+        guide_path: Path of the generated HTML file relative to the root directory
+        root_dir: The root directory of the site
+
+    Returns:
+        Postings dictionary, or None if none were stored
+    """
+    try:
+        with open(get_postings_path(guide_path, root_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_guide_fragments(terms, prefix_length):
+    """
+    Serialize the postings of one guide per shard.
+
+    Args:
+        terms: Postings of the guide, term -> list of [section, positions...] lists
+        prefix_length: Number of leading term characters that select a shard
+
+    Returns:
+        Dictionary mapping shard prefix to the JSON object of the guide's terms in that shard
+    """
+    groups = {}
+    for term, postings in terms.items():
+        groups.setdefault(term[:prefix_length], {})[term] = postings
+    return {prefix: json.dumps(group, separators=(',', ':'), ensure_ascii=False) for prefix, group in groups.items()}
+
+
+class SearchIndexBuilder:
+    """
+    Merges the stored postings of the guides into the sharded search index.
+
+    A shard holds one [guide number, {term: [[section, positions...], ...]}]
+    fragment per guide using its prefix, one fragment per line, and the index
+    file one guide per line. The builder keeps the fragments of every guide,
+    read back from the previous index when it starts, so a build only reads
+    the postings of the changed guides and rewrites the shards whose
+    fragments changed. Shards read back are split into fragments only once
+    one of their fragments changes.
+    """
+
+    def __init__(self, output_dir="user-guide", prefix_length=None):
+        """
+        Args:
+            output_dir: Directory where the guide index (index.json) is written
+            prefix_length: Number of leading term characters that select a shard,
+                           chosen from the index size if not given
+        """
+        self.output_dir = Path(output_dir)
+        self.fixed_prefix_length = prefix_length
+        self.prefix_length = None
+        self.order = []           # Guide paths in index order
+        self.guides = {}          # Guide path -> index entry JSON, section and position counts
+        self.shards = {}          # Shard prefix -> {guide path: fragment JSON}, or the content of a restored shard
+        self.shard_bytes = {}     # Shard prefix -> size of the written shard
+        self.index_bytes = 0
+        self.restored_order = []  # Guide paths by guide number in the restored shards
+        self.restored_numbers = {}
+
+    def load_guide(self, markdown_file_path, guide_metadata):
+        """Read the stored postings of a guide, or collect them from its source if there are none."""
+        postings = read_guide_postings(guide_metadata['path'], self.output_dir.parent)
+        if postings is None:
+            postings = index_guide(markdown_file_path)
+        entry = {
+            'slug': guide_metadata['slug'],
+            'title': guide_metadata['title'],
+            'path': guide_metadata['path'],
+            'positions': postings['positions'],
+            'sections': postings['sections']
+        }
+        self.guides[guide_metadata['path']] = {
+            'entry': json.dumps(entry, separators=(',', ':'), ensure_ascii=False),
+            'sections': len(postings['sections']),
+            'positions': postings['positions']
+        }
+        return postings['terms']
+
+    def restore(self):
+        """
+        Read the guides and fragments of the index written by an earlier build.
+
+        Returns:
+            True if the index was restored, False if there is no readable index of this version
+        """
+        shard_path = self.output_dir / SEARCH_SHARD_DIR
+        try:
+            lines = (self.output_dir / SEARCH_INDEX_FILE).read_text(encoding='utf-8').split('\n')
+            header = json.loads(lines[0] + ']}')
+            if header.get('version') != SEARCH_INDEX_VERSION:
+                return False
+            order = []
+            guides = {}
+            for line in filter(None, lines[1:-1]):
+                entry = json.loads(line.rstrip(','))
+                order.append(entry['path'])
+                guides[entry['path']] = {'entry': line.rstrip(','), 'sections': len(entry['sections']),
+                                         'positions': entry['positions']}
+
+            shards = {}
+            shard_bytes = {}
+            for prefix in header['shards']:
+                content = (shard_path / f'{prefix}.json').read_text(encoding='utf-8')
+                shards[prefix] = content
+                shard_bytes[prefix] = len(content.encode('utf-8'))
+        except (OSError, ValueError, KeyError, IndexError):
+            return False
+
+        self.prefix_length = header['prefix_length']
+        self.order = order
+        self.restored_order = order
+        self.restored_numbers = {guide_path: number for number, guide_path in enumerate(order)}
+        self.guides = guides
+        self.shards = shards
+        self.shard_bytes = shard_bytes
+        return True
+
+    def get_shard(self, prefix):
+        """Return the fragments of a shard by guide path, splitting a restored shard into fragments."""
+        shard = self.shards.setdefault(prefix, {})
+        if isinstance(shard, str):
+            fragments = self.shards[prefix] = {}
+            for line in shard.split('\n')[1:-1]:
+                separator = line.index(',')
+                guide_path = self.restored_order[int(line[1:separator])]
+                fragments[guide_path] = line[separator + 1:len(line.rstrip(',')) - 1]
+            return fragments
+        return shard
+
+    def has_fragment(self, prefix, guide_path, fragment=None):
+        """Check whether a shard holds a fragment of a guide, or exactly the given fragment."""
+        shard = self.shards.get(prefix)
+        if isinstance(shard, str):
+            # Restored shards are searched without splitting them
+            if guide_path not in self.restored_numbers:
+                return False
+            line = f'\n[{self.restored_numbers[guide_path]},' + (f'{fragment}]' if fragment is not None else '')
+            return line in shard
+        if shard is None or guide_path not in shard:
+            return False
+        return fragment is None or shard[guide_path] == fragment
+
+    def set_fragments(self, guide_path, fragments, dirty):
+        """Replace the shard fragments of a guide and record the prefixes of the shards that change."""
+        for prefix in list(self.shards):
+            if prefix not in fragments and self.has_fragment(prefix, guide_path):
+                del self.get_shard(prefix)[guide_path]
+                dirty.add(prefix)
+        for prefix, fragment in fragments.items():
+            if not self.has_fragment(prefix, guide_path, fragment):
+                self.get_shard(prefix)[guide_path] = fragment
+                dirty.add(prefix)
+
+    def build(self, guides, changed=None):
+        """
+        Update the search index for a set of guides.
+
+        Args:
+            guides: List of (markdown_file_path, guide_metadata) tuples of the guides to index
+            changed: Paths (guide_metadata['path']) of the guides converted since the
+                     index was last written; None reads the postings of every guide
+
+        Returns:
+            Dictionary with the number of guides, sections and shards and the index size in bytes
+        """
+        if self.prefix_length is None and changed is not None:
+            self.restore()
+
+        order = [guide_metadata['path'] for _, guide_metadata in guides]
+        dirty = set()
+
+        # Guides that were removed
+        current = set(order)
+        for guide_path in [guide_path for guide_path in self.guides if guide_path not in current]:
+            del self.guides[guide_path]
+            self.set_fragments(guide_path, {}, dirty)
+
+        loaded = {}
+        for markdown_file_path, guide_metadata in guides:
+            guide_path = guide_metadata['path']
+            if changed is None or guide_path in changed or guide_path not in self.guides:
+                loaded[guide_path] = self.load_guide(markdown_file_path, guide_metadata)
+
+        prefix_length = self.fixed_prefix_length
+        if prefix_length is None:
+            positions = sum(guide['positions'] for guide in self.guides.values())
+            prefix_length = 1 if positions <= SHARD_SPLIT_POSITIONS else 2
+        if prefix_length != self.prefix_length:
+            # Every fragment changes; guides not loaded in this build are read again
+            self.prefix_length = prefix_length
+            self.shards = {}
+            self.shard_bytes = {}
+            for markdown_file_path, guide_metadata in guides:
+                if guide_metadata['path'] not in loaded:
+                    loaded[guide_metadata['path']] = self.load_guide(markdown_file_path, guide_metadata)
+
+        for guide_path, terms in loaded.items():
+            self.set_fragments(guide_path, get_guide_fragments(terms, prefix_length), dirty)
+
+        # Shards hold guide numbers, so every shard changes when guides are added, removed or reordered
+        if order != self.order:
+            self.order = order
+            dirty.update(self.shards)
+
+        shard_path = self.output_dir / SEARCH_SHARD_DIR
+        shard_path.mkdir(parents=True, exist_ok=True)
+        if not self.shard_bytes:
+            # Nothing written or restored yet: shards of earlier builds that are no longer needed are removed below
+            dirty.update(path.stem for path in shard_path.glob('*.json'))
+
+        numbers = {guide_path: number for number, guide_path in enumerate(order)}
+        for prefix in dirty:
+            fragments = self.get_shard(prefix) if prefix in self.shards else None
+            if not fragments:
+                self.shards.pop(prefix, None)
+                self.shard_bytes.pop(prefix, None)
+                (shard_path / f'{prefix}.json').unlink(missing_ok=True)
+                continue
+            content = '[\n' + ',\n'.join(f'[{number},{fragment}]' for number, fragment in
+                                          sorted((numbers[guide_path], fragment)
+                                                 for guide_path, fragment in fragments.items())) + '\n]'
+            self.shard_bytes[prefix] = write_if_changed(shard_path / f'{prefix}.json', content)
+
+        content = (f'{{"version":{SEARCH_INDEX_VERSION},"prefix_length":{prefix_length},'
+                   f'"shards":{json.dumps(sorted(self.shards), ensure_ascii=False)},"guides":[\n'
+                   + ',\n'.join(self.guides[guide_path]['entry'] for guide_path in order) + '\n]}')
+        self.index_bytes = write_if_changed(self.output_dir / SEARCH_INDEX_FILE, content)
+
+        return {
+            'guides': len(order),
+            'sections': sum(guide['sections'] for guide in self.guides.values()),
+            'shards': len(self.shards),
+            'bytes': sum(self.shard_bytes.values()) + self.index_bytes
+        }
+
+
+def build_search_index(guides, output_dir="user-guide", prefix_length=None, changed=None):
+    """
+    Build the sharded search index for a set of guides.
+
+    The index is merged from the postings stored while converting the guides.
+    Given the guides converted since the last build, only their postings are
+    read and merged into the previous index; shards that are no longer needed
+    are removed and unchanged shards are left untouched.
+
+    Args:
+        guides: List of (markdown_file_path, guide_metadata) tuples of the guides to index
+        output_dir: Directory where the guide index (index.json) is written
+        prefix_length: Number of leading term characters that select a shard,
+                       chosen from the index size if not given
+        changed: Paths (guide_metadata['path']) of the guides converted since the
+                 index was last written; None reads the postings of every guide
+
+    Returns:
+        Dictionary with the number of guides, sections and shards and the index size in bytes
+    """
+    return SearchIndexBuilder(output_dir, prefix_length).build(guides, changed)
+
+
+class SearchIndex:
+    """Query API over a sharded search index; shards are loaded on first use."""
+
+    def __init__(self, index_dir="user-guide"):
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / SEARCH_INDEX_FILE, 'r', encoding='utf-8') as f:
+            index_data = json.load(f)
+        self.prefix_length = index_data['prefix_length']
+        self.shards = index_data['shards']
+        self.guides = index_data['guides']
+        self.loaded_shards = {}
+
+    def load_shard(self, prefix):
+        """Return the [guide number, terms] fragments of one shard, reading it on first use."""
+        if prefix not in self.loaded_shards:
+            with open(self.index_dir / SEARCH_SHARD_DIR / f'{prefix}.json', 'r', encoding='utf-8') as f:
+                self.loaded_shards[prefix] = json.load(f)
+        return self.loaded_shards[prefix]
+
+    def get_shards_for(self, term):
+        """Return the prefixes of the shards that may hold terms starting with term."""
+        if len(term) >= self.prefix_length:
+            prefix = term[:self.prefix_length]
+            return [prefix] if prefix in self.shards else []
+        return [prefix for prefix in self.shards if prefix.startswith(term)]
+
+    def lookup(self, term, prefix=False):
+        """
+        Find the positions of a term.
+
+        Args:
+            term: Lowercase index term
+            prefix: Also match every term starting with term
+
+        Returns:
+            Dictionary mapping (guide number, section number) to a set of word positions
+        """
+        positions = {}
+        for shard in self.get_shards_for(term):
+            for guide, terms in self.load_shard(shard):
+                if prefix:
+                    matches = [postings for key, postings in terms.items() if key.startswith(term)]
+                else:
+                    matches = [terms[term]] if term in terms else []
+                for postings in matches:
+                    for section, *section_positions in postings:
+                        positions.setdefault((guide, section), set()).update(section_positions)
+        return positions
+
+    def search(self, query, limit=10):
+        """
+        Search the guides.
+
+        Every query term must occur in a guide; the last term also matches
+        as a prefix so partial input already finds results. Sections are
+        ranked by the number of distinct query terms they contain, then by
+        adjacent query terms (phrases) and finally by the number of hits.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of results
+
+        Returns:
+            List of result dictionaries with slug, title, path, anchor, heading and score
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        matches = [self.lookup(term, prefix=(k == len(terms) - 1)) for k, term in enumerate(terms)]
+
+        # Guides have to contain every term
+        guides = None
+        for positions in matches:
+            term_guides = {guide for guide, _ in positions}
+            guides = term_guides if guides is None else guides & term_guides
+
+        scores = {}
+        for k, positions in enumerate(matches):
+            following = matches[k + 1] if k + 1 < len(matches) else {}
+            for section, section_positions in positions.items():
+                if section[0] not in guides:
+                    continue
+                score = scores.setdefault(section, [0, 0, 0])
+                score[0] += 1
+                score[2] += len(section_positions)
+                if section in following:
+                    next_positions = following[section]
+                    score[1] += sum(1 for position in section_positions if position + 1 in next_positions)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], -item[1][1], -item[1][2], item[0]))
+        results = []
+        for section, score in ranked[:limit]:
+            guide_number, section_number = section
+            guide = self.guides[guide_number]
+            anchor, heading = guide['sections'][section_number]
+            results.append({
+                'slug': guide['slug'],
+                'title': guide['title'],
+                'path': guide['path'] + (f'#{anchor}' if anchor else ''),
+                'anchor': anchor,
+                'heading': heading or guide['title'],
+                'score': score
+            })
+        return results
+
+
+def main():
+    """Query the search index from the command line."""
+    parser = argparse.ArgumentParser(description="Search the user guides.")
+    parser.add_argument('query', help="search terms")
+    parser.add_argument('--index-dir', default='user-guide', help="directory of the search index (default: user-guide)")
+    parser.add_argument('--limit', type=int, default=10, help="maximum number of results (default: 10)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = SearchIndex(args.index_dir)
+    results = index.search(args.query, args.limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    for result in results:
+        print(f"{result['title']} > {result['heading']}")
+        print(f"        {result['path']}")
+    print(f"{len(results)} result(s) in {elapsed_ms:.1f} ms, {len(index.loaded_shards)} shard(s) loaded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Static Site Server for the Theme Worktrees
+Serves every theme worktree from one asyncio process, one port per worktree,
+replacing the per-theme `python3 -m http.server` processes. Connections are
+kept alive; responses carry an ETag and Last-Modified and are revalidated with
+304s; the .br/.gz sidecars written by precompress.py are served to clients
+that accept them; large files are sent with sendfile and small hot files from
+a size-bounded in-memory LRU cache. Request counts and latency percentiles are
+served as JSON at /__stats.
+"""
+
+import argparse
+import asyncio
+import email.utils
+import functools
+import json
+import mimetypes
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, deque
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import unquote
+
+from precompress import get_sidecar_path
+from theme_build import THEME_WORKTREES, WORKTREE_DIR
+
+# Port of the first theme worktree; the others follow on consecutive ports
+BASE_PORT = 8000
+
+# Endpoint returning the request counters of the process
+STATS_PATH = '/__stats'
+
+# Seconds an idle keep-alive connection is kept open
+KEEP_ALIVE_TIMEOUT = 15
+
+# Requests with a larger header block are rejected
+MAX_HEADER_SIZE = 16384
+
+# Files up to CACHE_MAX_FILE_SIZE are kept in memory, up to CACHE_MAX_BYTES in total;
+# larger files are sent with sendfile
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_MAX_FILE_SIZE = 256 * 1024
+
+# Number of recent request latencies the percentiles are computed from
+LATENCY_SAMPLES = 10000
+
+# Content encodings of the precompressed sidecars, most preferred first
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+# Content-hashed file names (asset bundles, image variants) never change content
+FINGERPRINT_PATTERN = re.compile(r'\.[0-9a-f]{12}(?:\.\d+w)?\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+COMPRESSIBLE_TYPES = {'application/javascript', 'application/json', 'application/xml', 'image/svg+xml'}
+QUALITY_PATTERN = re.compile(r'q\s*=\s*([0-9.]+)')
+
+SERVER_NAME = 'efbt-static'
+
+
+class FileCache:
+    """Size-bounded LRU cache of small files, validated against their size and modification time."""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, max_file_size=CACHE_MAX_FILE_SIZE):
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path, stat):
+        """
+        Return the content of a file, reading it only if it is not cached or changed.
+
+        Args:
+            file_path: Path of the file
+            stat: Current os.stat result of the file
+
+        Returns:
+            File content as bytes
+        """
+        entry = self.entries.get(file_path)
+        if entry and entry[0] == stat.st_mtime_ns and len(entry[1]) == stat.st_size:
+            self.entries.move_to_end(file_path)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        if entry:
+            self.size -= len(entry[1])
+            del self.entries[file_path]
+        self.entries[file_path] = (stat.st_mtime_ns, data)
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+        return data
+
+
+class ServerStats:
+    """Request counters and recent latencies of the server process."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.connections = 0
+        self.requests = 0
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.precompressed = 0
+        self.sendfile = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, status, body_bytes, seconds):
+        """Count one finished request."""
+        self.requests += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.bytes_sent += body_bytes
+        self.latencies.append(seconds)
+
+    def snapshot(self, cache):
+        """
+        Summarize the counters.
+
+        Args:
+            cache: FileCache of the server
+
+        Returns:
+            Dictionary with request, status, cache and latency counters
+        """
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            if not latencies:
+                return 0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        lookups = cache.hits + cache.misses
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'connections': self.connections,
+            'requests': self.requests,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'bytes_sent': self.bytes_sent,
+            'precompressed': self.precompressed,
+            'sendfile': self.sendfile,
+            'cache': {
+                'files': len(cache.entries),
+                'bytes': cache.size,
+                'hit_rate': round(cache.hits / lookups, 4) if lookups else 0
+            },
+            'latency_ms': {
+                'p50': round(percentile(0.5), 3),
+                'p90': round(percentile(0.9), 3),
+                'p99': round(percentile(0.99), 3),
+                'max': round(latencies[-1] * 1000, 3) if latencies else 0
+            }
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def get_content_type(suffix):
+    """Return the Content-Type header value for a file suffix."""
+    content_type = mimetypes.guess_type('file' + suffix)[0] or 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in COMPRESSIBLE_TYPES:
+        content_type += '; charset=utf-8'
+    return content_type
+
+
+def is_compressible(content_type):
+    """Check whether responses of a content type may be served from a precompressed sidecar."""
+    return content_type.startswith('text/') or content_type.split(';')[0] in COMPRESSIBLE_TYPES
+
+
+def parse_accept_encoding(value):
+    """
+    Parse an Accept-Encoding header.
+
+    Args:
+        value: Header value, e.g. 'gzip, deflate, br;q=0.9'
+
+    Returns:
+        Set of accepted encodings (those with a quality above zero)
+    """
+    accepted = set()
+    for item in value.split(','):
+        name, _, parameters = item.partition(';')
+        match = QUALITY_PATTERN.search(parameters)
+        try:
+            quality = float(match.group(1)) if match else 1
+        except ValueError:
+            quality = 0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def format_http_date(timestamp):
+    """Format a POSIX timestamp as an HTTP date."""
+    return email.utils.formatdate(timestamp, usegmt=True)
+
+
+def is_not_modified(headers, etag, mtime):
+    """
+    Evaluate the conditional request headers.
+
+    If-None-Match takes precedence over If-Modified-Since.
+
+    Args:
+        headers: Lowercase request header dictionary
+        etag: ETag of the current representation
+        mtime: Modification time of the file as POSIX timestamp
+
+    Returns:
+        True if a 304 response should be sent
+    """
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+    if_modified_since = headers.get('if-modified-since')
+    if if_modified_since:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return since is not None and int(mtime) <= since.timestamp()
+    return False
+
+
+class StaticServer:
+    """Serves static sites over HTTP/1.1 on any number of ports."""
+
+    server_name = SERVER_NAME
+
+    def __init__(self, cache=None):
+        self.cache = cache or FileCache()
+        self.stats = ServerStats()
+
+    async def handle_connection(self, reader, writer, root):
+        """
+        Serve the requests of one connection until it is closed or idle.
+
+        Args:
+            reader: asyncio StreamReader of the connection
+            writer: asyncio StreamWriter of the connection
+            root: Path of the served site
+        """
+        self.stats.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self.send_error(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, False, False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                started = time.perf_counter()
+                status, body_bytes, keep_alive = await self.handle_request(head, writer, root)
+                self.stats.record(status, body_bytes, time.perf_counter() - started)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, head, writer, root):
+        """
+        Answer one request.
+
+        Args:
+            head: Raw request line and headers
+            writer: asyncio StreamWriter of the connection
+            root: Path of the served site
+
+        Returns:
+            Tuple of (status code, body bytes sent, whether to keep the connection open)
+        """
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return await self.send_error(writer, HTTPStatus.BAD_REQUEST, False, False)
+
+        headers = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(':')
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            keep_alive = connection != 'close'
+        else:
+            keep_alive = connection == 'keep-alive'
+
+        head_only = method == 'HEAD'
+        if method not in ('GET', 'HEAD'):
+            # Request bodies are not read, so the connection cannot be reused
+            return await self.send_error(writer, HTTPStatus.METHOD_NOT_ALLOWED, False, False)
+
+        path = target.split('?', 1)[0].split('#', 1)[0]
+        if path == STATS_PATH:
+            body = json.dumps(self.stats.snapshot(self.cache), indent=2).encode('utf-8')
+            response_headers = {'Content-Type': 'application/json; charset=utf-8', 'Cache-Control': 'no-store'}
+            return await self.send_response(writer, HTTPStatus.OK, response_headers, body, keep_alive, head_only)
+
+        if not path.startswith('/'):
+            return await self.send_error(writer, HTTPStatus.BAD_REQUEST, keep_alive, head_only)
+
+        # Resolve '..' segments (also percent-encoded ones) and symlinks, and only serve files inside the root
+        try:
+            root_path = os.path.realpath(root)
+            file_path = os.path.realpath(os.path.join(root_path, unquote(path).lstrip('/')))
+            if os.path.commonpath([root_path, file_path]) != root_path:
+                raise ValueError(f"{path} is outside the served directory")
+            stat = os.stat(file_path)
+            if os.path.isdir(file_path):
+                if not path.endswith('/'):
+                    location = path + '/' + target[len(path):]
+                    return await self.send_response(writer, HTTPStatus.MOVED_PERMANENTLY, {'Location': location},
+                                                    b'', keep_alive, head_only)
+                file_path = os.path.join(file_path, 'index.html')
+                stat = os.stat(file_path)
+        except (OSError, ValueError):
+            return await self.send_error(writer, HTTPStatus.NOT_FOUND, keep_alive, head_only)
+
+        content_type = get_content_type(os.path.splitext(file_path)[1].lower())
+        response_headers = {
+            'Content-Type': content_type,
+            'Last-Modified': format_http_date(stat.st_mtime),
+            'Cache-Control': (IMMUTABLE_CACHE_CONTROL if FINGERPRINT_PATTERN.search(file_path)
+                              else REVALIDATE_CACHE_CONTROL)
+        }
+
+        # Serve a precompressed sidecar if the client accepts it and it belongs to this version of the file
+        served_path = file_path
+        served_stat = stat
+        encoding = None
+        if is_compressible(content_type):
+            response_headers['Vary'] = 'Accept-Encoding'
+            accepted = parse_accept_encoding(headers.get('accept-encoding', ''))
+            for candidate in ENCODING_PREFERENCE:
+                if candidate not in accepted:
+                    continue
+                sidecar_path = str(get_sidecar_path(file_path, candidate))
+                try:
+                    sidecar_stat = os.stat(sidecar_path)
+                except OSError:
+                    continue
+                if sidecar_stat.st_mtime_ns == stat.st_mtime_ns:
+                    served_path, served_stat, encoding = sidecar_path, sidecar_stat, candidate
+                    response_headers['Content-Encoding'] = candidate
+                    break
+
+        etag = f'"{stat.st_mtime_ns:x}-{served_stat.st_size:x}' + (f'-{encoding}"' if encoding else '"')
+        response_headers['ETag'] = etag
+        if is_not_modified(headers, etag, stat.st_mtime):
+            del response_headers['Content-Type']
+            response_headers.pop('Content-Encoding', None)
+            return await self.send_response(writer, HTTPStatus.NOT_MODIFIED, response_headers, b'',
+                                            keep_alive, True)
+
+        if encoding:
+            self.stats.precompressed += 1
+
+        if served_stat.st_size <= self.cache.max_file_size:
+            try:
+                body = self.cache.get(served_path, served_stat)
+            except OSError:
+                return await self.send_error(writer, HTTPStatus.NOT_FOUND, keep_alive, head_only)
+            return await self.send_response(writer, HTTPStatus.OK, response_headers, body, keep_alive, head_only)
+
+        # Large files go from the page cache to the socket without passing through Python
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            return await self.send_error(writer, HTTPStatus.NOT_FOUND, keep_alive, head_only)
+        with f:
+            response_headers['Content-Length'] = str(served_stat.st_size)
+            writer.write(self.format_head(HTTPStatus.OK, response_headers, keep_alive))
+            await writer.drain()
+            if head_only:
+                return HTTPStatus.OK.value, 0, keep_alive
+            sent = await asyncio.get_running_loop().sendfile(writer.transport, f, 0, served_stat.st_size)
+        self.stats.sendfile += 1
+        # A file truncated while sending leaves the response short, so the connection cannot be reused
+        return HTTPStatus.OK.value, sent, keep_alive and sent == served_stat.st_size
+
+    def format_head(self, status, response_headers, keep_alive):
+        """Format the status line and headers of a response."""
+        lines = [f'HTTP/1.1 {status.value} {status.phrase}',
+                 f'Date: {format_http_date(time.time())}',
+                 f'Server: {self.server_name}']
+        lines.extend(f'{name}: {value}' for name, value in response_headers.items())
+        lines.append('Connection: keep-alive' if keep_alive else 'Connection: close')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def send_response(self, writer, status, response_headers, body, keep_alive, head_only):
+        """
+        Send a complete response with an in-memory body.
+
+        Returns:
+            Tuple of (status code, body bytes sent, whether to keep the connection open)
+        """
+        if status != HTTPStatus.NOT_MODIFIED:
+            response_headers['Content-Length'] = str(len(body))
+        head = self.format_head(status, response_headers, keep_alive)
+        writer.write(head if head_only else head + body)
+        await writer.drain()
+        return status.value, 0 if head_only else len(body), keep_alive
+
+    async def send_error(self, writer, status, keep_alive, head_only):
+        """Send a short HTML error page."""
+        body = f'<!DOCTYPE html>\n<title>{status.value} {status.phrase}</title>\n<h1>{status.phrase}</h1>\n'
+        response_headers = {'Content-Type': 'text/html; charset=utf-8', 'Cache-Control': 'no-store'}
+        return await self.send_response(writer, status, response_headers, body.encode('utf-8'),
+                                        keep_alive, head_only)
+
+
+async def run_servers(static_server, sites, host):
+    """
+    Listen on every site's port and serve until cancelled.
+
+    Args:
+        static_server: StaticServer handling the requests
+        sites: List of (root directory, port) tuples
+        host: Interface to bind to
+    """
+    servers = []
+    for root, port in sites:
+        handler = functools.partial(static_server.handle_connection, root=str(Path(root).resolve()))
+        servers.append(await asyncio.start_server(handler, host, port, limit=MAX_HEADER_SIZE,
+                                                  reuse_address=True))
+        print(f"Serving {root} at http://localhost:{port}")
+    print(f"Request statistics at http://localhost:{sites[0][1]}{STATS_PATH}")
+    print("Press Ctrl+C to stop all servers")
+    await asyncio.gather(*(server.serve_forever() for server in servers))
+
+
+def get_theme_sites(base_port=BASE_PORT):
+    """
+    Return the theme worktrees that exist, with their ports.
+
+    Ports are assigned by position in THEME_WORKTREES, so a missing worktree
+    does not shift the ports of the others.
+
+    Args:
+        base_port: Port of the first theme
+
+    Returns:
+        List of (root directory, port) tuples
+    """
+    sites = []
+    for offset, theme in enumerate(THEME_WORKTREES):
+        theme_path = Path(WORKTREE_DIR) / theme
+        if theme_path.is_dir():
+            sites.append((str(theme_path), base_port + offset))
+        else:
+            print(f"Warning: Directory {theme_path} not found")
+    return sites
+
+
+def parse_site(value):
+    """Parse a DIR:PORT command line argument."""
+    root, separator, port = value.rpartition(':')
+    if not separator or not port.isdigit() or not Path(root).is_dir():
+        raise argparse.ArgumentTypeError(f"expected an existing DIR:PORT, got {value!r}")
+    return root, int(port)
+
+
+def main():
+    """Serve the theme worktrees, or the sites given on the command line."""
+    parser = argparse.ArgumentParser(description="Serve static sites from one asyncio process.")
+    parser.add_argument('--site', type=parse_site, action='append', metavar='DIR:PORT',
+                        help="serve DIR on PORT (repeatable); default: every theme worktree")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind to (default: 127.0.0.1)")
+    parser.add_argument('--base-port', type=int, default=BASE_PORT,
+                        help=f"port of the first theme worktree (default: {BASE_PORT})")
+    parser.add_argument('--cache-size', type=int, default=CACHE_MAX_BYTES // (1024 * 1024), metavar='MB',
+                        help=f"memory for cached small files (default: {CACHE_MAX_BYTES // (1024 * 1024)})")
+    parser.add_argument('--cache-file-size', type=int, default=CACHE_MAX_FILE_SIZE // 1024, metavar='KB',
+                        help=f"largest cached file, larger files use sendfile (default: {CACHE_MAX_FILE_SIZE // 1024})")
+    args = parser.parse_args()
+
+    sites = args.site or get_theme_sites(args.base_port)
+    if not sites:
+        print("Nothing to serve: no theme worktree found, pass --site DIR:PORT")
+        return 1
+
+    static_server = StaticServer(FileCache(args.cache_size * 1024 * 1024, args.cache_file_size * 1024))
+    try:
+        asyncio.run(run_servers(static_server, sites, args.host))
+    except KeyboardInterrupt:
+        print()
+        print("Stopping all servers...")
+        print(json.dumps(static_server.stats.snapshot(static_server.cache), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
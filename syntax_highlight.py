@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Build-Time Syntax Highlighting for Fenced Code Blocks
+A small regex tokenizer for the languages used in the guides (bash, python,
+json, sql and xml). Tokens are wrapped in <span class="hl-..."> elements that
+are styled by the guide stylesheet, so highlighted pages need no JavaScript.
+Highlighted blocks are memoized by language and content hash, so a snippet
+repeated across guides is tokenized once per process. Long blocks are
+highlighted chunk by chunk, carrying over the lines of tokens that may
+continue into the next chunk, see highlight_chunk.
+"""
+
+import bisect
+import hashlib
+import re
+import threading
+
+# Fence languages that are highlighted, by alias
+LANGUAGE_ALIASES = {
+    'bash': 'bash', 'sh': 'bash', 'shell': 'bash', 'console': 'bash', 'zsh': 'bash',
+    'python': 'python', 'py': 'python', 'python3': 'python',
+    'json': 'json',
+    'sql': 'sql',
+    'xml': 'xml', 'html': 'xml', 'xsd': 'xml', 'ecore': 'xml',
+}
+
+# Number of highlighted blocks kept in HIGHLIGHT_CACHE
+HIGHLIGHT_CACHE_SIZE = 1024
+
+# Highlighted HTML by (language, SHA-1 of the code), shared by all threads;
+# chunks of long blocks are keyed (language, SHA-1 of the chunk, 'chunk')
+HIGHLIGHT_CACHE = {}
+HIGHLIGHT_CACHE_LOCK = threading.Lock()
+
+STRING_TOKENS = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+NUMBER_TOKENS = r'\b(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\b'
+
+PYTHON_KEYWORDS = ('and as assert async await break class continue def del elif else except finally for from '
+                   'global if import in is lambda nonlocal not or pass raise return try while with yield').split()
+PYTHON_BUILTINS = ('print len range open str int float dict list set tuple bool type isinstance super '
+                   'enumerate zip map filter sorted min max sum any all self').split()
+BASH_KEYWORDS = ('if then else elif fi for while until do done case esac in function return export local '
+                 'source exit set unset').split()
+SQL_KEYWORDS = ('select from where and or not in is null as join inner left right outer full on group by order '
+                'having limit offset insert into values update set delete create table view index drop alter add '
+                'primary key foreign references distinct union all case when then else end exists between like '
+                'asc desc with count sum avg min max').split()
+
+
+def compile_rules(rules, flags=0):
+    """
+    Combine (token class, pattern) rules into one pattern with a named group per styled rule.
+
+    Rules with the token class None leave their match unstyled and must come
+    last; they only keep the styled rules from matching inside longer tokens.
+    Each match of the pattern skips the unstyled text up to the next styled
+    token, so the tokenizer loop only sees tokens it wraps in a span; the
+    last match has no group and ends the code.
+    """
+    styled = [(token_class, pattern) for token_class, pattern in rules if token_class]
+    unstyled = [pattern for token_class, pattern in rules if not token_class]
+    any_token = '|'.join(f'(?:{pattern})' for _, pattern in styled)
+    tokens = '|'.join(f'(?P<g{k}>{pattern})' for k, (_, pattern) in enumerate(styled))
+    skip = '|'.join(unstyled + [r'[\s\S]'])
+    return re.compile(f'(?:(?!{any_token})(?:{skip}))*+(?:{tokens}|\\Z)', flags), \
+        [token_class for token_class, _ in styled]
+
+
+def words(names):
+    """
+    Pattern matching any of the names as a whole word.
+
+    The names are arranged in a trie, e.g. 'as', 'asc' and 'avg' become
+    a(?:s(?:c)?|vg), so the regex engine does not try every name in turn.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def get_pattern(node):
+        branches = [re.escape(char) + get_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 and '' not in node else '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if '' in node else pattern
+
+    return r'\b' + get_pattern(trie) + r'\b'
+
+
+# Token rules per language, tried in order at each position; None leaves the match unstyled
+LANGUAGE_RULES = {
+    'python': compile_rules([
+        ('hl-com', r'#[^\n]*'),
+        ('hl-str', r'[rRbBfFuU]{0,2}(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|' + STRING_TOKENS + ')'),
+        ('hl-meta', r'@[\w.]+'),
+        ('hl-lit', words(['True', 'False', 'None'])),
+        ('hl-kw', words(PYTHON_KEYWORDS)),
+        ('hl-fn', words(PYTHON_BUILTINS)),
+        ('hl-num', NUMBER_TOKENS),
+        (None, r'\w+'),
+    ]),
+    'bash': compile_rules([
+        ('hl-com', r'(?<![^\s;|&])#[^\n]*'),
+        ('hl-str', STRING_TOKENS),
+        ('hl-var', r'\$\{[^}\n]*\}|\$[\w@#?$!*-]'),
+        ('hl-kw', words(BASH_KEYWORDS)),
+        ('hl-opt', r'(?<![^\s])--?[A-Za-z][\w-]*'),
+        ('hl-num', NUMBER_TOKENS),
+        (None, r'[\w.-]+'),
+    ]),
+    'json': compile_rules([
+        ('hl-key', r'"(?:\\.|[^"\\\n])*"(?=\s*:)'),
+        ('hl-str', r'"(?:\\.|[^"\\\n])*"'),
+        ('hl-lit', words(['true', 'false', 'null'])),
+        ('hl-num', r'-?' + NUMBER_TOKENS),
+    ]),
+    'sql': compile_rules([
+        ('hl-com', r'--[^\n]*|/\*[\s\S]*?\*/'),
+        ('hl-str', r"'(?:''|[^'])*'"),
+        ('hl-kw', words(SQL_KEYWORDS)),
+        ('hl-num', NUMBER_TOKENS),
+        (None, r'\w+'),
+    ], re.IGNORECASE),
+    'xml': compile_rules([
+        ('hl-com', r'<!--[\s\S]*?-->'),
+        ('hl-meta', r'<\?[\s\S]*?\?>|<!\[CDATA\[[\s\S]*?\]\]>|<![^>]*>'),
+        ('xml-tag', r'</?[\w:.-]+(?:\s+[\w:.-]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'))?)*\s*/?>'),
+    ]),
+}
+
+# Patterns matching the first character of a token that may span lines but is
+# not closed before the end of the code, so more lines could still change it
+OPEN_TOKENS = {
+    'python': re.compile(r'[rRbBfFuU](?=[rRbBfFuU]?(?:"""(?![\s\S]*?""")|\'\'\'(?![\s\S]*?\'\'\')))'
+                         r'|"(?=""(?![\s\S]*?"""))|\'(?=\'\'(?![\s\S]*?\'\'\'))'),
+    'json': re.compile(r'"(?=(?:\\.|[^"\\\n])*"\s*\Z)'),
+    'sql': re.compile(r"/(?=\*(?![\s\S]*?\*/))|'(?=(?:''|[^'])*\Z)"),
+    'xml': re.compile(r'<(?=!--(?![\s\S]*?-->)|\?(?![\s\S]*?\?>)|!\[CDATA\[(?![\s\S]*?\]\]>)|![^>]*\Z'
+                      r'|/?[\w:.-]+(?:[^<>"\']|"[^"]*"|\'[^\']*\')*(?:"[^"]*|\'[^\']*)?\Z)'),
+}
+
+# Noncharacters standing in for the span tags until the highlighted code is escaped
+SPAN_START = '\ufdd0'
+SPAN_CLASS_END = '\ufdd1'
+SPAN_END = '\ufdd2'
+SPAN_MARKER_PATTERN = re.compile('[\ufdd0-\ufdd2]')
+
+XML_TAG_RULES = compile_rules([
+    ('hl-tag', r'^</?[\w:.-]+|/?>$'),
+    ('hl-attr', r'[\w:.-]+(?=\s*=)'),
+    ('hl-str', r'"[^"]*"|\'[^\']*\''),
+])
+
+
+def escape_html(text):
+    """Escape HTML special characters, like MarkdownToHTMLConverter.escape_html."""
+    return (text
+            .replace('&', '&amp;')
+            .replace('<', '&lt;')
+            .replace('>', '&gt;')
+            .replace('"', '&quot;')
+            .replace("'", '&#39;'))
+
+
+# (span start, end of the class attribute, span end, escape function) for wrap_tokens
+TAG_MARKUP = ('<span class="', '">', '</span>', escape_html)
+MARKER_MARKUP = (SPAN_START, SPAN_CLASS_END, SPAN_END, str)
+
+
+def get_language(fence_language):
+    """
+    Return the canonical name of a fence language, or None if it is not highlighted.
+
+    Args:
+        fence_language: Language given after the opening ``` of a code block
+    """
+    return LANGUAGE_ALIASES.get(fence_language.lower())
+
+
+def wrap_tokens(code, rules, matches, markup, out):
+    """
+    Append the text and tokens of code to a list, every styled token wrapped in a span.
+
+    Args:
+        code: Source code as string
+        rules: (pattern, token classes) tuple from compile_rules
+        matches: List of the matches of the pattern in the code, or None to find them
+        markup: (span start, end of the class attribute, span end, escape function) tuple,
+                TAG_MARKUP or MARKER_MARKUP
+        out: List the pieces are appended to
+    """
+    pattern, token_classes = rules
+    span_start, class_end, span_end, escape = markup
+    position = 0  # Start of the text not written yet
+    for match in pattern.finditer(code) if matches is None else matches:
+        if match.lastindex is None:
+            break
+        token_class = token_classes[match.lastindex - 1]
+        start, end = match.span(match.lastindex)
+        if start > position:
+            out.append(escape(code[position:start]))
+        token = code[start:end]
+        if token_class == 'xml-tag':
+            wrap_tokens(token, XML_TAG_RULES, None, markup, out)
+        elif '\n' in token:
+            # Spans never cross lines, so every output line stays balanced
+            out.append('\n'.join(f'{span_start}{token_class}{class_end}{escape(part)}{span_end}' if part else ''
+                                  for part in token.split('\n')))
+        else:
+            out.append(f'{span_start}{token_class}{class_end}{escape(token)}{span_end}')
+        position = end
+    out.append(escape(code[position:]))
+
+
+def tokenize(code, rules, matches=None):
+    """
+    Highlight code with a set of compiled rules.
+
+    The tokens are wrapped in marker characters first, so the code is escaped
+    in one go rather than piece by piece.
+
+    Args:
+        code: Source code as string
+        rules: (pattern, token classes) tuple from compile_rules
+        matches: Optional list of the matches of the pattern in the code, if already found
+
+    Returns:
+        Escaped HTML with every styled token wrapped in a span
+    """
+    out = []
+    if SPAN_MARKER_PATTERN.search(code):
+        # Code that contains the marker characters itself is escaped piece by piece
+        wrap_tokens(code, rules, matches, TAG_MARKUP, out)
+        return ''.join(out)
+    wrap_tokens(code, rules, matches, MARKER_MARKUP, out)
+    return (escape_html(''.join(out))
+            .replace(SPAN_START, '<span class="')
+            .replace(SPAN_CLASS_END, '">')
+            .replace(SPAN_END, '</span>'))
+
+
+def highlight_code(language, lines):
+    """
+    Highlight the lines of a code block, reusing earlier results for identical code.
+
+    Args:
+        language: Canonical language name returned by get_language
+        lines: Lines of the code block
+
+    Returns:
+        List of highlighted HTML lines, one per input line
+    """
+    code = '\n'.join(lines)
+    key = (language, hashlib.sha1(code.encode('utf-8')).hexdigest())
+    highlighted = HIGHLIGHT_CACHE.get(key)
+    if highlighted is None:
+        highlighted = tokenize(code, LANGUAGE_RULES[language]).split('\n')
+        store_highlighted(key, highlighted)
+    return highlighted
+
+
+def store_highlighted(key, value):
+    """Add a result to HIGHLIGHT_CACHE, evicting the oldest entry when it is full."""
+    with HIGHLIGHT_CACHE_LOCK:
+        if len(HIGHLIGHT_CACHE) >= HIGHLIGHT_CACHE_SIZE:
+            del HIGHLIGHT_CACHE[next(iter(HIGHLIGHT_CACHE))]
+        HIGHLIGHT_CACHE[key] = value
+
+
+def find_carry_position(language, code, matches):
+    """
+    Find where code must be cut so that the part before it is highlighted like the whole block.
+
+    Args:
+        language: Canonical language name returned by get_language
+        code: Source code of a chunk of a code block, as string
+        matches: List of the matches of the language's rules in the code
+
+    Returns:
+        Start of the line of the first token that may continue past the end of
+        the code, moved back to a line that no token crosses, or None if every
+        token is complete
+    """
+    open_tokens = OPEN_TOKENS.get(language)
+    if open_tokens is None:
+        return None
+
+    spans = [match.span(match.lastindex) for match in matches if match.lastindex]
+    starts = [start for start, _ in spans]
+
+    def get_enclosing_start(position):
+        """Return the start of the token strictly enclosing a position, or None."""
+        k = bisect.bisect_right(starts, position) - 1
+        return spans[k][0] if k >= 0 and spans[k][0] < position < spans[k][1] else None
+
+    for hit in open_tokens.finditer(code):
+        position = hit.start()
+        # Openers inside a complete token, like a quote in a comment, don't count
+        if get_enclosing_start(position) is not None:
+            continue
+        while True:
+            line_start = code.rfind('\n', 0, position) + 1
+            position = get_enclosing_start(line_start)
+            if position is None:
+                return line_start
+    return None
+
+
+def highlight_chunk(language, lines, final):
+    """
+    Highlight the next chunk of a code block that is converted chunk by chunk.
+
+    Lines from the one where a token that may continue into the next chunk
+    starts, like an unclosed triple-quoted string or block comment, are not
+    highlighted yet but carried over, so the chunks highlight exactly like
+    the whole block would.
+
+    Args:
+        language: Canonical language name returned by get_language
+        lines: Lines carried over from the previous chunk followed by the lines of this one
+        final: Whether this is the last chunk of the block
+
+    Returns:
+        Tuple of the highlighted lines and the lines carried over to the next chunk
+    """
+    if final:
+        return highlight_code(language, lines), []
+    code = '\n'.join(lines)
+    # Chunks are cached apart from whole blocks, since their last lines may be carried over
+    key = (language, hashlib.sha1(code.encode('utf-8')).hexdigest(), 'chunk')
+    cached = HIGHLIGHT_CACHE.get(key)
+    if cached is None:
+        rules = LANGUAGE_RULES[language]
+        matches = list(rules[0].finditer(code))
+        position = find_carry_position(language, code, matches)
+        count = len(lines) if position is None else code.count('\n', 0, position)
+        cached = (tokenize(code, rules, matches).split('\n')[:count], count)
+        store_highlighted(key, cached)
+    highlighted, count = cached
+    return highlighted, lines[count:]
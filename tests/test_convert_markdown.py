@@ -0,0 +1,149 @@
+"""Tests for the markdown converter."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from convert_markdown import (ASSET_MANIFEST, BLOCK_CHUNK_LINES, CSS_BUNDLE, JS_BUNDLE, TABLE_PAGINATION_ROWS,
+                              MarkdownToHTMLConverter, convert_markdown_to_html, get_asset_paths,
+                              get_build_settings, get_reusable_manifest_files, get_table_data_paths,
+                              get_template_segments)
+from syntax_highlight import highlight_code
+
+
+class ConvertInlineTest(unittest.TestCase):
+    """Inline markdown conversion."""
+
+    def convert(self, text):
+        return MarkdownToHTMLConverter().convert_inline(text)
+
+    def test_link(self):
+        self.assertEqual(self.convert('[a](b) and [c](d)'), '<a href="b">a</a> and <a href="d">c</a>')
+
+    def test_badge_inside_link(self):
+        self.assertEqual(self.convert('[Download ![badge](images/b.png)](https://x.org)'),
+                         '<a href="https://x.org">Download '
+                         '<img src="../images/b.png" alt="badge" class="img-responsive guide-image"></a>')
+
+    def test_linked_image(self):
+        self.assertEqual(self.convert('[![logo](logo.png)](index.html)'),
+                         '<a href="index.html"><img src="logo.png" alt="logo" class="img-responsive guide-image"></a>')
+
+    def test_brackets_without_image_end_the_label(self):
+        self.assertEqual(self.convert('[a ![nope] b](u)'), '[a ![nope] b](u)')
+
+
+class CodeBlockTest(unittest.TestCase):
+    """Fenced code blocks longer than a chunk."""
+
+    def assert_highlighted_whole(self, language, lines):
+        html = MarkdownToHTMLConverter().convert('\n'.join([f'```{language}'] + lines + ['```']))
+        self.assertEqual(html.split('\n')[1:-1], highlight_code(language, lines))
+
+    def test_string_across_chunks(self):
+        lines = ['x = 1'] * (BLOCK_CHUNK_LINES - 2) + ['s = """first', 'second', 'third"""'] + ['y = 2'] * 10
+        self.assert_highlighted_whole('python', lines)
+
+    def test_comment_across_chunks(self):
+        lines = ['select 1;'] * (BLOCK_CHUNK_LINES - 1) + ['/* first', "'second'", 'third */'] + ['select 2;']
+        self.assert_highlighted_whole('sql', lines)
+
+
+class BuildManifestTest(unittest.TestCase):
+    """Skipping unchanged files only while the build settings are unchanged."""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.site_path = Path(self.root.name)
+        (self.site_path / ASSET_MANIFEST).write_text(json.dumps({'assets': {
+            CSS_BUNDLE: 'css/site.0.css', JS_BUNDLE: 'js/site.0.js'}}), encoding='utf-8')
+        self.write_include('navbar.html', '<nav><ul><li><a href="index.html">Home</a></li></ul></nav>')
+        self.write_include('footer.html', '<footer>Footer</footer>')
+        self.settings = self.get_settings()
+        self.manifest = {'settings': self.settings, 'files': {'guide.md': {'hash': '0'}}}
+
+    def write_include(self, name, content):
+        (self.site_path / name).write_text(content, encoding='utf-8')
+
+    def get_settings(self):
+        # The templates of a site are cached for the life of the process
+        get_asset_paths.cache_clear()
+        get_template_segments.cache_clear()
+        self.addCleanup(get_template_segments.cache_clear)
+        self.addCleanup(get_asset_paths.cache_clear)
+        return get_build_settings('image-hash', str(self.site_path))
+
+    def test_unchanged_settings(self):
+        self.assertEqual(self.get_settings(), self.settings)
+        self.assertEqual(get_reusable_manifest_files(self.manifest, self.settings), self.manifest['files'])
+
+    def test_forced(self):
+        self.assertEqual(get_reusable_manifest_files(self.manifest, self.settings, force=True), {})
+
+    def test_changed_template(self):
+        self.write_include('footer.html', '<footer>New footer</footer>')
+        settings = self.get_settings()
+        self.assertNotEqual(settings['template_hash'], self.settings['template_hash'])
+        self.assertEqual(get_reusable_manifest_files(self.manifest, settings), {})
+
+    def test_changed_settings(self):
+        for name, value in [('converter_version', '0'), ('image_hash', 'other'), ('disabled_guides', ['guide'])]:
+            with self.subTest(name=name):
+                settings = dict(self.settings, **{name: value})
+                self.assertEqual(get_reusable_manifest_files(self.manifest, settings), {})
+
+
+class TableDataTest(unittest.TestCase):
+    """Row data files of paginated tables."""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.previous_dir = os.getcwd()
+        os.chdir(self.root.name)
+        self.addCleanup(os.chdir, self.previous_dir)
+        Path(ASSET_MANIFEST).write_text(json.dumps({'assets': {
+            CSS_BUNDLE: 'css/site.0.css', JS_BUNDLE: 'js/site.0.js'}}), encoding='utf-8')
+        Path('navbar.html').write_text('<nav></nav>', encoding='utf-8')
+        Path('footer.html').write_text('<footer></footer>', encoding='utf-8')
+        # The templates are cached by site directory, which is '.' here as well
+        for cache in (get_asset_paths, get_template_segments):
+            cache.cache_clear()
+            self.addCleanup(cache.cache_clear)
+        Path('markdown_content').mkdir()
+        self.output_path = Path('user-guide') / 'tables.html'
+
+    def convert(self, row_counts):
+        markdown_file_path = Path('markdown_content') / 'tables.md'
+        tables = ['| Name | Value |\n|---|---|\n' + ''.join(f'| row {i} | {i} |\n' for i in range(rows))
+                  for rows in row_counts]
+        markdown_file_path.write_text('# Tables\n\n' + '\nText\n\n'.join(tables), encoding='utf-8')
+        self.assertIsNotNone(convert_markdown_to_html(markdown_file_path, self.output_path))
+
+    def read_row_counts(self):
+        return {path.name: len(json.loads(path.read_text(encoding='utf-8'))['rows'])
+                for path in get_table_data_paths(self.output_path)}
+
+    def test_paginated_tables(self):
+        self.convert([TABLE_PAGINATION_ROWS + 10, 5, TABLE_PAGINATION_ROWS * 2])
+        # Header rows are part of the row data
+        self.assertEqual(self.read_row_counts(), {'tables.table-1.json': TABLE_PAGINATION_ROWS + 11,
+                                                  'tables.table-2.json': TABLE_PAGINATION_ROWS * 2 + 1})
+        html = self.output_path.read_text(encoding='utf-8')
+        self.assertEqual(html.count('paginated-table'), 2)
+        self.assertIn('data-rows="tables.table-2.json"', html)
+
+    def test_stale_tables_removed(self):
+        self.convert([TABLE_PAGINATION_ROWS + 1] * 3)
+        self.assertEqual(len(self.read_row_counts()), 3)
+        self.convert([TABLE_PAGINATION_ROWS + 1, 5])
+        self.assertEqual(self.read_row_counts(), {'tables.table-1.json': TABLE_PAGINATION_ROWS + 2})
+        self.convert([5])
+        self.assertEqual(self.read_row_counts(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
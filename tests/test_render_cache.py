@@ -0,0 +1,50 @@
+"""Tests for the render cache."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from render_cache import DiskRenderCache
+
+SETTINGS = {'converter_version': '1', 'template_hash': 'template', 'image_hash': 'images'}
+
+
+class DiskRenderCacheTest(unittest.TestCase):
+    """Entries and their attachments."""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.cache = DiskRenderCache(SETTINGS, Path(self.root.name) / 'cache')
+        self.key = self.cache.get_key(b'# Guide\n', 'user-guide/guide.html')
+        page_path = Path(self.root.name) / 'guide.html'
+        page_path.write_text('<h1>Guide</h1>', encoding='utf-8')
+        self.cache.put(self.key, {'tables': 0}, {'page.html': page_path})
+
+    def test_get(self):
+        self.assertEqual(self.cache.get(self.key), {'tables': 0, 'attachments': ['page.html']})
+        self.assertEqual(self.cache.get_attachment_path(self.key, 'page.html').read_text(encoding='utf-8'),
+                         '<h1>Guide</h1>')
+
+    def test_other_settings(self):
+        cache = DiskRenderCache(dict(SETTINGS, template_hash='other'), self.cache.cache_dir)
+        self.assertNotEqual(cache.get_key(b'# Guide\n', 'user-guide/guide.html'), self.key)
+
+    def test_evicted_attachment(self):
+        self.cache.get_attachment_path(self.key, 'page.html').unlink()
+        self.assertIsNone(self.cache.get(self.key))
+
+    def test_prune_evicts_attachment(self):
+        entry_path = self.cache.get_entry_path(self.key)
+        attachment_path = self.cache.get_attachment_path(self.key, 'page.html')
+        os.utime(attachment_path, (1, 1))
+        self.cache.max_bytes = entry_path.stat().st_size
+        self.assertEqual(self.cache.prune()['evicted'], 0)
+        self.assertTrue(entry_path.exists())
+        self.assertFalse(attachment_path.exists())
+        self.assertIsNone(self.cache.get(self.key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the render daemon."""
+
+import asyncio
+import threading
+import unittest
+
+from render_daemon import INLINE_RENDER_MAX_BYTES, RenderServer
+
+
+class SharedRenderTest(unittest.IsolatedAsyncioTestCase):
+    """Identical requests arriving during a render share it."""
+
+    async def test_cancelled_render(self):
+        server = RenderServer()
+        release = threading.Event()
+        render = server.render
+
+        def blocking_render(*args):
+            release.wait()
+            return render(*args)
+
+        server.render = blocking_render
+        # Large enough to render in a worker thread
+        markdown_bytes = b'# Title\n\n' + b'text ' * INLINE_RENDER_MAX_BYTES
+        request = ('key', markdown_bytes, 'fragment', 'Title', 'user-guide/preview.html')
+        first = asyncio.create_task(server.get_rendered(*request))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(server.get_rendered(*request))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        release.set()
+        body, cache_status = await asyncio.wait_for(second, 10)
+        self.assertEqual(cache_status, 'miss')
+        self.assertTrue(body.startswith(b'<h1'))
+        self.assertEqual(server.pending, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for the search index."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from search_index import SearchIndex, SearchIndexBuilder, build_search_index, index_guide, write_guide_postings
+
+GUIDES = {
+    'alpha': '# Alpha\n\nCube structure mapping.\n\n## Members\n\nMember hierarchy of the cube.\n',
+    'beta': '# Beta\n\nVariable set mapping template.\n',
+    'gamma': '# Gamma\n\n| Column | Value |\n|---|---|\n| cube | output layer |\n'
+}
+
+
+class SearchIndexBuilderTest(unittest.TestCase):
+    """Merging stored postings into the sharded index."""
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        self.previous_dir = os.getcwd()
+        os.chdir(self.root.name)
+        self.addCleanup(os.chdir, self.previous_dir)
+        for slug, text in GUIDES.items():
+            self.write_guide(slug, text)
+
+    def write_guide(self, slug, text):
+        markdown_file_path = Path('markdown_content') / f'{slug}.md'
+        markdown_file_path.parent.mkdir(exist_ok=True)
+        markdown_file_path.write_text(text, encoding='utf-8')
+        write_guide_postings(f'user-guide/{slug}.html', index_guide(markdown_file_path))
+
+    def get_guides(self, slugs=GUIDES):
+        return [(Path('markdown_content') / f'{slug}.md', {'slug': slug, 'title': slug.title(),
+                                                            'path': f'user-guide/{slug}.html'}) for slug in slugs]
+
+    def read_index(self, output_dir='user-guide'):
+        output_path = Path(output_dir)
+        return {path.relative_to(output_path).as_posix(): path.read_text(encoding='utf-8')
+                for path in output_path.rglob('*.json')}
+
+    def test_search(self):
+        build_search_index(self.get_guides())
+        results = SearchIndex().search('cube member')
+        self.assertEqual([(result['slug'], result['anchor']) for result in results],
+                         [('alpha', 'members'), ('alpha', 'alpha')])
+
+    def test_changed_guide_matches_full_build(self):
+        build_search_index(self.get_guides())
+        self.write_guide('beta', '# Beta\n\nRenamed cube dimension.\n')
+        build_search_index(self.get_guides(), changed={'user-guide/beta.html'})
+        build_search_index(self.get_guides(), 'full/user-guide')
+        self.assertEqual(self.read_index(), self.read_index('full/user-guide'))
+        self.assertEqual([result['slug'] for result in SearchIndex().search('dimension')], ['beta'])
+
+    def test_removed_guide_matches_full_build(self):
+        builder = SearchIndexBuilder()
+        builder.build(self.get_guides())
+        builder.build(self.get_guides(['alpha', 'gamma']), set())
+        build_search_index(self.get_guides(['alpha', 'gamma']), 'full/user-guide')
+        self.assertEqual(self.read_index(), self.read_index('full/user-guide'))
+        self.assertEqual(SearchIndex().search('variable'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
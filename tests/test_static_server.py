@@ -0,0 +1,63 @@
+"""Tests for the static site server."""
+
+import asyncio
+import functools
+import tempfile
+import unittest
+from pathlib import Path
+
+from static_server import StaticServer
+
+
+class PathTraversalTest(unittest.IsolatedAsyncioTestCase):
+    """Requests must never reach files outside the served directory."""
+
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        parent = Path(self.directory.name)
+        (parent / 'secret.txt').write_text('secret', encoding='utf-8')
+        root = parent / 'site'
+        root.mkdir()
+        (root / 'index.html').write_text('<p>home</p>', encoding='utf-8')
+
+        handler = functools.partial(StaticServer().handle_connection, root=str(root))
+        self.server = await asyncio.start_server(handler, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def get(self, target):
+        """Send a GET request for the raw target and return the status code and body."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write(f'GET {target} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode('latin-1'))
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        head, _, body = response.partition(b'\r\n\r\n')
+        return int(head.split(b' ')[1]), body
+
+    async def test_file_inside_root(self):
+        status, body = await self.get('/index.html')
+        self.assertEqual((status, body), (200, b'<p>home</p>'))
+
+    async def test_relative_target(self):
+        status, body = await self.get('../secret.txt')
+        self.assertEqual(status, 400)
+        self.assertNotIn(b'secret', body)
+
+    async def test_encoded_slash(self):
+        status, body = await self.get('/..%2fsecret.txt')
+        self.assertEqual(status, 404)
+        self.assertNotIn(b'secret', body)
+
+    async def test_encoded_dots(self):
+        status, body = await self.get('/%2e%2e/secret.txt')
+        self.assertEqual(status, 404)
+        self.assertNotIn(b'secret', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Multi-Theme Build
+Builds the main site and every theme worktree (worktrees/theme-*) in one run.
+Each markdown file is parsed and converted once; the converted content is
+then written through each site's own page template, which uses that site's
+stylesheets, scripts, navbar and footer. Outputs that do not depend on the
+theme (heading indexes, table row data, the guide index, the search index and
+image variants) are written once and hard-linked into the other sites.
+"""
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_bundler import build_asset_bundles
+from convert_markdown import (BUILD_MANIFEST, COMING_SOON_DESCRIPTION, DISABLED_GUIDES, GUIDE_DETAIL_DIR,
+                              MarkdownToHTMLConverter, create_coming_soon_template, create_guide_metadata,
+                              create_html_template_parts, create_manifest_entry, create_toc,
+                              extract_description_from_lines, generate_guide_index, get_build_settings,
+                              get_heading_index_path, get_reusable_manifest_files, get_table_data_paths,
+                              get_unchanged_manifest_entry, load_build_manifest, remove_stale_table_data,
+                              resolve_page_includes, save_build_manifest, write_heading_index, write_html_file)
+from image_pipeline import build_image_catalog, get_catalog_hash
+from search_index import SEARCH_INDEX_FILE, SEARCH_SHARD_DIR, GuidePostings, build_search_index, write_guide_postings
+
+# Theme worktrees, relative to the root directory of the main site
+WORKTREE_DIR = 'worktrees'
+THEME_WORKTREES = ('theme-monokai', 'theme-nord', 'theme-ocean', 'theme-solarized')
+
+
+def get_theme_dirs(themes=None):
+    """
+    Return the root directories of the theme worktrees that exist.
+
+    Args:
+        themes: Theme names to build, or None for all of THEME_WORKTREES
+
+    Returns:
+        List of worktree paths
+    """
+    theme_dirs = []
+    for theme in themes or THEME_WORKTREES:
+        theme_path = Path(WORKTREE_DIR) / theme
+        if theme_path.is_dir():
+            theme_dirs.append(theme_path)
+        else:
+            print(f"Warning: Directory {theme_path} not found")
+    return theme_dirs
+
+
+def link_shared_file(source_path, target_path):
+    """
+    Make target_path a hard link to source_path.
+
+    The link replaces the target atomically; where hard links are not possible
+    (e.g. across file systems) the file is copied instead.
+
+    Args:
+        source_path: Existing file written for the first site
+        target_path: Path of the same file in another site
+    """
+    source_path = Path(source_path)
+    target_path = Path(target_path)
+    try:
+        if os.path.samefile(source_path, target_path):
+            return
+    except OSError:
+        pass
+
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target_path.with_name(target_path.name + '.tmp')
+    temp_path.unlink(missing_ok=True)
+    try:
+        os.link(source_path, temp_path)
+    except OSError:
+        shutil.copy2(source_path, temp_path)
+    os.replace(temp_path, target_path)
+
+
+def render_guide(markdown_file_path, image_catalog=None, table_data_dir='.'):
+    """
+    Convert a markdown file once, for writing into any number of page templates.
+
+    Args:
+        markdown_file_path: Path to the input markdown file
+        image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+        table_data_dir: Directory of the page in the primary site, where the
+                        row data of paginated tables is written
+
+    Returns:
+        Dictionary with slug, title, description, content (None for disabled
+        guides), headings, links, images, the row counts of paginated tables
+        and the search postings, or None if the conversion failed
+    """
+    try:
+        slug = Path(markdown_file_path).stem
+        title = slug.replace('_', ' ').replace('-', ' ').title()
+        if slug in DISABLED_GUIDES:
+            return {'slug': slug, 'title': title, 'description': COMING_SOON_DESCRIPTION,
+                    'content': None, 'headings': [], 'links': [], 'images': [], 'tables': [], 'search': None}
+
+        with open(markdown_file_path, 'r', encoding='utf-8') as f:
+            description = extract_description_from_lines(f)
+        search_postings = GuidePostings()
+        converter = MarkdownToHTMLConverter(image_catalog, slug, search_postings=search_postings,
+                                            table_data_dir=table_data_dir)
+        with open(markdown_file_path, 'r', encoding='utf-8') as f:
+            content = ''.join(converter.convert_stream(f))
+        return {'slug': slug, 'title': title, 'description': description, 'content': content,
+                'headings': converter.headings, 'links': converter.links, 'images': converter.images,
+                'tables': converter.tables, 'search': search_postings.to_dict()}
+
+    except Exception as e:
+        print(f"Error converting {markdown_file_path}: {str(e)}")
+        return None
+
+
+def write_guide_page(rendered, relative_path, site_dir):
+    """
+    Write a rendered guide through one site's page template.
+
+    Args:
+        rendered: Dictionary returned by render_guide
+        relative_path: Path of the HTML file relative to the site root, e.g. 'user-guide/x.html'
+        site_dir: The root directory of the site
+    """
+    output_file_path = Path(site_dir) / relative_path
+    if rendered['content'] is None:
+        write_html_file(output_file_path, [create_coming_soon_template(rendered['title'], relative_path, site_dir)])
+        return
+
+    toc = create_toc(rendered['headings'])
+    head, tail = create_html_template_parts(rendered['title'], relative_path, toc, site_dir)
+    write_html_file(output_file_path, [head, rendered['content'], tail])
+
+
+def link_table_data(table_paths, output_file_path):
+    """
+    Hard-link the row data of a page's paginated tables next to the same page in another site.
+
+    Args:
+        table_paths: Row data files written for the page, see get_table_data_paths
+        output_file_path: Path of the page in the other site
+    """
+    output_file_path = Path(output_file_path)
+    current = set()
+    for table_path in table_paths:
+        link_shared_file(table_path, output_file_path.with_name(table_path.name))
+        current.add(table_path.name)
+    for stale_path in get_table_data_paths(output_file_path):
+        if stale_path.name not in current:
+            stale_path.unlink()
+
+
+def render_guides(sources, jobs=1, image_catalog=None, table_data_dirs=None):
+    """
+    Render several markdown files, optionally across a pool of worker processes.
+
+    Args:
+        sources: List of markdown file paths
+        jobs: Number of worker processes; 0 uses one per CPU core
+        image_catalog: Optional image catalog from image_pipeline.build_image_catalog
+        table_data_dirs: Directories of the pages in the primary site, in the same
+                         order as sources; the current directory if not given
+
+    Returns:
+        List of render_guide results, in the same order as sources
+    """
+    table_data_dirs = table_data_dirs or ['.'] * len(sources)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(sources))
+    if jobs <= 1:
+        return [render_guide(source, image_catalog, table_data_dir)
+                for source, table_data_dir in zip(sources, table_data_dirs)]
+
+    chunksize = max(1, len(sources) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(render_guide, sources, [image_catalog] * len(sources), table_data_dirs,
+                                 chunksize=chunksize))
+
+
+def link_shared_outputs(primary_dir, site_dir, image_catalog, guide_paths):
+    """
+    Hard-link the theme-independent outputs of the primary site into another site.
+
+    Args:
+        primary_dir: Root directory of the site the shared outputs were written to
+        site_dir: Root directory of the other site
+        image_catalog: Image catalog of the primary site
+        guide_paths: Paths of the guide pages relative to the site root
+    """
+    primary_path = Path(primary_dir)
+    site_path = Path(site_dir)
+
+    shared = [get_heading_index_path(path) for path in guide_paths]
+    shared.append(Path('user-guide') / 'index.json')
+    shared.extend(path.relative_to(primary_path)
+                  for path in (primary_path / 'user-guide' / GUIDE_DETAIL_DIR).glob('*.json'))
+    shared.append(Path('user-guide') / SEARCH_INDEX_FILE)
+    shared.extend(path.relative_to(primary_path)
+                  for path in (primary_path / 'user-guide' / SEARCH_SHARD_DIR).glob('*.json'))
+    shared.extend(Path(variant[2]) for entry in image_catalog.values() for variant in entry['variants'] or [])
+
+    for relative_path in shared:
+        if (primary_path / relative_path).exists():
+            link_shared_file(primary_path / relative_path, site_path / relative_path)
+    for guide_path in guide_paths:
+        link_table_data(get_table_data_paths(primary_path / guide_path), site_path / guide_path)
+
+    # Guide details, search shards and image variants of the primary site are the only current ones
+    for directory, keep in (('user-guide/' + GUIDE_DETAIL_DIR, '*.json'), ('user-guide/' + SEARCH_SHARD_DIR, '*.json'),
+                            ('images/variants', '*')):
+        current = {path.name for path in (primary_path / directory).glob(keep)}
+        for stale_path in (site_path / directory).glob(keep):
+            if stale_path.name not in current:
+                stale_path.unlink()
+
+
+def build_themes(site_dirs, source_dir="markdown_content", force=False, jobs=1):
+    """
+    Build several sites from one pass over the markdown sources.
+
+    The first site is the primary one: theme-independent outputs are written
+    there and hard-linked into the others. Every site keeps its own build
+    manifest, so a file is only converted if it is out of date in at least
+    one site, and only written to the sites where it is.
+
+    Args:
+        site_dirs: Root directories of the sites, primary site first
+        source_dir: The directory containing markdown files
+        force: Convert every file even if the build manifests say it is unchanged
+        jobs: Number of worker processes used for conversion (0 for one per CPU core)
+    """
+    source_path = Path(source_dir)
+    if not source_path.exists():
+        print(f"Error: Source directory '{source_dir}' does not exist.")
+        return
+
+    markdown_files = list(source_path.rglob("*.md"))
+    primary_dir = site_dirs[0]
+    print(f"Found {len(markdown_files)} markdown file(s) for {len(site_dirs)} site(s).")
+    print("-" * 50)
+
+    # Images do not depend on the theme: process them once
+    image_catalog = build_image_catalog(primary_dir)
+    image_hash = get_catalog_hash(image_catalog)
+
+    sites = []
+    for site_dir in site_dirs:
+        manifest = build_asset_bundles(site_dir)
+        manifest_path = Path(site_dir) / BUILD_MANIFEST
+        previous = load_build_manifest(manifest_path)
+        settings = get_build_settings(image_hash, site_dir)
+        sites.append({
+            'dir': site_dir,
+            'assets': manifest['assets'],
+            'manifest_path': manifest_path,
+            'settings': settings,
+            'previous': get_reusable_manifest_files(previous, settings, force),
+            'files': {}
+        })
+
+    # Identical bundles (e.g. untouched scripts) are shared as well
+    primary_assets = sites[0]['assets']
+    for site in sites[1:]:
+        for name, path in site['assets'].items():
+            if path == primary_assets.get(name):
+                link_shared_file(Path(primary_dir) / path, Path(site['dir']) / path)
+
+    manifest_keys = []
+    pending = []
+    skipped = 0
+    for md_file in markdown_files:
+        relative_path = md_file.relative_to(source_path).with_suffix('.html').as_posix()
+        manifest_key = md_file.relative_to(source_path).as_posix()
+        manifest_keys.append(manifest_key)
+
+        stale_sites = []
+        for site in sites:
+            entry = get_unchanged_manifest_entry(md_file, Path(site['dir']) / relative_path,
+                                                 site['previous'].get(manifest_key))
+            if entry:
+                site['files'][manifest_key] = entry
+                skipped += 1
+            else:
+                stale_sites.append(site)
+        if stale_sites:
+            pending.append((md_file, relative_path, manifest_key, stale_sites))
+
+    # Row data of paginated tables is streamed into the primary site and linked into the others
+    results = render_guides([md_file for md_file, _, _, _ in pending], jobs, image_catalog,
+                            [(Path(primary_dir) / relative_path).parent for _, relative_path, _, _ in pending])
+
+    successful = 0
+    failed = 0
+    for (md_file, relative_path, manifest_key, stale_sites), rendered in zip(pending, results):
+        print(f"Converting: {md_file}")
+        if not rendered:
+            failed += 1
+            print("        ✗ Failed")
+            continue
+
+        primary_output_path = Path(primary_dir) / relative_path
+        remove_stale_table_data(primary_output_path, len(rendered['tables']))
+        table_paths = get_table_data_paths(primary_output_path)
+
+        heading_index = None
+        for site in stale_sites:
+            write_guide_page(rendered, relative_path, site['dir'])
+            output_file_path = Path(site['dir']) / relative_path
+            if heading_index is None:
+                write_heading_index(output_file_path, rendered['title'], rendered['slug'], rendered['headings'],
+                                    rendered['links'], rendered['images'])
+                if rendered['search']:
+                    write_guide_postings(relative_path, rendered['search'], primary_dir)
+                heading_index = get_heading_index_path(output_file_path)
+            else:
+                link_shared_file(heading_index, get_heading_index_path(output_file_path))
+            if site is not sites[0]:
+                link_table_data(table_paths, output_file_path)
+
+            guide_metadata = create_guide_metadata(rendered['title'], rendered['description'], relative_path,
+                                                   rendered['slug'], disabled=rendered['content'] is None)
+            site['files'][manifest_key] = create_manifest_entry(md_file, guide_metadata)
+            print(f"        to: {output_file_path}")
+        successful += 1
+        print("        ✓ Success")
+
+    # Index and search index, written for the primary site and shared with the others
+    primary_files = sites[0]['files']
+    guides = [(source_path / key, primary_files[key]['metadata']) for key in manifest_keys if key in primary_files]
+    if guides:
+        generate_guide_index(guides, Path(primary_dir) / 'user-guide', source_dir)
+    if pending or not (Path(primary_dir) / 'user-guide' / SEARCH_INDEX_FILE).exists():
+        build_search_index([(source_path / key, primary_files[key]['metadata']) for key in manifest_keys
+                            if key in primary_files and not primary_files[key]['metadata']['disabled']],
+                           Path(primary_dir) / 'user-guide',
+                           changed={primary_files[key]['metadata']['path'] for _, _, key, _ in pending
+                                    if key in primary_files})
+
+    guide_paths = [Path(key).with_suffix('.html') for key in manifest_keys]
+    for site in sites:
+        if site is not sites[0]:
+            link_shared_outputs(primary_dir, site['dir'], image_catalog, guide_paths)
+        resolve_page_includes(site['dir'])
+        save_build_manifest({'settings': site['settings'], 'files': site['files']}, site['manifest_path'])
+
+    print("-" * 50)
+    if skipped:
+        print(f"Skipped {skipped} unchanged page(s)")
+    print(f"Conversion complete: {successful} successful, {failed} failed, "
+          f"each converted once for {len(site_dirs)} site(s)")
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Workflow Page Pre-Rendering
+Renders the workflows, subprocesses and steps of data/workflow.json into
+nextgen.html and task.html at build time, so both pages show their content
+without waiting for the JSON in the browser. The rendered HTML fills regions
+marked <!-- workflow:NAME --> ... <!-- /workflow:NAME --> and can be
+refreshed by running the build again after the data changed.
+
+The data is also split into one fragment per workflow and one per step
+under data/workflow/; task.html only loads a step's fragment when its
+details are expanded.
+"""
+
+import json
+import re
+import sys
+from html import escape
+from pathlib import Path
+
+from convert_markdown import write_html_file
+
+# Workflow data and the fragments split from it, relative to the root directory
+WORKFLOW_DATA = 'data/workflow.json'
+WORKFLOW_FRAGMENT_DIR = 'data/workflow'
+
+# Regions of the hand-written pages filled at build time
+WORKFLOW_REGION_PATTERN = re.compile(r'(<!-- workflow:(?P<name>[\w-]+) -->).*?(<!-- /workflow:(?P=name) -->)', re.S)
+
+# Visual overview shown above the steps of a subprocess: (heading, image, alt text)
+SUBPROCESS_OVERVIEWS = {
+    'setup-database-derivation': (
+        'Workflow Setup Visual Overview',
+        './assets/workflow-setup-overview.jpg', 'Workflow setup overview'),
+    'smcubes-core-creation': (
+        'SMCubes Metadata Core Creation Visual Overview',
+        './assets/smcubes-core-creation-overview.jpg', 'SMCubes Metadata Core Creation overview'),
+    'transformation-metadata': (
+        'SMCubes Transformation Rules Creation Visual Overview',
+        './assets/smcubes-transformation-rules-overview.jpg', 'SMCubes Transformation Rules Creation overview'),
+    'python-rule-generation': (
+        'Task 3: Generate Executable Transformation Code — Visual Overview',
+        './assets/task3-executable-transformation-overview.jpg',
+        'Task 3 Generate Executable Transformation Code overview'),
+    'full-execution-test-suite': (
+        'Task 4: Full Execution with Test Suite — Visual Overview',
+        './assets/task4-full-execution-test-suite-overview.jpg', 'Task 4 Full Execution with Test Suite overview'),
+    'review-merge-governance': (
+        'Task 5: Review, Approve, Merge — Visual Overview',
+        './assets/task5-review-approve-merge-overview.jpg', 'Task 5 Review Approve Merge overview'),
+}
+
+
+def get_workflows(data):
+    """Return the workflows of the data; older files list their subprocesses at the top level."""
+    if data.get('workflows'):
+        return data['workflows']
+    return [{'id': 'default', 'title': 'Workflow', 'summary': '', 'subprocesses': data.get('subprocesses', [])}]
+
+
+def get_step_fragments(subprocess):
+    """
+    Assign a unique name to every step of a subprocess, used for its element ID and fragment file.
+
+    Returns:
+        List of (step, name) tuples; repeated step IDs get a numeric suffix
+    """
+    used = {}
+    fragments = []
+    for step in subprocess.get('steps', []):
+        count = used.get(step['id'], 0)
+        used[step['id']] = count + 1
+        fragments.append((step, step['id'] if not count else f"{step['id']}-{count}"))
+    return fragments
+
+
+def get_step_fragment_path(subprocess, name):
+    """Return the path of a step fragment relative to the root directory."""
+    return f"{WORKFLOW_FRAGMENT_DIR}/steps/{subprocess['id']}/{name}.json"
+
+
+def render_workflow_cards(data):
+    """Render the workflow cards of nextgen.html, each with its subprocess grid."""
+    parts = []
+    for workflow in get_workflows(data):
+        parts.append(f"<div class=\"workflow-card\"><h3>{escape(workflow['title'])}</h3>"
+                     f"<p>{escape(workflow.get('summary') or '')}</p>")
+        parts.append('<div class="subprocess-grid">')
+        for subprocess in workflow.get('subprocesses', []):
+            parts.append(f"<div class=\"subprocess-card\"><div><b>{escape(subprocess['title'])}</b></div>"
+                         f"<p>{escape(subprocess.get('summary') or '')}</p>"
+                         f"<a href=\"./task.html?id={escape(subprocess['id'])}\">Drill down &rarr;</a></div>")
+        parts.append('</div></div>')
+    return '\n' + '\n'.join(parts) + '\n'
+
+
+def render_subprocess_sections(data):
+    """
+    Render one hidden section per subprocess for task.html.
+
+    The page shows the section named by its ?id= parameter; the details of
+    each step are loaded from the step fragment when expanded.
+    """
+    parts = []
+    for workflow in get_workflows(data):
+        for subprocess in workflow.get('subprocesses', []):
+            parts.append(f"<section class='subprocess-section' id='subprocess-{escape(subprocess['id'])}' hidden>")
+            parts.append(f"<h1 class='page-title'>{escape(subprocess['title'])}</h1>"
+                         f"<p class='subprocess-summary'>{escape(subprocess.get('summary') or '')}</p>")
+
+            overview = SUBPROCESS_OVERVIEWS.get(subprocess['id'])
+            if overview:
+                heading, image, alt = overview
+                parts.append(f"<div class='card'><h3>{escape(heading)}</h3>"
+                             f"<img src='{image}' alt='{escape(alt)}' loading='lazy' style='max-width:100%;"
+                             f"height:auto;border-radius:8px;border:1px solid #e0e6ed'></div>")
+
+            for step, name in get_step_fragments(subprocess):
+                parts.append(f"<div class='card' id='step-{escape(name)}'><h3>{escape(step['title'])}</h3>"
+                             f"<p><b>Purpose:</b> {escape(step.get('purpose') or '')}</p>"
+                             f"<details class='step-details' data-src='./{get_step_fragment_path(subprocess, name)}'>"
+                             f"<summary>Inputs, outputs and links</summary></details></div>")
+            parts.append('</section>')
+    return '\n' + '\n'.join(parts) + '\n'
+
+
+def fill_workflow_regions(html, regions):
+    """
+    Replace the content of the marked regions of a page.
+
+    Args:
+        html: The page HTML
+        regions: Dictionary mapping region names to their HTML
+
+    Returns:
+        Page HTML with the regions filled; unknown regions are left unchanged
+    """
+    def replace_region(match):
+        if match.group('name') not in regions:
+            return match.group(0)
+        return match.group(1) + regions[match.group('name')] + match.group(3)
+
+    return WORKFLOW_REGION_PATTERN.sub(replace_region, html)
+
+
+def write_workflow_fragments(data, base_path):
+    """
+    Split the workflow data into per-workflow and per-step fragments.
+
+    Each workflow fragment lists its subprocesses with their steps' titles
+    and fragment paths; each step fragment holds the complete step. Only
+    changed fragments are rewritten and fragments of removed steps are deleted.
+
+    Args:
+        data: Parsed workflow data
+        base_path: Path of the root directory
+
+    Returns:
+        Number of fragments that were written because they were new or changed
+    """
+    fragment_dir = base_path / WORKFLOW_FRAGMENT_DIR
+    current = set()
+    written = []
+
+    def write_fragment(relative_path, content):
+        path = base_path / relative_path
+        content = json.dumps(content, indent=2, ensure_ascii=False)
+        try:
+            unchanged = path.read_bytes() == content.encode('utf-8')
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            write_html_file(path, [content])
+            written.append(path)
+        current.add(path.resolve())
+
+    for workflow in get_workflows(data):
+        subprocesses = []
+        for subprocess in workflow.get('subprocesses', []):
+            steps = []
+            for step, name in get_step_fragments(subprocess):
+                path = get_step_fragment_path(subprocess, name)
+                write_fragment(path, step)
+                steps.append({'id': step['id'], 'title': step['title'], 'path': path})
+            subprocesses.append(dict({key: value for key, value in subprocess.items() if key != 'steps'},
+                                     steps=steps))
+        write_fragment(f"{WORKFLOW_FRAGMENT_DIR}/{workflow['id']}.json",
+                       dict({key: value for key, value in workflow.items() if key != 'subprocesses'},
+                            subprocesses=subprocesses))
+
+    for stale_path in fragment_dir.rglob('*.json'):
+        if stale_path.resolve() not in current:
+            stale_path.unlink()
+    return len(written)
+
+
+def prerender_workflow_pages(base_dir="."):
+    """
+    Render data/workflow.json into nextgen.html and task.html and write its fragments.
+
+    Args:
+        base_dir: The root directory of the website
+    """
+    base_path = Path(base_dir)
+    try:
+        with open(base_path / WORKFLOW_DATA, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {base_path / WORKFLOW_DATA}: {e}")
+        return
+
+    regions = {
+        'title': escape(data.get('title') or 'BIRD nEXtGEN Workflow'),
+        'subtitle': escape(data.get('subtitle') or ''),
+        'cards': render_workflow_cards(data),
+        'subprocesses': render_subprocess_sections(data),
+    }
+    for page_name in ('nextgen.html', 'task.html'):
+        page_path = base_path / page_name
+        if not page_path.exists():
+            continue
+        # Tracked pages keep their line endings, see resolve_page_includes
+        with open(page_path, 'r', encoding='utf-8', newline='') as f:
+            html = f.read()
+        newline = '\r\n' if '\r\n' in html else '\n'
+        rendered = fill_workflow_regions(html.replace('\r\n', '\n'), regions).replace('\n', newline)
+        if rendered != html:
+            write_html_file(page_path, [rendered])
+            print(f"Rendered workflow into: {page_path}")
+
+    count = write_workflow_fragments(data, base_path)
+    if count:
+        print(f"Wrote {count} workflow fragment(s) to: {base_path / WORKFLOW_FRAGMENT_DIR}")
+
+
+def main():
+    """Pre-render the workflow pages."""
+    prerender_workflow_pages()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())